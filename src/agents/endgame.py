@@ -0,0 +1,291 @@
+import math
+import random
+from itertools import combinations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+    from src.game.player import Player
+
+from src.game.cards import card_points_table
+from src.strategies.base_strategy import BaseStrategy
+from src.strategies.descending_order_strategy import DescendingOrderStrategy
+
+MAX_PILE_LENGTH = 5
+
+# a pile is (top card number, length, points); a table is its piles sorted by top,
+# which makes it canonical: pile order never changes where a card goes
+Pile = Tuple[int, int, int]
+Table = Tuple[Pile, ...]
+
+
+def resolve_turn(
+    table: Table, cards: Sequence[int], my_card: int, points: Sequence[int]
+) -> Tuple[Table, int]:
+    """
+    Place one turn's cards in ascending order; returns the new table and the points
+    the owner of my_card collects. Unplayable cards replace the pile with the fewest
+    points (lowest top on ties), which is how the model lets opponents choose.
+    """
+    piles = list(table)
+    collected = 0
+    for card_number in sorted(cards):
+        pile_index = -1
+        for index, (top, _, _) in enumerate(piles):
+            if top < card_number:
+                pile_index = index
+            else:
+                break
+        top, length, pile_points = piles[pile_index] if pile_index >= 0 else (0, 0, 0)
+        if pile_index < 0 or length == MAX_PILE_LENGTH:
+            if pile_index < 0:
+                pile_index = min(range(len(piles)), key=lambda index: piles[index][2])
+                pile_points = piles[pile_index][2]
+            if card_number == my_card:
+                collected += pile_points
+            piles[pile_index] = (card_number, 1, points[card_number])
+        else:
+            piles[pile_index] = (card_number, length + 1, pile_points + points[card_number])
+        piles.sort()
+    return tuple(piles), collected
+
+
+class EndgameSolver:
+    """
+    Expectimax over the last turns of a round: we pick the card with the lowest
+    expected points collected until the round ends, and every opponent plays a
+    uniformly random card from the cards we have not seen.
+
+    Chance nodes list every combination of opponent cards when there are at most
+    max_branching of them, and otherwise use `samples` combinations drawn with a seed
+    derived from the node, the same for every card we compare. Values are memoized
+    on (table, hand, unseen cards, opponents) in a transposition table.
+    """
+
+    def __init__(
+        self,
+        max_branching: int = 128,
+        samples: int = 32,
+        max_card: int = 103,
+        max_memo_entries: int = 1_000_000,
+        seed: int = 0,
+    ):
+        self.max_branching: int = max_branching
+        self.samples: int = samples
+        self.max_card: int = max_card
+        self.max_memo_entries: int = max_memo_entries
+        self.seed: int = seed
+        self.points: Tuple[int, ...] = card_points_table(max_card)
+        self.memo: Dict[Tuple[Table, Tuple[int, ...], int, int], float] = {}
+        self.nodes: int = 0
+
+    @staticmethod
+    def table_from_state(game_state: Dict[str, Any]) -> Table:
+        return tuple(
+            sorted(
+                (pile[-1].card_number, len(pile), pile_points)
+                for pile, pile_points in zip(
+                    game_state["piles"], game_state["points_per_pile"], strict=True
+                )
+            )
+        )
+
+    def unseen_mask(self, game_state: Dict[str, Any], known: Sequence[int]) -> int:
+        # cards in the deck range that are neither on a pile this round nor known to us
+        mask = ((1 << (self.max_card + 1)) - 2) & ~game_state["seen_cards_mask"]
+        for card_number in known:
+            mask &= ~(1 << card_number)
+        return mask
+
+    def branching(self, unseen_count: int, opponents: int) -> int:
+        outcomes = math.comb(unseen_count, opponents)
+        return outcomes if outcomes <= self.max_branching else self.samples
+
+    def estimated_work(self, unseen_count: int, opponents: int, cards_left: int) -> int:
+        # resolved turns for a full search: every card we may play times every outcome
+        work, total = 1, 0
+        for cards in range(cards_left, 0, -1):
+            work *= cards * self.branching(unseen_count, opponents)
+            total += work
+            unseen_count -= opponents
+        return total
+
+    def _outcomes(
+        self, unseen: int, opponents: int, node_key: Tuple, below: Optional[int] = None
+    ) -> List[Tuple[int, ...]]:
+        # the opponents' cards, drawn from the unseen cards lower than `below` if given
+        end = self.max_card + 1 if below is None else below
+        cards = [card_number for card_number in range(1, end) if unseen >> card_number & 1]
+        if math.comb(len(cards), opponents) <= self.max_branching:
+            return list(combinations(cards, opponents))
+        rng = random.Random(hash((self.seed, node_key)))
+        return [tuple(rng.sample(cards, opponents)) for _ in range(self.samples)]
+
+    def value(
+        self, table: Table, hand: Tuple[int, ...], unseen: int, opponents: int
+    ) -> float:
+        # expected points we collect from this turn to the end of the round
+        if not hand:
+            return 0.0
+        key = (table, hand, unseen, opponents)
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached
+        if len(hand) == 1:
+            value = self.last_card_value(table, hand[0], unseen, opponents)
+        else:
+            value = min(self.card_values(table, hand, unseen, opponents).values())
+        if len(self.memo) >= self.max_memo_entries:
+            self.memo.clear()
+        self.memo[key] = value
+        return value
+
+    def card_values(
+        self, table: Table, hand: Tuple[int, ...], unseen: int, opponents: int
+    ) -> Dict[int, float]:
+        self.nodes += 1
+        outcomes = self._outcomes(unseen, opponents, (table, hand, unseen, opponents))
+        values = {}
+        for my_card in hand:
+            rest = tuple(card_number for card_number in hand if card_number != my_card)
+            total = 0.0
+            for opponent_cards in outcomes:
+                next_table, collected = resolve_turn(
+                    table, opponent_cards + (my_card,), my_card, self.points
+                )
+                remaining = unseen
+                for card_number in opponent_cards:
+                    remaining &= ~(1 << card_number)
+                total += collected + self.value(next_table, rest, remaining, opponents)
+            values[my_card] = total / len(outcomes)
+        return values
+
+    def last_card_value(
+        self, table: Table, my_card: int, unseen: int, opponents: int
+    ) -> float:
+        """
+        The expected points of the round's last turn. Only opponent cards below ours
+        are placed before it, so this sums over how many of them are lower, which is
+        hypergeometric, and only lists (or samples) those lower cards.
+        """
+        self.nodes += 1
+        unseen_count = unseen.bit_count()
+        lower_count = (unseen & ((1 << my_card) - 1)).bit_count()
+        outcomes_total = math.comb(unseen_count, opponents)
+        value = 0.0
+        for lower in range(min(opponents, lower_count) + 1):
+            weight = (
+                math.comb(lower_count, lower)
+                * math.comb(unseen_count - lower_count, opponents - lower)
+                / outcomes_total
+            )
+            if not weight:
+                continue
+            outcomes = self._outcomes(
+                unseen, lower, (table, my_card, unseen, opponents), below=my_card
+            )
+            collected = sum(
+                resolve_turn(table, opponent_cards + (my_card,), my_card, self.points)[1]
+                for opponent_cards in outcomes
+            )
+            value += weight * collected / len(outcomes)
+        return value
+
+    def pile_values(
+        self,
+        table: Table,
+        hand: Tuple[int, ...],
+        unseen: int,
+        opponents: int,
+        my_card: int,
+        later_cards: Sequence[int],
+    ) -> Dict[int, float]:
+        # keyed by position in `table`: take that pile, let the rest of this turn's
+        # known cards resolve, then play the remaining turns
+        values = {}
+        for pile_index, (_, _, pile_points) in enumerate(table):
+            piles = list(table)
+            piles[pile_index] = (my_card, 1, self.points[my_card])
+            next_table, _ = resolve_turn(tuple(sorted(piles)), later_cards, -1, self.points)
+            values[pile_index] = pile_points + self.value(next_table, hand, unseen, opponents)
+        return values
+
+
+class EndgameStrategy(BaseStrategy):
+    """
+    Plays like `fallback` until at most cards_left_threshold cards are left in hand,
+    then with EndgameSolver, unless the estimated search exceeds max_work turns.
+    """
+
+    def __init__(
+        self,
+        fallback: Optional[BaseStrategy] = None,
+        cards_left_threshold: int = 2,
+        max_work: int = 50_000,
+        solver: Optional[EndgameSolver] = None,
+    ):
+        self.fallback = fallback if fallback is not None else DescendingOrderStrategy()
+        self.cards_left_threshold = cards_left_threshold
+        self.max_work = max_work
+        self.solver = solver if solver is not None else EndgameSolver()
+        self.solved_decisions = 0
+        self.fallback_decisions = 0
+
+    def _set_player(self, player: "Player") -> None:
+        super()._set_player(player)
+        self.fallback._set_player(player)
+
+    def update(
+        self,
+        state: Dict[str, Any],
+        action: Tuple[int, int],
+        reward: float,
+        next_state: Dict[str, Any],
+        possible_actions: List["Card"],
+    ) -> None:
+        # the fallback plays most of the round, a learning one keeps learning from it
+        self.fallback.update(state, action, reward, next_state, possible_actions)
+
+    @property
+    def learns(self) -> bool:
+        return self.fallback.learns
+
+    def _solvable(self, unseen: int, opponents: int, cards_left: int) -> bool:
+        if cards_left > self.cards_left_threshold:
+            return False
+        work = self.solver.estimated_work(unseen.bit_count(), opponents, cards_left)
+        return work <= self.max_work
+
+    def choose_card_to_play(self, game_state: Dict[str, Any]) -> "Card":
+        hand = tuple(self.player.hand)
+        opponents = game_state["total_players"] - 1
+        unseen = self.solver.unseen_mask(game_state, hand)
+        if len(hand) == 1 or not self._solvable(unseen, opponents, len(hand)):
+            self.fallback_decisions += 1
+            return self.fallback.choose_card_to_play(game_state)
+        self.solved_decisions += 1
+        table = self.solver.table_from_state(game_state)
+        values = self.solver.card_values(table, hand, unseen, opponents)
+        return self.player.hand[min(values, key=values.get)]
+
+    def choose_pile_to_replace(self, game_state: Dict[str, Any]) -> int:
+        hand = tuple(self.player.hand)
+        opponents = game_state["total_players"] - 1
+        # only the lowest card of a turn can be below every pile, so it is ours
+        played = sorted(card.card_number for card in game_state["cards_played"])
+        unseen = self.solver.unseen_mask(game_state, hand + tuple(played))
+        if not self._solvable(unseen, opponents, len(hand)):
+            self.fallback_decisions += 1
+            return self.fallback.choose_pile_to_replace(game_state)
+        self.solved_decisions += 1
+        table = self.solver.table_from_state(game_state)
+        values = self.solver.pile_values(
+            table, hand, unseen, opponents, played[0], played[1:]
+        )
+        best_top = table[min(values, key=values.get)][0]
+        # map the canonical (sorted) pile back to its index in the game
+        return next(
+            pile_index
+            for pile_index, card in enumerate(game_state["last_cards_per_pile"])
+            if card.card_number == best_top
+        )
@@ -0,0 +1,278 @@
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+
+from src.game.cards import card_points_table
+from src.strategies.base_strategy import BaseStrategy
+
+MAX_PILE_LENGTH = 5
+
+
+class _Table:
+    """
+    The piles of the internal simulator as three parallel int lists: top card number,
+    length and points per pile. Card objects are never used inside the search.
+    """
+
+    __slots__ = ("tops", "lengths", "points")
+
+    def __init__(self, tops: List[int], lengths: List[int], points: List[int]):
+        self.tops: List[int] = tops
+        self.lengths: List[int] = lengths
+        self.points: List[int] = points
+
+    def copy(self) -> "_Table":
+        return _Table(self.tops[:], self.lengths[:], self.points[:])
+
+    def restart(self, pile_index: int, card_number: int, card_points: int) -> int:
+        taken = self.points[pile_index]
+        self.tops[pile_index] = card_number
+        self.lengths[pile_index] = 1
+        self.points[pile_index] = card_points
+        return taken
+
+    def place(self, card_number: int, card_points: int) -> int:
+        # returns the points the player collects; an unplayable card replaces the
+        # pile with the fewest points
+        tops = self.tops
+        pile_index, best_top = -1, 0
+        for index in range(len(tops)):
+            top = tops[index]
+            if best_top < top < card_number:
+                pile_index, best_top = index, top
+        if pile_index < 0:
+            points = self.points
+            return self.restart(points.index(min(points)), card_number, card_points)
+        if self.lengths[pile_index] == MAX_PILE_LENGTH:
+            return self.restart(pile_index, card_number, card_points)
+        self.tops[pile_index] = card_number
+        self.lengths[pile_index] += 1
+        self.points[pile_index] += card_points
+        return 0
+
+
+class _Node:
+    """
+    Open-loop node: statistics of our card choices after a fixed sequence of our
+    earlier choices, pooled over every sampled deal and opponent reply.
+    """
+
+    __slots__ = ("visits", "action_visits", "action_totals", "children")
+
+    def __init__(self):
+        self.visits: int = 0
+        self.action_visits: Dict[int, int] = {}
+        self.action_totals: Dict[int, float] = {}
+        self.children: Dict[int, _Node] = {}
+
+    def select(self, actions: Sequence[int], exploration: float) -> int:
+        untried = [action for action in actions if action not in self.action_visits]
+        if untried:
+            return untried[0]
+        log_visits = math.log(self.visits)
+        return max(
+            actions,
+            key=lambda action: (
+                self.action_totals[action] / self.action_visits[action]
+                + exploration * math.sqrt(log_visits / self.action_visits[action])
+            ),
+        )
+
+    def best_action(self, actions: Sequence[int]) -> int:
+        # the most visited action is the most robust choice
+        return max(actions, key=lambda action: self.action_visits.get(action, 0))
+
+
+class ISMCTSStrategy(BaseStrategy):
+    """
+    Information-set Monte Carlo tree search. Every iteration deals the opponents' hidden
+    hands from the cards not seen this round, descends the tree of our own choices
+    with UCB1, and plays the rest of the round out with random cards on the internal
+    simulator. The reward is minus the points we collect for the rest of the round.
+
+    The search stops after `iterations` iterations or `time_limit` seconds, whichever
+    comes first. The subtree under the card we played is kept for the next turn.
+    """
+
+    def __init__(
+        self,
+        iterations: int = 1000,
+        time_limit: Optional[float] = None,
+        exploration: float = 0.7,
+        max_card: int = 103,
+        reuse_tree: bool = True,
+        seed: Optional[int] = None,
+    ):
+        self.iterations = iterations
+        self.time_limit = time_limit
+        # rewards are divided by reward_scale so the exploration constant stays near 1
+        self.exploration = exploration
+        self.reward_scale = 10.0
+        self.max_card = max_card
+        self.reuse_tree = reuse_tree
+        self.rng = random.Random(seed)
+        self.points = card_points_table(max_card)
+        self.total_rollouts = 0
+        self.total_search_seconds = 0.0
+        self.last_rollouts = 0
+        self.last_search_seconds = 0.0
+        self._root: Optional[_Node] = None
+        self._root_turn: Optional[Tuple[int, int]] = None
+
+    @property
+    def rollouts_per_sec(self) -> float:
+        if not self.total_search_seconds:
+            return 0.0
+        return self.total_rollouts / self.total_search_seconds
+
+    def _table(self, game_state: Dict[str, Any]) -> _Table:
+        return _Table(
+            [card.card_number for card in game_state["last_cards_per_pile"]],
+            [len(pile) for pile in game_state["piles"]],
+            list(game_state["points_per_pile"]),
+        )
+
+    def _unseen(self, game_state: Dict[str, Any], known: Sequence[int]) -> List[int]:
+        # every card not on a pile this round, not in our hand and not otherwise known
+        seen_mask = game_state["seen_cards_mask"]
+        for card_number in known:
+            seen_mask |= 1 << card_number
+        return [
+            card_number
+            for card_number in range(1, self.max_card + 1)
+            if not seen_mask >> card_number & 1
+        ]
+
+    def _deal(self, unseen: List[int], opponents: int, cards_each: int) -> List[List[int]]:
+        self.rng.shuffle(unseen)
+        return [
+            unseen[index * cards_each : (index + 1) * cards_each]
+            for index in range(opponents)
+        ]
+
+    def _play_turn(self, table: _Table, my_card: int, opponent_hands: List[List[int]]) -> int:
+        # one simultaneous turn with random opponent cards; returns our points
+        points = self.points
+        turn = [(my_card, True)]
+        for hand in opponent_hands:
+            turn.append((hand.pop(self.rng.randrange(len(hand))), False))
+        turn.sort()
+        collected = 0
+        for card_number, is_mine in turn:
+            taken = table.place(card_number, points[card_number])
+            if is_mine:
+                collected += taken
+        return collected
+
+    def _rollout(
+        self, table: _Table, my_hand: List[int], opponent_hands: List[List[int]]
+    ) -> int:
+        collected = 0
+        while my_hand:
+            my_card = my_hand.pop(self.rng.randrange(len(my_hand)))
+            collected += self._play_turn(table, my_card, opponent_hands)
+        return collected
+
+    def _iterate(
+        self, root: _Node, table: _Table, hand: List[int], unseen: List[int], opponents: int
+    ) -> None:
+        table = table.copy()
+        my_hand = hand[:]
+        opponent_hands = self._deal(unseen, opponents, len(my_hand))
+        node, path, collected = root, [], 0
+        while my_hand:
+            action = node.select(my_hand, self.exploration)
+            my_hand.remove(action)
+            collected += self._play_turn(table, action, opponent_hands)
+            path.append((node, action))
+            child = node.children.get(action)
+            if child is None:
+                node.children[action] = _Node()
+                break
+            node = child
+        collected += self._rollout(table, my_hand, opponent_hands)
+
+        reward = -collected / self.reward_scale
+        for visited, action in path:
+            visited.visits += 1
+            visited.action_visits[action] = visited.action_visits.get(action, 0) + 1
+            visited.action_totals[action] = visited.action_totals.get(action, 0.0) + reward
+
+    def _search(self, run_iteration: Callable[[], None], budget: int) -> None:
+        start = time.perf_counter()
+        deadline = start + self.time_limit if self.time_limit is not None else math.inf
+        rollouts = 0
+        while rollouts < budget and (rollouts == 0 or time.perf_counter() < deadline):
+            run_iteration()
+            rollouts += 1
+        elapsed = time.perf_counter() - start
+        self.last_rollouts, self.last_search_seconds = rollouts, elapsed
+        self.total_rollouts += rollouts
+        self.total_search_seconds += elapsed
+
+    def _root_for(self, game_state: Dict[str, Any]) -> _Node:
+        turn = (game_state["current_round_number"], game_state["current_turn_number"])
+        if (
+            self.reuse_tree
+            and self._root is not None
+            and self._root_turn == (turn[0], turn[1] - 1)
+        ):
+            return self._root
+        return _Node()
+
+    def choose_card_to_play(self, game_state: Dict[str, Any]) -> "Card":
+        hand = list(self.player.hand)
+        if len(hand) == 1:
+            self._root = None
+            return self.player.hand[hand[0]]
+        table = self._table(game_state)
+        unseen = self._unseen(game_state, hand)
+        opponents = game_state["total_players"] - 1
+        root = self._root_for(game_state)
+
+        self._search(
+            lambda: self._iterate(root, table, hand, unseen, opponents), self.iterations
+        )
+
+        card_number = root.best_action(hand)
+        self._root = root.children.get(card_number)
+        self._root_turn = (
+            game_state["current_round_number"],
+            game_state["current_turn_number"],
+        )
+        return self.player.hand[card_number]
+
+    def choose_pile_to_replace(self, game_state: Dict[str, Any]) -> int:
+        # flat Monte Carlo over the piles: take pile k, resolve the rest of this turn's
+        # known cards, then play out the round on sampled hands
+        table = self._table(game_state)
+        piles = len(table.tops)
+        # only the lowest card of a turn can be below every pile, so it is ours
+        played = sorted(card.card_number for card in game_state["cards_played"])
+        my_card, later_cards = played[0], played[1:]
+        hand = list(self.player.hand)
+        unseen = self._unseen(game_state, hand + played)
+        opponents = game_state["total_players"] - 1
+        totals = [0.0] * piles
+        visits = [0] * piles
+
+        def run_iteration() -> None:
+            pile_index = sum(visits) % piles
+            simulated = table.copy()
+            collected = simulated.restart(pile_index, my_card, self.points[my_card])
+            for card_number in later_cards:
+                simulated.place(card_number, self.points[card_number])
+            opponent_hands = self._deal(unseen, opponents, len(hand))
+            collected += self._rollout(simulated, hand[:], opponent_hands)
+            totals[pile_index] += collected
+            visits[pile_index] += 1
+
+        self._search(run_iteration, max(piles, self.iterations))
+        return min(
+            range(piles),
+            key=lambda index: totals[index] / visits[index] if visits[index] else math.inf,
+        )
@@ -0,0 +1,188 @@
+import random
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+
+from src.strategies.card_tracker import CardTracker
+from src.strategies.descending_order_strategy import DescendingOrderStrategy
+
+# one row of features per card in hand, each scaled to roughly [0, 1]
+FEATURE_NAMES = (
+    "bias",
+    "card",
+    "gap_to_top",
+    "take_probability",
+    "expected_points",
+    "replace_points",
+    "stranded_cards",
+    "rest_mean",
+    "turn",
+)
+FEATURE_COUNT = len(FEATURE_NAMES)
+COLUMN = {name: index for index, name in enumerate(FEATURE_NAMES)}
+POINTS_SCALE = 10.0
+
+
+class LinearQStrategy(DescendingOrderStrategy):
+    """
+    Q(state, card) = weights · features(state, card), over the few hand-crafted
+    features in FEATURE_NAMES instead of a table entry per state, so what is learned
+    about one table carries over to every similar one and memory stays constant.
+
+    Transitions are collected in preallocated arrays and learned from batch_size at
+    a time with one vectorized semi-gradient Q-learning step, and from whatever is
+    left at the end of every game. The reward is minus the points taken in the turn.
+    Replaces piles like DescendingOrderStrategy.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        gamma: float = 0.5,
+        epsilon: float = 0.1,
+        batch_size: int = 64,
+        max_card: int = 103,
+    ):
+        self.alpha: float = alpha
+        self.gamma: float = gamma
+        self.epsilon: float = epsilon
+        self.batch_size: int = batch_size
+        self.weights: np.ndarray = np.zeros(FEATURE_COUNT)
+        # start out playing like RiskAwareStrategy: fewest expected points this turn
+        self.weights[COLUMN["expected_points"]] = -1.0
+        self.weights[COLUMN["replace_points"]] = -1.0
+        self.tracker: CardTracker = CardTracker(max_card)
+        self.updates: int = 0
+
+        self._features: np.ndarray = np.zeros((batch_size, FEATURE_COUNT))
+        self._rewards: np.ndarray = np.zeros(batch_size)
+        # room for the next hand's features; grown to the cards per player of the game
+        self._next_features: np.ndarray = np.zeros((batch_size, 0, FEATURE_COUNT))
+        # which rows of _next_features are cards in the next hand
+        self._next_actions: np.ndarray = np.zeros((batch_size, 0), dtype=bool)
+        self._pending: int = 0
+
+    def save_checkpoint(self, path: str) -> None:
+        self.learn()
+        np.save(path, self.weights)
+
+    @classmethod
+    def from_checkpoint(cls, path: str, epsilon: float = 0.0) -> "LinearQStrategy":
+        strategy = cls(epsilon=epsilon)
+        strategy.weights = np.load(path)
+        return strategy
+
+    def _reserve(self, hand_size: int) -> None:
+        # widen the next-hand buffers, keeping the pending transitions
+        if hand_size <= self._next_actions.shape[1]:
+            return
+        extra = hand_size - self._next_actions.shape[1]
+        self._next_features = np.pad(self._next_features, ((0, 0), (0, extra), (0, 0)))
+        self._next_actions = np.pad(self._next_actions, ((0, 0), (0, extra)))
+
+    def features(
+        self, game_state: Dict[str, Any], hand: Iterable[int]
+    ) -> Tuple[List[int], np.ndarray]:
+        # the hand, sorted, and one feature row per card in it
+        hand = sorted(hand)
+        tracker = self.tracker
+        tracker.observe(game_state, hand)
+        max_card = game_state["max_card"]
+        tops = [card.card_number for card in game_state["last_cards_per_pile"]]
+        lowest_top = min(tops)
+        turn = game_state["current_turn_number"] / max(1, game_state["cards_per_player"])
+        features = np.zeros((len(hand), FEATURE_COUNT))
+        features[:, COLUMN["bias"]] = 1.0
+        features[:, COLUMN["card"]] = np.array(hand) / max_card
+        features[:, COLUMN["turn"]] = turn
+        for row, card_number in enumerate(hand):
+            risk = tracker.pile_risk(game_state, card_number)
+            if risk.pile_index is None:
+                # replacing a pile makes this card the lowest top
+                features[row, COLUMN["replace_points"]] = risk.expected_points / POINTS_SCALE
+                new_lowest = card_number
+            else:
+                features[row, COLUMN["gap_to_top"]] = (
+                    card_number - tops[risk.pile_index]
+                ) / max_card
+                features[row, COLUMN["take_probability"]] = risk.take_probability
+                features[row, COLUMN["expected_points"]] = risk.expected_points / POINTS_SCALE
+                new_lowest = lowest_top
+                if tops[risk.pile_index] == lowest_top:
+                    new_lowest = min(card_number, *(top for top in tops if top != lowest_top))
+            # the cards left in hand that could only replace a pile next turn
+            features[row, COLUMN["stranded_cards"]] = sum(
+                other < new_lowest for other in hand if other != card_number
+            )
+        rest = len(hand) - 1
+        features[:, COLUMN["stranded_cards"]] /= max(1, rest)
+        if rest:
+            features[:, COLUMN["rest_mean"]] = (sum(hand) - np.array(hand)) / (
+                rest * max_card
+            )
+        return hand, features
+
+    def choose_card_to_play(self, game_state: Dict[str, Any]) -> "Card":
+        hand = self.player.hand
+        if random.random() < self.epsilon:
+            return random.choice(list(hand.values()))
+        card_numbers, features = self.features(game_state, hand)
+        return hand[card_numbers[int(np.argmax(features @ self.weights))]]
+
+    def update(
+        self,
+        state: Dict[str, Any],
+        action: Tuple[int, int],
+        reward: float,
+        next_state: Dict[str, Any],
+        possible_actions: List["Card"],
+    ) -> None:
+        card_number, _ = action
+        self._reserve(state["cards_per_player"])
+        row = self._pending
+        hand, features = self.features(state, (number for number, _ in state["player_hand"]))
+        self._features[row] = features[hand.index(card_number)]
+
+        self._rewards[row] = reward
+
+        next_actions = self._next_actions[row]
+        next_actions[:] = False
+        if possible_actions:
+            _, next_features = self.features(
+                next_state, (card.card_number for card in possible_actions)
+            )
+            self._next_features[row, : len(next_features)] = next_features
+            next_actions[: len(next_features)] = True
+
+        self._pending += 1
+        last_turn_of_game = (
+            not possible_actions
+            and state["current_round_number"] == state["total_rounds"] - 1
+        )
+        if self._pending == self.batch_size or last_turn_of_game:
+            self.learn()
+
+    def learn(self) -> None:
+        """
+        One semi-gradient Q-learning step over the pending transitions, averaged, with
+        the targets computed from the current weights. Runs by itself when the buffer
+        is full, at the end of a game and before a checkpoint is saved; call it to
+        flush the buffer at any other time.
+        """
+        size = self._pending
+        if not size:
+            return
+        features = self._features[:size]
+        next_actions = self._next_actions[:size]
+        next_values = np.where(
+            next_actions, self._next_features[:size] @ self.weights, -np.inf
+        )
+        # the last turn of a round has no next card
+        future = np.where(next_actions.any(axis=1), next_values.max(axis=1), 0.0)
+        errors = self._rewards[:size] + self.gamma * future - features @ self.weights
+        self.weights += self.alpha * (errors @ features) / size
+        self.updates += 1
+        self._pending = 0
@@ -1,27 +1,77 @@
+import os
 import random
 
+import numpy as np
+
+from src.agents.q_table import (
+    PILE_ACTION_OFFSET,
+    QTable,
+    best_action,
+    pack_state,
+    pack_states,
+    with_actions,
+)
+from src.game.batch import BatchGame
 from src.strategies.base_strategy import BaseStrategy
+from src.strategies.batch_protocol import random_cards_in_hands
+
+# memory-mapped checkpoints already opened by this process, keyed by path and file
+# version, so every evaluation player in a worker probes the same mapped pages
+_SHARED_Q_TABLES = {}
 
 
 class QLearningStrategy(BaseStrategy):
-    def __init__(self):
-        self.q_table = {}  # (state, action) → value
-        self.epsilon = 0.1  # exploration
-        self.alpha = 0.1  # learning rate
-        self.gamma = 0.99  # discount
+    def __init__(self, max_q_entries=1_000_000, epsilon=0.1, alpha=0.1, gamma=0.99):
+        self.q_table = QTable(max_entries=max_q_entries)  # (packed state, action) → value
+        self.epsilon = epsilon  # exploration
+        self.alpha = alpha  # learning rate
+        self.gamma = gamma  # discount
+
+    def save_checkpoint(self, path):
+        self.q_table.save(path)
+
+    @classmethod
+    def from_checkpoint(cls, path, mmap=True, epsilon=0.0):
+        # evaluation player: greedy by default, and with mmap=True the table is shared
+        # read-only with every other process that opens the same checkpoint
+        strategy = cls(epsilon=epsilon)
+        if mmap:
+            file_stat = os.stat(path)
+            key = (os.path.abspath(path), file_stat.st_mtime_ns, file_stat.st_size)
+            if key not in _SHARED_Q_TABLES:
+                _SHARED_Q_TABLES[key] = QTable.load(path, mmap=True)
+            strategy.q_table = _SHARED_Q_TABLES[key]
+        else:
+            strategy.q_table = QTable.load(path, mmap=False)
+        return strategy
 
     def update(self, state, action, reward, next_state, possible_actions):
-        old = self.q_table.get((state, action), 0)
-        future = max(self.q_table.get((next_state, a), 0) for a in possible_actions)
-        self.q_table[(state, action)] = old + self.alpha * (
-            reward + self.gamma * future - old
+        if self.q_table.read_only:
+            return
+        state = self.encode_personalised_state(state)
+        next_state = self.encode_personalised_state(next_state)
+        card_number, _ = action
+        old = self.q_table.get(state, card_number)
+        future = max(
+            (self.q_table.get(next_state, a.card_number) for a in possible_actions),
+            default=0,
+        )
+        self.q_table.set(
+            state, card_number, old + self.alpha * (reward + self.gamma * future - old)
         )
 
     @staticmethod
     def encode_state(game_state, hand):
-        last_cards = tuple(card.card_number for card in game_state["last_cards_per_pile"])
-        hand_cards = tuple(sorted(card.card_number for card in hand.values()))
-        return (last_cards, hand_cards)
+        # hand bitmask plus pile tops, see src.agents.q_table.pack_state
+        last_cards = (card.card_number for card in game_state["last_cards_per_pile"])
+        return pack_state(last_cards, hand)
+
+    @staticmethod
+    def encode_personalised_state(game_state):
+        # same key as encode_state, built from the "player_hand" entry the game adds
+        last_cards = (card.card_number for card in game_state["last_cards_per_pile"])
+        hand_cards = (card_number for card_number, _ in game_state["player_hand"])
+        return pack_state(last_cards, hand_cards)
 
     def choose_card_to_play(self, game_state):
         state = self.encode_state(game_state, self.player.hand)
@@ -30,13 +80,7 @@ class QLearningStrategy(BaseStrategy):
             return random.choice(list(self.player.hand.values()))
 
         # exploit
-        q_values = {}
-        for card in self.player.hand.values():
-            action = card.card_number
-            q_values[action] = self.q_table.get((state, action), 0)
-
-        best_action = max(q_values, key=q_values.get)
-        return self.player.hand[best_action]
+        return self.player.hand[best_action(self.q_table, state, self.player.hand)]
 
     def choose_pile_to_replace(self, game_state):
         state = self.encode_state(game_state, self.player.hand)
@@ -45,10 +89,38 @@ class QLearningStrategy(BaseStrategy):
             return random.randint(0, len(game_state["piles"]) - 1)
 
         # exploit
-        q_values = {}
-        for pile_index in range(len(game_state["piles"])):
-            action = pile_index
-            q_values[action] = self.q_table.get((state, action), 0)
+        pile_actions = range(
+            PILE_ACTION_OFFSET, PILE_ACTION_OFFSET + len(game_state["piles"])
+        )
+        return best_action(self.q_table, state, pile_actions) - PILE_ACTION_OFFSET
 
-        best_action = max(q_values, key=q_values.get)
-        return best_action
+    def choose_cards_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray
+    ) -> np.ndarray:
+        # the same choice as choose_card_to_play for every (game, seat), with one table
+        # probe pass for all of them
+        hands = batch.hands[games, seats]
+        values = self.q_table.get_many(
+            with_actions(pack_states(batch.pile_tops[games], hands), hands)
+        )
+        values[hands == 0] = -np.inf
+        chosen = np.take_along_axis(hands, values.argmax(axis=1)[:, None], axis=1)[:, 0]
+        if self.epsilon > 0:
+            # the batch generator also shuffles the decks, a greedy player leaves it alone
+            explore = batch.rng.random(len(games)) < self.epsilon
+            chosen[explore] = random_cards_in_hands(batch, hands[explore])
+        return chosen
+
+    def choose_piles_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray:
+        piles = batch.amount_of_piles
+        actions = np.broadcast_to(
+            np.arange(PILE_ACTION_OFFSET, PILE_ACTION_OFFSET + piles), (len(games), piles)
+        )
+        states = pack_states(batch.pile_tops[games], batch.hands[games, seats])
+        chosen = self.q_table.get_many(with_actions(states, actions)).argmax(axis=1)
+        if self.epsilon > 0:
+            explore = batch.rng.random(len(games)) < self.epsilon
+            chosen[explore] = batch.rng.integers(0, piles, int(explore.sum()))
+        return chosen
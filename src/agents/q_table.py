@@ -0,0 +1,394 @@
+import os
+import struct
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# a packed state is three 64 bit words: the hand as a bitmask over card numbers
+# (bits 0-63 and 64-127) and the pile tops, 7 bits per pile for up to 8 piles.
+# The action is stored in the top 8 bits of the third word.
+PackedState = Tuple[int, int, int]
+
+MAX_CARD_NUMBER = 127
+MAX_PILES = 8
+TOP_BITS = 7
+ACTION_SHIFT = MAX_PILES * TOP_BITS
+# pile replacement actions are kept apart from card actions in the same key space
+PILE_ACTION_OFFSET = 128
+
+_MASK64 = (1 << 64) - 1
+_MAX_VISITS = np.iinfo(np.uint32).max
+
+# checkpoint layout: a 64 byte header, then the keys, values and visit arrays exactly
+# as they sit in memory, so a checkpoint can be memory-mapped and probed in place
+CHECKPOINT_MAGIC = b"T5QTABLE"
+CHECKPOINT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQd")
+_HEADER_SIZE = 64
+_HASH_MULTIPLIERS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F)
+
+
+def pack_state(pile_tops: Iterable[int], hand: Iterable[int]) -> PackedState:
+    hand_mask = 0
+    for card_number in hand:
+        hand_mask |= 1 << card_number
+    tops = 0
+    for pile_index, card_number in enumerate(pile_tops):
+        tops |= card_number << (pile_index * TOP_BITS)
+    if hand_mask >> (MAX_CARD_NUMBER + 1) or tops >> ACTION_SHIFT:
+        raise ValueError(
+            f"Q-table keys hold cards up to {MAX_CARD_NUMBER} and at most {MAX_PILES} piles."
+        )
+    return (hand_mask & _MASK64, hand_mask >> 64, tops)
+
+
+def pack_states(pile_tops: np.ndarray, hands: np.ndarray) -> np.ndarray:
+    # pack_state for rows of pile tops and rows of hand card numbers (0 = no card),
+    # as a (rows, 3) uint64 array
+    if hands.max(initial=0) > MAX_CARD_NUMBER or pile_tops.shape[1] > MAX_PILES:
+        raise ValueError(
+            f"Q-table keys hold cards up to {MAX_CARD_NUMBER} and at most {MAX_PILES} piles."
+        )
+    hands = hands.astype(np.uint64)
+    bits = np.left_shift(np.uint64(1), hands % np.uint64(64))
+    zero = np.uint64(0)
+    states = np.empty((len(hands), 3), dtype=np.uint64)
+    states[:, 0] = np.bitwise_or.reduce(
+        np.where((hands > 0) & (hands < 64), bits, zero), axis=1
+    )
+    states[:, 1] = np.bitwise_or.reduce(np.where(hands >= 64, bits, zero), axis=1)
+    shifts = np.arange(pile_tops.shape[1], dtype=np.uint64) * np.uint64(TOP_BITS)
+    states[:, 2] = np.bitwise_or.reduce(pile_tops.astype(np.uint64) << shifts, axis=1)
+    return states
+
+
+def with_actions(states: np.ndarray, actions: np.ndarray) -> np.ndarray:
+    # (rows, actions, 3) keys: every state row combined with its row of actions
+    keys = np.repeat(states[:, None, :], actions.shape[1], axis=1)
+    keys[:, :, 2] |= actions.astype(np.uint64) << np.uint64(ACTION_SHIFT)
+    return keys
+
+
+def _hash(word_0: int, word_1: int, word_2: int) -> int:
+    # splitmix64 finalizer over the combined words; sparse bitmasks need the mixing
+    value = (
+        word_0 ^ (word_1 * _HASH_MULTIPLIERS[0]) ^ (word_2 * _HASH_MULTIPLIERS[1])
+    ) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _hash_many(keys: np.ndarray) -> np.ndarray:
+    # _hash over rows of keys; uint64 arithmetic wraps like the masked Python version
+    value = (
+        keys[:, 0]
+        ^ (keys[:, 1] * np.uint64(_HASH_MULTIPLIERS[0]))
+        ^ (keys[:, 2] * np.uint64(_HASH_MULTIPLIERS[1]))
+    )
+    value = (value ^ (value >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    value = (value ^ (value >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return value ^ (value >> np.uint64(31))
+
+
+class QTableStats(NamedTuple):
+    size: int
+    capacity: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+    memory_bytes: int
+
+
+class QTable:
+    """
+    Open-addressed (linear probing) table from (packed state, action) to a Q-value.
+
+    Keys, values and visit counts live in flat NumPy arrays, about 32 bytes per slot.
+    The table doubles until it can hold max_entries; after that the least visited
+    share of the entries is evicted to make room, and the surviving visit counts are
+    halved so the counts follow recent use.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1_000_000,
+        initial_capacity: int = 1024,
+        max_load: float = 0.7,
+        evict_fraction: float = 0.25,
+        seed: Optional[int] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries: int = max_entries
+        self.max_load: float = max_load
+        self.evict_fraction: float = evict_fraction
+        self.max_capacity: int = _next_power_of_two(int(max_entries / max_load) + 1)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.size: int = 0
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+        self.read_only: bool = False
+        self._allocate(min(_next_power_of_two(initial_capacity), self.max_capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity: int = capacity
+        self._mask: int = capacity - 1
+        self.keys: np.ndarray = np.zeros((capacity, 3), dtype=np.uint64)
+        self.values: np.ndarray = np.zeros(capacity, dtype=np.float32)
+        # a visit count of 0 marks an empty slot
+        self.visits: np.ndarray = np.zeros(capacity, dtype=np.uint32)
+        self.size = 0
+
+    def _slot(self, word_0: int, word_1: int, word_2: int) -> int:
+        # slot holding the key, or the empty slot where it would be inserted
+        slot = _hash(word_0, word_1, word_2) & self._mask
+        keys, visits, mask = self.keys, self.visits, self._mask
+        while visits[slot]:
+            key = keys[slot]
+            if key[0] == word_0 and key[1] == word_1 and key[2] == word_2:
+                return slot
+            slot = (slot + 1) & mask
+        return slot
+
+    def get(self, state: PackedState, action: int, default: float = 0.0) -> float:
+        word_2 = state[2] | (action << ACTION_SHIFT)
+        slot = self._slot(state[0], state[1], word_2)
+        if self.visits[slot]:
+            self.hits += 1
+            return float(self.values[slot])
+        self.misses += 1
+        return default
+
+    def get_many(self, keys: np.ndarray, default: float = 0.0) -> np.ndarray:
+        """
+        get() for an array of keys (..., 3) that already include their actions (see
+        with_actions). All keys probe in lockstep, one NumPy step per probe distance.
+        """
+        shape = keys.shape[:-1]
+        slots, found = self._probe_many(keys.reshape(-1, 3))
+        values = np.full(len(slots), default, dtype=np.float64)
+        values[found] = self.values[slots[found]]
+        hits = int(found.sum())
+        self.hits += hits
+        self.misses += len(slots) - hits
+        return values.reshape(shape)
+
+    def _probe_many(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # _slot for rows of keys: the slot of every key, or the empty slot it would be
+        # inserted at, and whether it was found
+        slots = (_hash_many(keys) & np.uint64(self._mask)).astype(np.intp)
+        found = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        while pending.size:
+            slot = slots[pending]
+            occupied = self.visits[slot] > 0
+            matches = occupied & (self.keys[slot] == keys[pending]).all(axis=1)
+            found[pending[matches]] = True
+            probing = occupied & ~matches
+            pending = pending[probing]
+            slots[pending] = (slot[probing] + 1) & self._mask
+        return slots, found
+
+    def __contains__(self, key: Tuple[PackedState, int]) -> bool:
+        state, action = key
+        return bool(
+            self.visits[self._slot(state[0], state[1], state[2] | (action << ACTION_SHIFT))]
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    def set(self, state: PackedState, action: int, value: float) -> None:
+        if self.read_only:
+            raise RuntimeError("Q-table was loaded read-only from a checkpoint.")
+        word_2 = state[2] | (action << ACTION_SHIFT)
+        slot = self._slot(state[0], state[1], word_2)
+        if not self.visits[slot]:
+            if self.size + 1 > self.max_entries:
+                self._evict()
+            elif self.size + 1 > self.capacity * self.max_load:
+                self._resize(self.capacity * 2)
+            else:
+                self._store(slot, state[0], state[1], word_2, value, 1)
+                return
+            slot = self._slot(state[0], state[1], word_2)
+            self._store(slot, state[0], state[1], word_2, value, 1)
+            return
+        self.values[slot] = value
+        if self.visits[slot] < _MAX_VISITS:
+            self.visits[slot] += 1
+
+    def set_many(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """
+        set() for rows of distinct keys (n, 3) that already include their actions. New
+        keys make room for themselves first, by resizing or evicting like set().
+        """
+        if self.read_only:
+            raise RuntimeError("Q-table was loaded read-only from a checkpoint.")
+        slots, found = self._probe_many(keys)
+        known = slots[found]
+        self.values[known] = values[found]
+        self.visits[known] += self.visits[known] < _MAX_VISITS
+        new = ~found
+        added = int(new.sum())
+        if not added:
+            return
+        if added > self.max_entries:
+            raise ValueError(f"{added} new keys do not fit in {self.max_entries} entries.")
+        while self.size + added > self.max_entries:
+            self._evict()
+        capacity = self.capacity
+        while self.size + added > capacity * self.max_load and capacity < self.max_capacity:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._resize(capacity)
+        self._insert_many(keys[new], values[new], np.ones(added, dtype=np.uint32))
+
+    def _store(
+        self, slot: int, word_0: int, word_1: int, word_2: int, value: float, visits: int
+    ) -> None:
+        self.keys[slot] = (word_0, word_1, word_2)
+        self.values[slot] = value
+        self.visits[slot] = visits
+        self.size += 1
+
+    def entries(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        occupied = np.flatnonzero(self.visits)
+        return self.keys[occupied], self.values[occupied], self.visits[occupied]
+
+    def _rebuild(
+        self,
+        capacity: int,
+        keys: np.ndarray,
+        values: np.ndarray,
+        visits: np.ndarray,
+    ) -> None:
+        self._allocate(capacity)
+        self._insert_many(keys, values, visits)
+
+    def _insert_many(self, keys: np.ndarray, values: np.ndarray, visits: np.ndarray) -> None:
+        # the keys are distinct and not in the table, so they are inserted in lockstep
+        # like get_many probes: each step, every key at a free slot takes it, the first
+        # of several at once wins, and the keys at taken slots move on to the next one
+        slots = (_hash_many(keys) & np.uint64(self._mask)).astype(np.intp)
+        pending = np.arange(len(keys))
+        while pending.size:
+            slot = slots[pending]
+            free = self.visits[slot] == 0
+            free_slots, first = np.unique(slot[free], return_index=True)
+            placed = np.flatnonzero(free)[first]
+            self.keys[free_slots] = keys[pending[placed]]
+            self.values[free_slots] = values[pending[placed]]
+            self.visits[free_slots] = visits[pending[placed]]
+            slots[pending[~free]] = (slot[~free] + 1) & self._mask
+            waiting = np.ones(len(pending), dtype=bool)
+            waiting[placed] = False
+            pending = pending[waiting]
+        self.size += len(keys)
+
+    def _resize(self, capacity: int) -> None:
+        capacity = min(capacity, self.max_capacity)
+        self._rebuild(capacity, *self.entries())
+
+    def _evict(self) -> None:
+        keys, values, visits = self.entries()
+        evict_count = min(max(1, int(len(visits) * self.evict_fraction)), len(visits))
+        # ties are broken at random: slot order follows the hash, so evicting in slot
+        # order would pack the survivors into one long probe run
+        priority = visits + self._rng.random(len(visits))
+        keep = np.argpartition(priority, evict_count - 1)[evict_count:]
+        self.evictions += evict_count
+        aged_visits = np.maximum(visits[keep] >> 1, 1)
+        self._rebuild(self.max_capacity, keys[keep], values[keep], aged_visits)
+
+    def stats(self) -> QTableStats:
+        lookups = self.hits + self.misses
+        return QTableStats(
+            size=self.size,
+            capacity=self.capacity,
+            max_entries=self.max_entries,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+            memory_bytes=self.keys.nbytes + self.values.nbytes + self.visits.nbytes,
+        )
+
+    def save(self, path: str) -> None:
+        # written next to the target and renamed, so readers never see a partial file
+        header = _HEADER.pack(
+            CHECKPOINT_MAGIC,
+            CHECKPOINT_VERSION,
+            _HEADER_SIZE,
+            self.capacity,
+            self.size,
+            self.max_entries,
+            self.max_load,
+        )
+        temporary_path = f"{path}.tmp{os.getpid()}"
+        with open(temporary_path, "wb") as file:
+            file.write(header.ljust(_HEADER_SIZE, b"\0"))
+            for array in (self.keys, self.values, self.visits):
+                np.ascontiguousarray(array).tofile(file)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "QTable":
+        """
+        Open a checkpoint. With mmap=True the arrays are read-only views on the file:
+        loading is O(1) whatever the table size, and processes that open the same file
+        share its pages. With mmap=False the arrays are copied into a writable table.
+        """
+        with open(path, "rb") as file:
+            header = file.read(_HEADER_SIZE)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{path} is not a Q-table checkpoint.")
+        magic, version, header_size, capacity, size, max_entries, max_load = _HEADER.unpack(
+            header[: _HEADER.size]
+        )
+        if magic != CHECKPOINT_MAGIC:
+            raise ValueError(f"{path} is not a Q-table checkpoint.")
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"{path} has checkpoint version {version}, expected {CHECKPOINT_VERSION}."
+            )
+        offset = header_size
+        arrays = []
+        for dtype, shape in (
+            (np.uint64, (capacity, 3)),
+            (np.float32, (capacity,)),
+            (np.uint32, (capacity,)),
+        ):
+            if mmap:
+                array = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+            else:
+                array = np.fromfile(
+                    path, dtype=dtype, count=int(np.prod(shape)), offset=offset
+                ).reshape(shape)
+            arrays.append(array)
+            offset += array.nbytes
+
+        table = cls(max_entries=max_entries, initial_capacity=1, max_load=max_load)
+        table.capacity, table._mask = capacity, capacity - 1
+        table.keys, table.values, table.visits = arrays
+        table.size = size
+        table.read_only = mmap
+        return table
+
+
+def _next_power_of_two(value: int) -> int:
+    return 1 << max(0, value - 1).bit_length()
+
+
+def best_action(q_table: QTable, state: PackedState, actions: Iterable[int]) -> Optional[int]:
+    # highest Q-value among the actions, the first one wins ties
+    best, best_value = None, 0.0
+    for action in actions:
+        value = q_table.get(state, action)
+        if best is None or value > best_value:
+            best, best_value = action, value
+    return best
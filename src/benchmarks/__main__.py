@@ -0,0 +1,63 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from src.benchmarks.suite import find_regressions, load_baseline, run_suite, save_baseline
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmarks",
+        description="Time the deck, the game loop and strategy decisions.",
+    )
+    parser.add_argument(
+        "--only", nargs="+", default=None, help="run benchmarks whose name contains these"
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplies the operations per run"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for every benchmark setup")
+    parser.add_argument("--save", type=str, default=None, help="write results as a baseline")
+    parser.add_argument(
+        "--baseline", type=str, default=None, help="baseline JSON to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown against the baseline, 0.25 is 25%% slower",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    results = run_suite(
+        only=args.only, repeats=args.repeats, scale=args.scale, seed=args.seed
+    )
+    for result in results:
+        line = (
+            f"{result.name:<42} {result.seconds_per_op * 1e6:>12.2f} us/op "
+            f"{result.ops_per_sec:>12.1f} ops/sec"
+        )
+        if result.name in baseline:
+            reference = baseline[result.name].seconds_per_op
+            line += f" {result.seconds_per_op / reference - 1.0:>+8.1%} vs baseline"
+        print(line)
+    if args.save:
+        save_baseline(args.save, results, args.seed)
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.slowdown:+.1%} "
+            f"({regression.baseline_seconds_per_op * 1e6:.2f} -> "
+            f"{regression.seconds_per_op * 1e6:.2f} us/op)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
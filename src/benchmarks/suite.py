@@ -0,0 +1,256 @@
+import json
+import platform
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.agents.ismcts import ISMCTSStrategy
+from src.game.cards import Deck
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.game.state import GameStateView
+from src.strategies import NeuralNetworkStrategy
+from src.strategies.base_strategy import BaseStrategy
+from src.strategies.features import FeatureEncoder
+from src.strategies.mlp import MLPPolicy
+from src.tournament.runner import STRATEGY_REGISTRY, TournamentConfig, play_single_game
+
+BASELINE_VERSION = 1
+
+# a benchmark runs `operations` operations and returns the seconds they took, setup
+# excluded; it seeds its own setup so repeated runs measure the same work
+Benchmark = Callable[[int, int], float]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    operations: int
+    repeats: int
+    # best and median time of one operation over the repeats
+    seconds_per_op: float
+    median_seconds_per_op: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1.0 / self.seconds_per_op if self.seconds_per_op else 0.0
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_seconds_per_op: float
+    seconds_per_op: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.seconds_per_op / self.baseline_seconds_per_op - 1.0
+
+
+def _seed_everything(seed: int) -> None:
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def _silent_game(strategies: Sequence[BaseStrategy], amount_of_rounds: int = 3) -> Game:
+    players = [
+        Player(player_id=seat + 1, strategy=strategy)
+        for seat, strategy in enumerate(strategies)
+    ]
+    return Game(players=players, amount_of_rounds=amount_of_rounds, event_sink=NullSink())
+
+
+def bench_deck_construction(operations: int, seed: int) -> float:
+    _seed_everything(seed)
+    start = time.perf_counter()
+    for _ in range(operations):
+        Deck()
+    return time.perf_counter() - start
+
+
+def bench_play_turn(operations: int, seed: int) -> float:
+    # turns of the default tournament table; a fresh round is dealt untimed when the
+    # hands run out
+    _seed_everything(seed)
+    config = TournamentConfig()
+    game = _silent_game(
+        [STRATEGY_REGISTRY[name]() for name in config.strategies],
+        amount_of_rounds=operations // config.amount_of_cards_per_player + 1,
+    )
+    game.initialize_game()
+    elapsed = 0.0
+    for turn in range(operations):
+        if turn and turn % game.amount_of_cards_per_player == 0:
+            game.round_number += 1
+            game.reset_for_next_round()
+            game.turn_number = 0
+        start = time.perf_counter()
+        game.play_turn()
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def bench_play_game(operations: int, seed: int) -> float:
+    config = TournamentConfig()
+    start = time.perf_counter()
+    for game_index in range(operations):
+        play_single_game(config, game_index, seed)
+    return time.perf_counter() - start
+
+
+def _neural_network_strategy() -> BaseStrategy:
+    encoder = FeatureEncoder()
+    return NeuralNetworkStrategy(MLPPolicy(encoder.size, seed=0), encoder=encoder)
+
+
+def _ismcts_strategy() -> BaseStrategy:
+    # a fixed, small search budget: the table is filled by a full game of five of them
+    return ISMCTSStrategy(iterations=100, seed=0)
+
+
+# every strategy that decides without console input
+DECISION_STRATEGIES: Dict[str, Callable[[], BaseStrategy]] = {
+    **STRATEGY_REGISTRY,
+    NeuralNetworkStrategy.__name__: _neural_network_strategy,
+    ISMCTSStrategy.__name__: _ismcts_strategy,
+}
+
+
+def _decision_table(strategy_name: str, seed: int) -> Game:
+    # one full game first, so learning strategies decide from a filled table; the
+    # game ends with a fresh deal, which the decisions are measured on
+    _seed_everything(seed)
+    factory = DECISION_STRATEGIES[strategy_name]
+    game = _silent_game([factory() for _ in range(5)])
+    game.play_game()
+    return game
+
+
+def bench_card_decision(strategy_name: str) -> Benchmark:
+    def bench(operations: int, seed: int) -> float:
+        game = _decision_table(strategy_name, seed)
+        player = game.players[0]
+        game_state = GameStateView(game.state, player)
+        start = time.perf_counter()
+        for _ in range(operations):
+            player.choose_card_to_play(game_state)
+        return time.perf_counter() - start
+
+    return bench
+
+
+def bench_pile_decision(strategy_name: str) -> Benchmark:
+    def bench(operations: int, seed: int) -> float:
+        game = _decision_table(strategy_name, seed)
+        player = game.players[0]
+        cards_played = [next(iter(other.hand.values())) for other in game.players]
+        game_state = GameStateView(game.state, player, cards_played)
+        start = time.perf_counter()
+        for _ in range(operations):
+            player.choose_pile_to_replace(game_state)
+        return time.perf_counter() - start
+
+    return bench
+
+
+def default_benchmarks() -> Dict[str, Benchmark]:
+    benchmarks: Dict[str, Benchmark] = {
+        "deck_construction": bench_deck_construction,
+        "game.play_turn": bench_play_turn,
+        "game.play_game": bench_play_game,
+    }
+    for name in DECISION_STRATEGIES:
+        benchmarks[f"decision.card.{name}"] = bench_card_decision(name)
+        benchmarks[f"decision.pile.{name}"] = bench_pile_decision(name)
+    return benchmarks
+
+
+# operations per repeat at scale 1.0, sized to take roughly 0.1s each
+DEFAULT_OPERATIONS: Dict[str, int] = {
+    "deck_construction": 5_000,
+    "game.play_turn": 500,
+    "game.play_game": 20,
+    # a search decision takes milliseconds
+    f"decision.card.{ISMCTSStrategy.__name__}": 20,
+    f"decision.pile.{ISMCTSStrategy.__name__}": 20,
+}
+DEFAULT_DECISION_OPERATIONS = 2_000
+
+
+def run_benchmark(
+    name: str, benchmark: Benchmark, operations: int, repeats: int = 5, seed: int = 0
+) -> BenchmarkResult:
+    # one untimed warm-up run fills caches and the lazily built tables
+    benchmark(max(1, operations // 10), seed)
+    per_op = [benchmark(operations, seed) / operations for _ in range(repeats)]
+    return BenchmarkResult(
+        name=name,
+        operations=operations,
+        repeats=repeats,
+        seconds_per_op=min(per_op),
+        median_seconds_per_op=statistics.median(per_op),
+    )
+
+
+def run_suite(
+    only: Optional[Sequence[str]] = None,
+    repeats: int = 5,
+    scale: float = 1.0,
+    seed: int = 0,
+) -> List[BenchmarkResult]:
+    # `only` keeps the benchmarks whose name contains any of the given substrings
+    results = []
+    for name, benchmark in default_benchmarks().items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        operations = DEFAULT_OPERATIONS.get(name, DEFAULT_DECISION_OPERATIONS)
+        operations = max(1, int(operations * scale))
+        results.append(run_benchmark(name, benchmark, operations, repeats, seed))
+    return results
+
+
+def save_baseline(path: str, results: Sequence[BenchmarkResult], seed: int) -> None:
+    document = {
+        "version": BASELINE_VERSION,
+        "seed": seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    with open(path) as file:
+        document = json.load(file)
+    if document.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"{path} has baseline version {document.get('version')}, "
+            f"expected {BASELINE_VERSION}."
+        )
+    return {name: BenchmarkResult(**values) for name, values in document["results"].items()}
+
+
+def find_regressions(
+    results: Sequence[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    threshold: float = 0.25,
+) -> List[Regression]:
+    # a benchmark regresses when its best time is more than `threshold` slower than
+    # the baseline's; benchmarks missing from the baseline are skipped
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+        if result.seconds_per_op > reference.seconds_per_op * (1.0 + threshold):
+            regressions.append(
+                Regression(result.name, reference.seconds_per_op, result.seconds_per_op)
+            )
+    return regressions
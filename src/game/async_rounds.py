@@ -0,0 +1,175 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, Optional, Sequence, Type
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+    from src.game.player import Player
+
+from src.game.events import CardUnplayable, EventSink, PileReplaced, TurnStarted
+from src.game.instrumentation import GameStats
+from src.game.records import GameRecorder
+from src.game.rounds import Game
+from src.strategies.async_strategy import AsyncBaseStrategy, SyncStrategyAdapter
+from src.strategies.base_strategy import BaseStrategy
+from src.strategies.random_strategies import RandomCardStrategy
+
+
+class AsyncGame(Game):
+    """
+    A Game whose decisions are awaited. The card choices of a turn are gathered
+    concurrently, so one slow player no longer holds up the others, and many tables
+    can share one event loop (see play_games). The game decides through `strategies`,
+    where a player's plain BaseStrategy is wrapped in a SyncStrategyAdapter; the
+    players keep their own strategy, so they can sit at a synchronous Game again.
+
+    Every decision gets decision_timeout seconds (None waits forever). A decision
+    that times out, or that is not a card in hand or a pile index, is replaced by
+    the decision of a `fallback_strategy` instance for that player, and counted in
+    fallback_decisions (and timeouts).
+    """
+
+    def __init__(
+        self,
+        players: List["Player"],
+        amount_of_rounds: Optional[int] = 5,
+        amount_of_piles: Optional[int] = 4,
+        amount_of_cards_per_player: Optional[int] = 10,
+        event_sink: Optional[EventSink] = None,
+        recorder: Optional[GameRecorder] = None,
+        decision_timeout: Optional[float] = None,
+        fallback_strategy: Type[BaseStrategy] = RandomCardStrategy,
+    ):
+        super().__init__(
+            players,
+            amount_of_rounds=amount_of_rounds,
+            amount_of_piles=amount_of_piles,
+            amount_of_cards_per_player=amount_of_cards_per_player,
+            event_sink=event_sink,
+            recorder=recorder,
+        )
+        self.strategies: Dict[int, AsyncBaseStrategy] = {}
+        for player in players:
+            strategy = player.strategy
+            if not isinstance(strategy, AsyncBaseStrategy):
+                strategy = SyncStrategyAdapter(strategy)
+                strategy._set_player(player)
+            self.strategies[player.player_id] = strategy
+        self.learning_players = [
+            player for player in players if self.strategies[player.player_id].learns
+        ]
+        self.decision_timeout: Optional[float] = decision_timeout
+        self.fallbacks: Dict[int, BaseStrategy] = {}
+        for player in players:
+            fallback = fallback_strategy()
+            fallback._set_player(player)
+            self.fallbacks[player.player_id] = fallback
+        self.fallback_decisions: Dict[int, int] = {player.player_id: 0 for player in players}
+        self.timeouts: Dict[int, int] = {player.player_id: 0 for player in players}
+
+    def enable_instrumentation(self, stats: Optional[GameStats] = None) -> GameStats:
+        raise RuntimeError("Instrumentation times synchronous calls, AsyncGame has none.")
+
+    async def _await_decision(self, player_id: int, decision: Awaitable[Any]) -> Any:
+        try:
+            return await asyncio.wait_for(decision, self.decision_timeout)
+        except TimeoutError:
+            self.timeouts[player_id] += 1
+            return None
+
+    async def choose_card(self, player: "Player") -> "Card":
+        game_state = self.get_personalized_game_state_for_player(player)
+        card = await self._await_decision(
+            player.player_id,
+            self.strategies[player.player_id].choose_card_to_play(game_state),
+        )
+        if card is None or card.card_number not in player.hand:
+            self.fallback_decisions[player.player_id] += 1
+            card = self.fallbacks[player.player_id].choose_card_to_play(game_state)
+        return player.hand[card.card_number]
+
+    async def choose_pile(self, player_id: int, cards_played: List["Card"]) -> int:
+        player = self.players_by_id[player_id]
+        game_state = self.get_personalized_game_state_for_player(player, cards_played)
+        pile_index = await self._await_decision(
+            player_id, self.strategies[player_id].choose_pile_to_replace(game_state)
+        )
+        if not isinstance(pile_index, int) or not 0 <= pile_index < self.amount_of_piles:
+            self.fallback_decisions[player_id] += 1
+            pile_index = self.fallbacks[player_id].choose_pile_to_replace(game_state)
+        return pile_index
+
+    async def get_player_card_choice(self) -> Dict[int, "Card"]:
+        # every player decides on the same state, the cards leave the hands afterwards
+        chosen_cards = await asyncio.gather(
+            *(self.choose_card(player) for player in self.players)
+        )
+        player_moves = {}
+        for player, chosen_card in zip(self.players, chosen_cards, strict=True):
+            player.hand.pop(chosen_card.card_number)
+            player_moves[player.player_id] = chosen_card
+        if self.recorder is not None:
+            self.recorder.record_cards(list(player_moves.values()))
+        return player_moves
+
+    async def play_turn(self) -> None:
+        current_personalised_game_states = self.states_before_turn()
+        player_moves = await self.get_player_card_choice()
+        if self._emit_turns:
+            self.event_sink.emit(TurnStarted(self.round_number, self.turn_number))
+        sorted_cards = sorted(
+            player_moves.items(),
+            key=lambda x: x[1].card_number,
+        )
+
+        for player_id, card in sorted_cards:
+            pile_index = self.state.pile_for_card(card.card_number)
+            if pile_index is None:
+                if self._emit_moves:
+                    self.event_sink.emit(CardUnplayable(player_id, card.card_number))
+                chosen_pile_index = await self.choose_pile(
+                    player_id, list(player_moves.values())
+                )
+                chosen_pile, pile_points = self.handle_unplayable_card(
+                    player_id,
+                    card,
+                    player_moves,
+                    chosen_pile_index,
+                )
+                if self._emit_moves:
+                    self.event_sink.emit(
+                        PileReplaced(
+                            player_id=player_id,
+                            card_number=card.card_number,
+                            card_points=card.card_points,
+                            pile_index=chosen_pile,
+                            points=pile_points,
+                        )
+                    )
+            else:
+                self.handle_playable_card(player_id, card, pile_index)
+
+        self.finish_turn(current_personalised_game_states, player_moves)
+        # strategies that answer at once never suspend, this lets other tables run
+        await asyncio.sleep(0)
+
+    async def play_round(self) -> None:
+        self.start_round()
+        for _ in range(self.amount_of_cards_per_player):
+            await self.play_turn()
+        self.finish_round()
+
+    async def play_game(self) -> None:
+        if self.recorder is not None:
+            self.recorder.start_game(self)
+        self.initialize_game()
+        for _ in range(self.amount_of_rounds):
+            await self.play_round()
+            self.reset_for_next_round()
+        if self.recorder is not None:
+            self.recorder.finish_game(self)
+
+
+async def play_games(games: Sequence[AsyncGame]) -> None:
+    # all tables in the running event loop; a table waiting on a player does not
+    # stop the others
+    await asyncio.gather(*(game.play_game() for game in games))
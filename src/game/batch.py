@@ -0,0 +1,241 @@
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.game.cards import card_points_table
+
+# capacity of a pile row: the 6th card takes the pile, so at most 5 cards stay on it
+MAX_PILE_LENGTH = 5
+
+
+def build_points_table(start_card: int = 1, end_card: int = 103) -> np.ndarray:
+    # index 0 is the "no card" marker used for played hand slots
+    points = np.array(card_points_table(end_card), dtype=np.int16)
+    points[:start_card] = 0
+    return points
+
+
+def lowest_points_pile(
+    batch: "BatchGame",
+    games: np.ndarray,
+    seats: np.ndarray,
+    cards: np.ndarray,
+) -> np.ndarray:
+    """
+    Default replace-pile rule: the pile with the fewest points, ties broken by the lowest
+    last card (same rule as DescendingOrderStrategy).
+    """
+    points = batch.pile_points[games].astype(np.int64)
+    tops = batch.pile_tops[games].astype(np.int64)
+    # points dominate, the pile top only breaks ties
+    return np.argmin(points * (batch.end_card + 1) + tops, axis=1)
+
+
+PileChooser = Callable[["BatchGame", np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+CardChooser = Callable[["BatchGame"], np.ndarray]
+
+
+class BatchGame:
+    """
+    Plays many independent games at once with the same rules as Game.
+
+    Every table is a row in a set of arrays:
+    hands (games, players, cards_per_player) hold card numbers sorted ascending, with 0
+    marking a card that has been played; pile_tops, pile_lengths and pile_points are
+    (games, piles); pile_cards keeps the full pile contents. Seat p corresponds to
+    players[p] of the equivalent Game, and for the same deal and the same choices the
+    per-game scores are identical to Game.
+    """
+
+    def __init__(
+        self,
+        amount_of_games: int,
+        amount_of_players: int,
+        amount_of_rounds: Optional[int] = 5,
+        amount_of_piles: Optional[int] = 4,
+        amount_of_cards_per_player: Optional[int] = 10,
+        start_card: Optional[int] = 1,
+        end_card: Optional[int] = 103,
+        seed: Optional[int] = None,
+    ):
+        deck_size = end_card - start_card + 1
+        cards_needed = amount_of_players * amount_of_cards_per_player + amount_of_piles
+        if cards_needed > deck_size:
+            raise ValueError(
+                f"Deck of {deck_size} cards cannot deal {cards_needed} cards per game."
+            )
+        self.amount_of_games: int = amount_of_games
+        self.amount_of_players: int = amount_of_players
+        self.amount_of_rounds: int = amount_of_rounds
+        self.amount_of_piles: int = amount_of_piles
+        self.amount_of_cards_per_player: int = amount_of_cards_per_player
+        self.start_card: int = start_card
+        self.end_card: int = end_card
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.points_table: np.ndarray = build_points_table(start_card, end_card)
+
+        shape = (amount_of_games, amount_of_piles)
+        self.hands: np.ndarray = np.zeros(
+            (amount_of_games, amount_of_players, amount_of_cards_per_player), dtype=np.int16
+        )
+        self.pile_tops: np.ndarray = np.zeros(shape, dtype=np.int16)
+        self.pile_lengths: np.ndarray = np.zeros(shape, dtype=np.int8)
+        self.pile_points: np.ndarray = np.zeros(shape, dtype=np.int16)
+        self.pile_cards: np.ndarray = np.zeros(shape + (MAX_PILE_LENGTH,), dtype=np.int16)
+        self.turn_scores: np.ndarray = np.zeros(
+            (amount_of_games, amount_of_players), dtype=np.int32
+        )
+        self.total_scores: np.ndarray = np.zeros(
+            (amount_of_games, amount_of_players), dtype=np.int32
+        )
+        # cumulative totals after each round, like Game.scores_per_player_per_round
+        self.round_scores: np.ndarray = np.zeros(
+            (amount_of_games, amount_of_players, amount_of_rounds), dtype=np.int32
+        )
+        # seen_cards[g, n] is set once card n is revealed on a pile this round, like
+        # GameState.seen_mask; turn_cards holds the cards chosen this turn
+        self.seen_cards: np.ndarray = np.zeros((amount_of_games, end_card + 1), dtype=bool)
+        self.turn_cards: np.ndarray = np.zeros(
+            (amount_of_games, amount_of_players), dtype=np.int16
+        )
+        self.round_number: int = 0
+        self.turn_number: int = 0
+        # deals so far; with round_number it tells a new set of games from a new round
+        self.deals: int = 0
+
+    def shuffled_decks(self) -> np.ndarray:
+        deck = np.arange(self.start_card, self.end_card + 1, dtype=np.int16)
+        return self.rng.permuted(
+            np.broadcast_to(deck, (self.amount_of_games, deck.size)), axis=1
+        )
+
+    def deal(self, deck_orders: Optional[np.ndarray] = None) -> None:
+        # deck_orders holds each game's cards in draw order, dealt the way
+        # Game.initialize_game draws them: hands seat by seat, then one card per pile
+        if deck_orders is None:
+            deck_orders = self.shuffled_decks()
+        deck_orders = np.asarray(deck_orders, dtype=np.int16)
+        hand_cards = self.amount_of_players * self.amount_of_cards_per_player
+        hands = deck_orders[:, :hand_cards].reshape(self.hands.shape)
+        self.hands[:] = np.sort(hands, axis=2)
+
+        starters = deck_orders[:, hand_cards : hand_cards + self.amount_of_piles]
+        self.pile_cards[:] = 0
+        self.pile_cards[:, :, 0] = starters
+        self.pile_tops[:] = starters
+        self.pile_lengths[:] = 1
+        self.pile_points[:] = self.points_table[starters]
+        self.seen_cards[:] = False
+        self.seen_cards[np.arange(self.amount_of_games)[:, None], starters] = True
+        self.turn_scores[:] = 0
+        self.turn_number = 0
+        self.deals += 1
+
+    def _remove_from_hands(self, chosen_cards: np.ndarray) -> None:
+        in_hand = (self.hands == chosen_cards[:, :, None]) & (chosen_cards[:, :, None] > 0)
+        if not in_hand.any(axis=2).all():
+            games, seats = np.nonzero(~in_hand.any(axis=2))
+            raise ValueError(
+                f"Chosen card not in hand for game {games[0]}, seat {seats[0]}: "
+                f"{chosen_cards[games[0], seats[0]]}"
+            )
+        self.hands[in_hand] = 0
+
+    def _start_new_piles(
+        self, games: np.ndarray, piles: np.ndarray, cards: np.ndarray
+    ) -> None:
+        self.pile_cards[games, piles] = 0
+        self.pile_cards[games, piles, 0] = cards
+        self.pile_tops[games, piles] = cards
+        self.pile_lengths[games, piles] = 1
+        self.pile_points[games, piles] = self.points_table[cards]
+
+    def play_turn(
+        self,
+        chosen_cards: np.ndarray,
+        choose_piles: Optional[PileChooser] = None,
+    ) -> None:
+        # chosen_cards is (games, players) of card numbers taken from each hand
+        if choose_piles is None:
+            choose_piles = lowest_points_pile
+        chosen_cards = np.asarray(chosen_cards, dtype=np.int16)
+        self._remove_from_hands(chosen_cards)
+        self.turn_cards[:] = chosen_cards
+        all_games = np.arange(self.amount_of_games)
+
+        # lowest card goes first; card numbers are unique so the order is strict
+        order = np.argsort(chosen_cards, axis=1)
+        sorted_cards = np.take_along_axis(chosen_cards, order, axis=1)
+        for step in range(self.amount_of_players):
+            cards = sorted_cards[:, step]
+            seats = order[:, step]
+            below = self.pile_tops < cards[:, None]
+            playable = below.any(axis=1)
+            # highest pile top that is still lower than the card
+            targets = np.where(below, self.pile_tops, -1).argmax(axis=1)
+
+            if not playable.all():
+                games = np.flatnonzero(~playable)
+                piles = np.asarray(
+                    choose_piles(self, games, seats[games], cards[games]), dtype=np.intp
+                )
+                self.turn_scores[games, seats[games]] += self.pile_points[games, piles]
+                self._start_new_piles(games, piles, cards[games])
+
+            games = np.flatnonzero(playable)
+            piles = targets[games]
+            lengths = self.pile_lengths[games, piles]
+            full = lengths == MAX_PILE_LENGTH
+
+            # sixth card: the player takes the five cards and starts a new pile
+            taken_games, taken_piles = games[full], piles[full]
+            self.turn_scores[taken_games, seats[taken_games]] += self.pile_points[
+                taken_games, taken_piles
+            ]
+            self._start_new_piles(taken_games, taken_piles, cards[taken_games])
+
+            placed_games, placed_piles = games[~full], piles[~full]
+            placed_cards = cards[placed_games]
+            self.pile_cards[placed_games, placed_piles, lengths[~full]] = placed_cards
+            self.pile_tops[placed_games, placed_piles] = placed_cards
+            self.pile_lengths[placed_games, placed_piles] += 1
+            self.pile_points[placed_games, placed_piles] += self.points_table[placed_cards]
+            self.seen_cards[all_games, cards] = True
+        self.turn_number += 1
+
+    def finish_round(self) -> None:
+        self.total_scores += self.turn_scores
+        self.round_scores[:, :, self.round_number] = self.total_scores
+        self.round_number += 1
+
+    def play_round(
+        self,
+        choose_cards: CardChooser,
+        choose_piles: Optional[PileChooser] = None,
+    ) -> None:
+        for _ in range(self.amount_of_cards_per_player):
+            self.play_turn(choose_cards(self), choose_piles)
+        self.finish_round()
+
+    def play_game(
+        self,
+        choose_cards: CardChooser,
+        choose_piles: Optional[PileChooser] = None,
+    ) -> np.ndarray:
+        for _ in range(self.amount_of_rounds):
+            self.deal()
+            self.play_round(choose_cards, choose_piles)
+        return self.total_scores
+
+
+def highest_cards(batch: BatchGame) -> np.ndarray:
+    # the highest card left in every hand, as DescendingOrderStrategy plays it
+    return batch.hands.max(axis=2)
+
+
+def random_cards(batch: BatchGame) -> np.ndarray:
+    # uniform choice among the cards still in each hand
+    in_hand = batch.hands > 0
+    keys = np.where(in_hand, batch.rng.random(batch.hands.shape), -1.0)
+    slots = keys.argmax(axis=2)
+    return np.take_along_axis(batch.hands, slots[:, :, None], axis=2)[:, :, 0]
@@ -1,9 +1,13 @@
-from typing import Optional, Dict
-from dataclasses import dataclass, field
 import random
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+# draw order, in-deck flags, draw cursor and cards remaining, see Deck.snapshot
+DeckSnapshot = Tuple[Tuple[int, ...], bytes, int, int]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Card:
     # ends on 5 = 2, same digits = 5, except if ends on 5 such as 55 then 7
     # ends on 0 = 3
@@ -23,64 +27,168 @@ class Card:
             return 2
         elif self.card_number % 10 == 0:
             return 3
-        elif len(str(self.card_number)) >1 and len(set(str(self.card_number))) == 1:
+        elif len(str(self.card_number)) > 1 and len(set(str(self.card_number))) == 1:
             return 5
         else:
             return 1
 
     def __post_init__(self):
-        self.card_points = self.points()
+        object.__setattr__(self, "card_points", self.points())
 
     def __repr__(self) -> str:
         if self.card_points == 1:
             return f"Card {self.card_number} with {self.card_points} point"
         return f"Card {self.card_number} with {self.card_points} points"
 
+
+# one immutable Card per card number for the whole process, indexed by card number;
+# decks hand out these instances so cards can be compared with `is`
+_CARD_POOL: List[Optional[Card]] = [None]
+
+
+def get_card(card_number: int) -> Card:
+    if card_number >= len(_CARD_POOL):
+        _CARD_POOL.extend(
+            Card(card_number=number) for number in range(len(_CARD_POOL), card_number + 1)
+        )
+    return _CARD_POOL[card_number]
+
+
+@lru_cache(maxsize=None)
+def card_points_table(end_card: int = 103) -> Tuple[int, ...]:
+    # points per card number, index 0 (no card) is worth 0
+    return (0,) + tuple(get_card(number).card_points for number in range(1, end_card + 1))
+
+
+@lru_cache(maxsize=None)
+def _validate_card_range(
+    start_card: int, end_card: int, min_points: int, max_points: int
+) -> None:
+    # the pool is immutable, so a range only has to be checked once per process
+    error_messages = {}
+    if end_card < start_card:
+        raise ValueError("Deck is empty.")
+    for card_num in range(start_card, end_card + 1):
+        card = get_card(card_num)
+        if card.card_number != card_num:
+            error_messages[card_num] = (
+                f"Card number mismatch: expected {card_num}, got {card.card_number}"
+            )
+        if not (min_points <= card.card_points <= max_points):
+            error_messages[card_num] = (
+                f"Card points {card.card_points} out of bounds ({min_points}, {max_points})"
+            )
+    if error_messages:
+        raise ValueError(f"Deck validation errors: {error_messages}")
+
+
 class Deck:
+    """
+    A shuffled permutation of card numbers with a draw cursor over the shared card pool;
+    drawing is O(1) and reset() reshuffles in place for the next round.
+
+    With a seed the deck shuffles with its own generator, so every round is dealt
+    the same however many random numbers the strategies draw in between; without one
+    it shuffles with the global random module.
+    """
+
     def __init__(
         self,
         start_card: Optional[int] = 1,
         end_card: Optional[int] = 103,
         min_points: Optional[int] = 1,
         max_points: Optional[int] = 7,
+        seed: Optional[int] = None,
     ):
-        self.cards: Dict[int, Card] = {}
-        for card_num in range(start_card, end_card + 1):
-            card = Card(card_number=card_num)
-            self.cards[card_num] = card
+        self.start_card = start_card
+        self.end_card = end_card
         self.min_points = min_points
         self.max_points = max_points
-        self.shuffle()
+        self.rng: Optional[random.Random] = None if seed is None else random.Random(seed)
         self.error_checks()
+        get_card(end_card)
+        self._pool: List[Optional[Card]] = _CARD_POOL
+        self._order: List[int] = list(range(start_card, end_card + 1))
+        # 1 while the card is still in the deck, indexed by card number
+        self._in_deck: bytearray = bytearray(end_card + 1)
+        self._all_in_deck: bytes = b"\x01" * len(self._order)
+        self._next: int = 0
+        self._remaining: int = 0
+        self.reset()
 
     def error_checks(self) -> None:
-        error_messages = {}
-        if not self.cards:
-            raise ValueError("Deck is empty.")
-        for card_num, card in self.cards.items():
-            if card.card_number != card_num:
-                error_messages[card_num] = (
-                    f"Card number mismatch: expected {card_num}, got {card.card_number}"
-                )
-            if not (self.min_points <= card.card_points <= self.max_points):
-                error_messages[card_num] = (
-                    f"Card points {card.card_points} out of bounds ({self.min_points}, {self.max_points})"
-                )
-        if error_messages:
-            raise ValueError(f"Deck validation errors: {error_messages}")
+        _validate_card_range(self.start_card, self.end_card, self.min_points, self.max_points)
+
+    def reset(self) -> None:
+        # back to the full deck in card order, then shuffled, reusing the same buffers
+        self._order[:] = range(self.start_card, self.end_card + 1)
+        self._in_deck[self.start_card :] = self._all_in_deck
+        self._next = 0
+        self._remaining = len(self._order)
+        self.shuffle()
+
+    def _shuffle(self, numbers: List[int]) -> None:
+        if self.rng is None:
+            random.shuffle(numbers)
+        else:
+            self.rng.shuffle(numbers)
 
     def shuffle(self) -> None:
-        card_items = list(self.cards.items())
-        random.shuffle(card_items)
-        self.cards = dict(card_items)
+        if self._remaining == len(self._order):
+            self._shuffle(self._order)
+            return
+        # only the cards still in the deck are shuffled, drawn cards stay behind them
+        undrawn = self._order[self._next :]
+        remaining = [number for number in undrawn if self._in_deck[number]]
+        self._shuffle(remaining)
+        self._order[self._next :] = remaining + [
+            number for number in undrawn if not self._in_deck[number]
+        ]
+
+    def __len__(self) -> int:
+        return self._remaining
+
+    def snapshot(self) -> DeckSnapshot:
+        return (tuple(self._order), bytes(self._in_deck), self._next, self._remaining)
+
+    def restore(self, snapshot: DeckSnapshot) -> None:
+        order, in_deck, self._next, self._remaining = snapshot
+        self._order[:] = order
+        self._in_deck[:] = in_deck
+
+    @property
+    def cards(self) -> Dict[int, Card]:
+        # the cards still in the deck, in draw order
+        return {
+            number: self._pool[number]
+            for number in self._order[self._next :]
+            if self._in_deck[number]
+        }
+
+    def min_card(self) -> Optional[int]:
+        if not self._remaining:
+            return None
+        return min(number for number in self._order[self._next :] if self._in_deck[number])
+
+    def max_card(self) -> Optional[int]:
+        if not self._remaining:
+            return None
+        return max(number for number in self._order[self._next :] if self._in_deck[number])
 
     def draw_card(self, card_number: Optional[int] = None) -> Card:
         if card_number is None:
-            card_number = next(iter(self.cards))
-            card = self.cards.pop(card_number)
-            return card
-        if card_number in self.cards:
-            return self.cards.pop(card_number)
-        else:
+            order, in_deck = self._order, self._in_deck
+            # skip cards that were drawn out of order by number
+            while self._next < len(order) and not in_deck[order[self._next]]:
+                self._next += 1
+            if self._next >= len(order):
+                raise ValueError("Deck is empty.")
+            card_number = order[self._next]
+            self._next += 1
+        elif not (
+            self.start_card <= card_number <= self.end_card and self._in_deck[card_number]
+        ):
             raise ValueError(f"Card number {card_number} not found in deck.")
-
+        self._in_deck[card_number] = 0
+        self._remaining -= 1
+        return self._pool[card_number]
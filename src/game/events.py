@@ -0,0 +1,151 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import ClassVar, Deque, Dict, List, Optional
+
+
+class Verbosity(IntEnum):
+    SILENT = 0
+    ROUNDS = 1
+    TURNS = 2
+    MOVES = 3
+
+
+@dataclass(frozen=True, slots=True)
+class GameEvent:
+    level: ClassVar[Verbosity] = Verbosity.MOVES
+
+
+@dataclass(frozen=True, slots=True)
+class TurnStarted(GameEvent):
+    level: ClassVar[Verbosity] = Verbosity.TURNS
+    round_number: int
+    turn_number: int
+
+
+@dataclass(frozen=True, slots=True)
+class CardPlayed(GameEvent):
+    # pile_length and pile_points describe the pile after the card was placed
+    player_id: int
+    card_number: int
+    pile_index: int
+    pile_length: int
+    pile_points: int
+
+
+@dataclass(frozen=True, slots=True)
+class PileTaken(GameEvent):
+    # the played card was the 6th: the player collects the other five
+    player_id: int
+    card_number: int
+    pile_index: int
+    points: int
+
+
+@dataclass(frozen=True, slots=True)
+class CardUnplayable(GameEvent):
+    player_id: int
+    card_number: int
+
+
+@dataclass(frozen=True, slots=True)
+class PileReplaced(GameEvent):
+    player_id: int
+    card_number: int
+    card_points: int
+    pile_index: int
+    points: int
+
+
+@dataclass(frozen=True, slots=True)
+class TurnEnded(GameEvent):
+    level: ClassVar[Verbosity] = Verbosity.TURNS
+    round_number: int
+    turn_number: int
+
+
+@dataclass(frozen=True, slots=True)
+class RoundEnded(GameEvent):
+    level: ClassVar[Verbosity] = Verbosity.ROUNDS
+    round_number: int
+    # cumulative score per player id after this round
+    scores: Dict[int, int]
+
+
+class EventSink:
+    """
+    Receives the events of a Game. The game reads `level` once when the sink is set and
+    does not build events above it, so a silent sink costs nothing per move.
+    """
+
+    def __init__(self, level: Verbosity = Verbosity.MOVES):
+        self.level: Verbosity = level
+
+    def emit(self, event: GameEvent) -> None:
+        pass
+
+
+class NullSink(EventSink):
+    def __init__(self):
+        super().__init__(Verbosity.SILENT)
+
+
+class RingBufferSink(EventSink):
+    """
+    Keeps the most recent events in memory, for inspecting a game after the fact.
+    """
+
+    def __init__(self, capacity: int = 1024, level: Verbosity = Verbosity.MOVES):
+        super().__init__(level)
+        self.events: Deque[GameEvent] = deque(maxlen=capacity)
+
+    def emit(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+    def clear(self) -> None:
+        self.events.clear()
+
+    def snapshot(self) -> List[GameEvent]:
+        return list(self.events)
+
+
+class ConsoleSink(EventSink):
+    """
+    Prints the game as it is played, in the same format the game loop used to print.
+    """
+
+    def emit(self, event: GameEvent) -> None:
+        message = format_event(event)
+        if message is not None:
+            print(message)
+
+
+def format_event(event: GameEvent) -> Optional[str]:
+    if isinstance(event, CardPlayed):
+        return (
+            f"Player {event.player_id} successfully plays card {event.card_number}"
+            f", it is placed on pile {event.pile_index + 1}: {event.pile_length} "
+            f"cards, {event.pile_points} points."
+        )
+    if isinstance(event, PileTaken):
+        return (
+            "As this pile reached 6 cards, the player takes the pile."
+            f"collecting {event.points} points and placing {event.card_number} "
+            f"as new pile."
+        )
+    if isinstance(event, CardUnplayable):
+        return (
+            f"Player {event.player_id} cannot play card {event.card_number} "
+            f"and must replace a pile"
+        )
+    if isinstance(event, PileReplaced):
+        return (
+            f"They chose pile {event.pile_index} with {event.points} points, "
+            f"replacing it with card"
+            f" {event.card_number} of {event.card_points} points"
+        )
+    if isinstance(event, TurnStarted):
+        return "\n--- player moves: ---"
+    if isinstance(event, TurnEnded):
+        return "---New turn ---\n"
+    return None
@@ -0,0 +1,148 @@
+import functools
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    from src.game.rounds import Game
+
+# Game methods timed when instrumentation is on. Timers are inclusive: play_turn
+# contains the card choices, and handle_unplayable_card contains the pile choice.
+# Every state view a player gets, to decide or to learn from, is built in
+# get_personalized_game_state_for_player.
+GAME_PHASES = (
+    "play_round",
+    "play_turn",
+    "get_player_card_choice",
+    "get_player_replaces_pile_choice",
+    "get_personalized_game_state_for_player",
+    "handle_playable_card",
+    "handle_unplayable_card",
+    "apply_updates_after_turn",
+    "reset_for_next_round",
+)
+STRATEGY_DECISIONS = ("choose_card_to_play", "choose_pile_to_replace")
+
+
+@dataclass(slots=True)
+class PhaseTimer:
+    calls: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class GameStats:
+    """
+    Call counts and cumulative wall time per Game phase ("Game.play_turn") and per
+    strategy decision ("QLearningStrategy.choose_card_to_play"). Plain data, so stats
+    from worker processes can be sent back as dicts and merged.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseTimer] = {}
+        self.decisions: Dict[str, PhaseTimer] = {}
+
+    def phase(self, name: str) -> PhaseTimer:
+        return self.phases.setdefault(name, PhaseTimer())
+
+    def decision(self, name: str) -> PhaseTimer:
+        return self.decisions.setdefault(name, PhaseTimer())
+
+    def merge(self, other: "GameStats") -> "GameStats":
+        for mine, theirs in ((self.phases, other.phases), (self.decisions, other.decisions)):
+            for name, timer in theirs.items():
+                total = mine.setdefault(name, PhaseTimer())
+                total.calls += timer.calls
+                total.seconds += timer.seconds
+        return self
+
+    @classmethod
+    def merged(cls, stats: Iterable["GameStats"]) -> "GameStats":
+        total = cls()
+        for part in stats:
+            total.merge(part)
+        return total
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return {
+            "phases": {
+                name: {"calls": timer.calls, "seconds": timer.seconds}
+                for name, timer in self.phases.items()
+            },
+            "decisions": {
+                name: {"calls": timer.calls, "seconds": timer.seconds}
+                for name, timer in self.decisions.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, Dict[str, Any]]]) -> "GameStats":
+        stats = cls()
+        for name, values in data.get("phases", {}).items():
+            stats.phases[name] = PhaseTimer(values["calls"], values["seconds"])
+        for name, values in data.get("decisions", {}).items():
+            stats.decisions[name] = PhaseTimer(values["calls"], values["seconds"])
+        return stats
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_json(cls, text: str) -> "GameStats":
+        return cls.from_dict(json.loads(text))
+
+    def report(self) -> str:
+        lines: List[str] = []
+        for title, timers in (("phase", self.phases), ("decision", self.decisions)):
+            lines.append(f"{title:<56} {'calls':>10} {'total s':>10} {'mean us':>10}")
+            for name, timer in sorted(timers.items(), key=lambda item: -item[1].seconds):
+                lines.append(
+                    f"{name:<56} {timer.calls:>10} {timer.seconds:>10.3f} "
+                    f"{timer.mean_seconds * 1e6:>10.2f}"
+                )
+        return "\n".join(lines)
+
+
+def _timed(function: Callable[..., Any], timer: PhaseTimer) -> Callable[..., Any]:
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timer.calls += 1
+            timer.seconds += perf_counter() - start
+
+    return timed
+
+
+def instrument_game(game: "Game", stats: GameStats) -> None:
+    # timed wrappers are set on the instances, shadowing the class methods; nothing
+    # on the classes changes, so uninstrumented games run the plain methods
+    uninstrument_game(game)
+    for name in GAME_PHASES:
+        setattr(game, name, _timed(getattr(game, name), stats.phase(f"Game.{name}")))
+    wrapped = set()
+    for player in game.players:
+        strategy = player.strategy
+        # a strategy instance shared by several seats is wrapped once
+        if id(strategy) in wrapped:
+            continue
+        wrapped.add(id(strategy))
+        for name in STRATEGY_DECISIONS:
+            timer = stats.decision(f"{type(strategy).__name__}.{name}")
+            setattr(strategy, name, _timed(getattr(strategy, name), timer))
+
+
+def uninstrument_game(game: "Game") -> None:
+    for name in GAME_PHASES:
+        game.__dict__.pop(name, None)
+    for player in game.players:
+        for name in STRATEGY_DECISIONS:
+            player.strategy.__dict__.pop(name, None)
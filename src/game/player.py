@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Any, ClassVar, Type, Union
+from typing import TYPE_CHECKING, Dict, List, Any, ClassVar, Tuple, Type, Union
 
 if TYPE_CHECKING:
     from src.game.cards import Card
@@ -24,6 +24,8 @@ class Player:
         self.taken_cards: List[Card] = []
         self.turn_score: int = 0
         self.round_score: int = 0
+        # piles taken over the whole game, kept across rounds
+        self.piles_taken: int = 0
 
     def receive_cards(self, cards: List[Card]) -> None:
         for card in cards:
@@ -38,9 +40,11 @@ class Player:
         pile_index_to_replace = self.strategy.choose_pile_to_replace(game_state)
         return pile_index_to_replace
 
-    def take_pile(self, pile: List[Card]) -> None:
-        self.calculate_turn_score(pile)
+    def take_pile(self, pile: List[Card]) -> int:
+        points = self.calculate_turn_score(pile)
         self.taken_cards.extend(pile)
+        self.piles_taken += 1
+        return points
 
     def calculate_turn_score(self, pile: List[Card]) -> int:
         points = sum(card.card_points for card in pile)
@@ -51,6 +55,23 @@ class Player:
         self.round_score += self.turn_score
         return self.round_score
 
+    def snapshot(self) -> Tuple[Any, ...]:
+        # the cards are immutable and shared, only the containers are copied
+        return (
+            tuple(self.hand.values()),
+            tuple(self.taken_cards),
+            self.turn_score,
+            self.round_score,
+            self.piles_taken,
+        )
+
+    def restore(self, snapshot: Tuple[Any, ...]) -> None:
+        hand, taken_cards, self.turn_score, self.round_score, self.piles_taken = snapshot
+        # refilled in place, strategies and game state views hold on to these objects
+        self.hand.clear()
+        self.hand.update((card.card_number, card) for card in hand)
+        self.taken_cards[:] = taken_cards
+
     def reset_for_next_round(self) -> None:
         self.hand.clear()
         self.taken_cards.clear()
@@ -0,0 +1,252 @@
+import os
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+    from src.game.rounds import Game
+
+# A game record is a length prefix and a small header, then per round the deal and
+# per turn the chosen cards; every card and pile index is one byte:
+#
+#   uint32 length of the rest | players | rounds | piles | cards per player
+#   player ids, one byte each
+#   per round: hands (players x cards per player), starting pile cards (piles)
+#     per turn: card per seat, count of pile replacements, pile index per replacement
+#
+# Pile replacements are listed in the order they were resolved (ascending card).
+_RECORD_HEADER = struct.Struct("<IBBBB")
+MAX_RECORDED_VALUE = 255
+INDEX_SUFFIX = ".idx"
+
+
+@dataclass(frozen=True)
+class TurnRecord:
+    # card played per seat, and the replaced pile per unplayable card in resolve order
+    cards: Tuple[int, ...]
+    pile_choices: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class RoundRecord:
+    hands: Tuple[Tuple[int, ...], ...]
+    piles: Tuple[int, ...]
+    turns: Tuple[TurnRecord, ...]
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    player_ids: Tuple[int, ...]
+    amount_of_piles: int
+    amount_of_cards_per_player: int
+    rounds: Tuple[RoundRecord, ...]
+
+    def encode(self) -> bytes:
+        body = bytearray(self.player_ids)
+        for round_record in self.rounds:
+            for hand in round_record.hands:
+                body += bytes(hand)
+            body += bytes(round_record.piles)
+            for turn in round_record.turns:
+                body += bytes(turn.cards)
+                body.append(len(turn.pile_choices))
+                body += bytes(turn.pile_choices)
+        header = _RECORD_HEADER.pack(
+            _RECORD_HEADER.size - 4 + len(body),
+            len(self.player_ids),
+            len(self.rounds),
+            self.amount_of_piles,
+            self.amount_of_cards_per_player,
+        )
+        return header + bytes(body)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "GameRecord":
+        _, players, rounds, piles, cards_per_player = _RECORD_HEADER.unpack_from(data)
+        position = _RECORD_HEADER.size
+        player_ids = tuple(data[position : position + players])
+        position += players
+        round_records = []
+        for _ in range(rounds):
+            hands = []
+            for _ in range(players):
+                hands.append(tuple(data[position : position + cards_per_player]))
+                position += cards_per_player
+            pile_cards = tuple(data[position : position + piles])
+            position += piles
+            turns = []
+            for _ in range(cards_per_player):
+                cards = tuple(data[position : position + players])
+                position += players
+                choices = data[position]
+                pile_choices = tuple(data[position + 1 : position + 1 + choices])
+                position += 1 + choices
+                turns.append(TurnRecord(cards, pile_choices))
+            round_records.append(RoundRecord(tuple(hands), pile_cards, tuple(turns)))
+        return cls(player_ids, piles, cards_per_player, tuple(round_records))
+
+
+def _as_bytes(values: Sequence[int]) -> Tuple[int, ...]:
+    values = tuple(values)
+    if any(value > MAX_RECORDED_VALUE or value < 0 for value in values):
+        raise ValueError(f"Game records store values from 0 to {MAX_RECORDED_VALUE}.")
+    return values
+
+
+class GameRecorder:
+    """
+    Collects the deals and decisions of a Game as it is played; attach one with
+    Game.set_recorder. At the end of the game the record is appended to `writer`,
+    when one is given, and kept in `last_record`.
+    """
+
+    def __init__(self, writer: Optional["GameRecordWriter"] = None):
+        self.writer: Optional[GameRecordWriter] = writer
+        self.last_record: Optional[GameRecord] = None
+        self.last_index: Optional[int] = None
+        self._player_ids: Tuple[int, ...] = ()
+        self._rounds: List[RoundRecord] = []
+        self._hands: Tuple[Tuple[int, ...], ...] = ()
+        self._piles: Tuple[int, ...] = ()
+        self._turns: List[TurnRecord] = []
+        self._cards: Optional[Tuple[int, ...]] = None
+        self._pile_choices: List[int] = []
+
+    def start_game(self, game: "Game") -> None:
+        self._player_ids = _as_bytes(player.player_id for player in game.players)
+        self._rounds = []
+        self._cards = None
+
+    def record_deal(self, game: "Game") -> None:
+        self._flush_round()
+        self._hands = tuple(_as_bytes(player.hand) for player in game.players)
+        self._piles = _as_bytes(pile[0].card_number for pile in game.piles)
+        self._turns = []
+
+    def record_cards(self, cards: Sequence["Card"]) -> None:
+        # the card chosen per seat, in seat order
+        self._flush_turn()
+        self._cards = tuple(card.card_number for card in cards)
+
+    def record_pile_choice(self, pile_index: int) -> None:
+        self._pile_choices.append(pile_index)
+
+    def _flush_turn(self) -> None:
+        if self._cards is not None:
+            self._turns.append(TurnRecord(self._cards, tuple(self._pile_choices)))
+            self._cards = None
+            self._pile_choices = []
+
+    def _flush_round(self) -> None:
+        self._flush_turn()
+        if self._turns:
+            self._rounds.append(RoundRecord(self._hands, self._piles, tuple(self._turns)))
+            self._turns = []
+
+    def finish_game(self, game: "Game") -> GameRecord:
+        self._flush_round()
+        self.last_record = GameRecord(
+            player_ids=self._player_ids,
+            amount_of_piles=game.amount_of_piles,
+            amount_of_cards_per_player=game.amount_of_cards_per_player,
+            rounds=tuple(self._rounds),
+        )
+        self._rounds = []
+        if self.writer is not None:
+            self.last_index = self.writer.append(self.last_record)
+        return self.last_record
+
+
+class GameRecordWriter:
+    """
+    Appends encoded games to one file, with the byte offset of every game appended to
+    a sidecar index (`<path>.idx`, little-endian uint64) so games can be read by index.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self._data: BinaryIO = open(path, "ab")
+        self._index: BinaryIO = open(path + INDEX_SUFFIX, "ab")
+        self._count: int = os.path.getsize(path + INDEX_SUFFIX) // 8
+
+    def append(self, record: GameRecord) -> int:
+        offset = self._data.seek(0, os.SEEK_END)
+        self._data.write(record.encode())
+        self._index.write(struct.pack("<Q", offset))
+        self._count += 1
+        return self._count - 1
+
+    def flush(self) -> None:
+        # data first, so the index never points past the end of the data file
+        self._data.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self) -> "GameRecordWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def build_index(path: str) -> np.ndarray:
+    # recovers the offsets from the length prefixes when the index file is missing
+    offsets = []
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        offset = 0
+        while offset < size:
+            offsets.append(offset)
+            file.seek(offset)
+            (length,) = struct.unpack("<I", file.read(4))
+            offset += 4 + length
+    index = np.array(offsets, dtype="<u8")
+    index.tofile(path + INDEX_SUFFIX)
+    return index
+
+
+class GameRecordReader:
+    """
+    Random access to the games in a record file: reader[i] reads and decodes only
+    game i.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        if os.path.exists(path + INDEX_SUFFIX):
+            self.offsets: np.ndarray = np.fromfile(path + INDEX_SUFFIX, dtype="<u8")
+        else:
+            self.offsets = build_index(path)
+        self._file: BinaryIO = open(path, "rb")
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def read_bytes(self, game_index: int) -> bytes:
+        self._file.seek(int(self.offsets[game_index]))
+        prefix = self._file.read(4)
+        (length,) = struct.unpack("<I", prefix)
+        return prefix + self._file.read(length)
+
+    def __getitem__(self, game_index: int) -> GameRecord:
+        return GameRecord.decode(self.read_bytes(game_index))
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        for game_index in range(len(self)):
+            yield self[game_index]
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "GameRecordReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from src.game.cards import card_points_table
+from src.game.records import GameRecord, RoundRecord
+
+
+@dataclass(frozen=True)
+class ReplayState:
+    """
+    The table after `turns_played` turns of round `round_index`, per seat in record
+    order. round_points are the points taken this round, total_points include them.
+    """
+
+    round_index: int
+    turns_played: int
+    piles: Tuple[Tuple[int, ...], ...]
+    hands: Tuple[Tuple[int, ...], ...]
+    round_points: Tuple[int, ...]
+    total_points: Tuple[int, ...]
+
+
+class Replay:
+    """
+    Rebuilds the table of a recorded game by applying the recorded cards and pile
+    choices straight to the pile rules, on card numbers only: no strategies, no deck
+    and no Card objects are involved.
+    """
+
+    def __init__(self, record: GameRecord):
+        self.record: GameRecord = record
+        max_card = max(
+            (max(max(hand) for hand in round_record.hands) for round_record in record.rounds),
+            default=0,
+        )
+        self.points: Tuple[int, ...] = card_points_table(max(max_card, 103))
+        # cumulative points per seat before each round, filled in as rounds are replayed
+        self._totals_before: List[Tuple[int, ...]] = [(0,) * len(record.player_ids)]
+
+    def _play_turn(
+        self,
+        piles: List[List[int]],
+        pile_points: List[int],
+        cards: Tuple[int, ...],
+        pile_choices: Tuple[int, ...],
+        round_points: List[int],
+    ) -> None:
+        points = self.points
+        choices = iter(pile_choices)
+        for card_number, seat in sorted(zip(cards, range(len(cards)), strict=True)):
+            # the pile with the highest top below the card, -1 when there is none
+            pile_index, best_top = -1, 0
+            for index, pile in enumerate(piles):
+                top = pile[-1]
+                if best_top < top < card_number:
+                    pile_index, best_top = index, top
+            if pile_index < 0:
+                pile_index = next(choices)
+                round_points[seat] += pile_points[pile_index]
+                piles[pile_index] = [card_number]
+                pile_points[pile_index] = points[card_number]
+                continue
+            pile = piles[pile_index]
+            pile.append(card_number)
+            if len(pile) > 5:
+                round_points[seat] += pile_points[pile_index]
+                piles[pile_index] = [card_number]
+                pile_points[pile_index] = points[card_number]
+            else:
+                pile_points[pile_index] += points[card_number]
+
+    def _replay_round(
+        self, round_record: RoundRecord, turns_played: int
+    ) -> Tuple[List[List[int]], List[int]]:
+        piles = [[card_number] for card_number in round_record.piles]
+        pile_points = [self.points[card_number] for card_number in round_record.piles]
+        round_points = [0] * len(self.record.player_ids)
+        for turn in round_record.turns[:turns_played]:
+            self._play_turn(piles, pile_points, turn.cards, turn.pile_choices, round_points)
+        return piles, round_points
+
+    def _totals_before_round(self, round_index: int) -> Tuple[int, ...]:
+        while len(self._totals_before) <= round_index:
+            completed = len(self._totals_before) - 1
+            round_record = self.record.rounds[completed]
+            _, round_points = self._replay_round(round_record, len(round_record.turns))
+            self._totals_before.append(
+                tuple(
+                    total + points
+                    for total, points in zip(
+                        self._totals_before[completed], round_points, strict=True
+                    )
+                )
+            )
+        return self._totals_before[round_index]
+
+    def state_at(self, round_index: int, turns_played: Optional[int] = None) -> ReplayState:
+        # turns_played=None replays the whole round
+        round_record = self.record.rounds[round_index]
+        turns = round_record.turns
+        turns_played = len(turns) if turns_played is None else turns_played
+        if not 0 <= turns_played <= len(turns):
+            raise ValueError(f"Round {round_index} has {len(turns)} turns.")
+
+        piles, round_points = self._replay_round(round_record, turns_played)
+        played = [set() for _ in round_record.hands]
+        for turn in turns[:turns_played]:
+            for seat, card_number in enumerate(turn.cards):
+                played[seat].add(card_number)
+        totals_before = self._totals_before_round(round_index)
+        return ReplayState(
+            round_index=round_index,
+            turns_played=turns_played,
+            piles=tuple(tuple(pile) for pile in piles),
+            hands=tuple(
+                tuple(sorted(set(hand) - played_cards))
+                for hand, played_cards in zip(round_record.hands, played, strict=True)
+            ),
+            round_points=tuple(round_points),
+            total_points=tuple(
+                total + points
+                for total, points in zip(totals_before, round_points, strict=True)
+            ),
+        )
+
+    def final_scores(self) -> Tuple[int, ...]:
+        if not self.record.rounds:
+            return self._totals_before[0]
+        return self._totals_before_round(len(self.record.rounds))
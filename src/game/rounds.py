@@ -1,10 +1,39 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.game.cards import Card
     from src.game.player import Player
 
-from src.game.cards import Deck
+from src.game.cards import Deck, DeckSnapshot
+from src.game.events import (
+    CardPlayed,
+    CardUnplayable,
+    ConsoleSink,
+    EventSink,
+    PileReplaced,
+    PileTaken,
+    RoundEnded,
+    TurnEnded,
+    TurnStarted,
+    Verbosity,
+)
+from src.game.instrumentation import GameStats, instrument_game, uninstrument_game
+from src.game.records import GameRecorder
+from src.game.state import GameState, GameStateView
+from src.strategies.base_strategy import BaseStrategy
+
+
+class GameSnapshot(NamedTuple):
+    """
+    The mutable part of a Game at one moment; cards are shared, not copied. Strategy
+    internals (Q-tables, random generators) are not part of it.
+    """
+
+    state: Tuple[Any, ...]
+    deck: DeckSnapshot
+    players: Tuple[Tuple[Any, ...], ...]
+    scores_per_player_per_turn: Tuple[Tuple[int, ...], ...]
+    scores_per_player_per_round: Tuple[Tuple[int, ...], ...]
 
 
 class Game:
@@ -37,22 +66,100 @@ class Game:
         amount_of_rounds: Optional[int] = 5,
         amount_of_piles: Optional[int] = 4,
         amount_of_cards_per_player: Optional[int] = 10,
+        event_sink: Optional[EventSink] = None,
+        recorder: Optional[GameRecorder] = None,
+        deck_seed: Optional[int] = None,
     ):
-        self.deck: Deck = Deck()
+        self.deck: Deck = Deck(seed=deck_seed)
         self.players: List["Player"] = players
+        self.players_by_id: Dict[int, "Player"] = {
+            player.player_id: player for player in players
+        }
         self.plays_per_player: Dict[int, List[int]] = {
             player.player_id: [] for player in players
         }
         self.amount_of_rounds: int = amount_of_rounds
         self.amount_of_piles: int = amount_of_piles
         self.amount_of_cards_per_player: int = amount_of_cards_per_player
-        self.piles: List[List[Card]] = [[] for _ in range(self.amount_of_piles)]
         self.scores_per_player_per_turn: Dict[int, List[int]] = {
             player.player_id: [0 for _ in range(self.amount_of_rounds)] for player in players
         }
         self.scores_per_player_per_round: Dict[int, List[int]] = {
             player.player_id: [0 for _ in range(self.amount_of_rounds)] for player in players
         }
+        self.state: GameState = GameState(
+            total_players=len(players),
+            cards_per_player=self.amount_of_cards_per_player,
+            total_piles=self.amount_of_piles,
+            total_rounds=self.amount_of_rounds,
+            points_per_player_per_turn=self.scores_per_player_per_turn,
+            points_per_player_per_round=self.scores_per_player_per_round,
+        )
+        # the state owns the pile lists; Game changes them through the state
+        self.piles: List[List[Card]] = self.state.piles
+        # every player's points this round when the current turn started
+        self.turn_start_scores: Dict[int, int] = dict.fromkeys(self.players_by_id, 0)
+        # only learning strategies need the state from before the turn
+        self.learning_players: List["Player"] = [
+            player for player in players if player.strategy.learns
+        ]
+        self.set_event_sink(event_sink if event_sink is not None else ConsoleSink())
+        self.stats: Optional[GameStats] = None
+        self.recorder: Optional[GameRecorder] = recorder
+
+    def set_event_sink(self, event_sink: EventSink) -> None:
+        # the levels are read once here so a silent sink skips event creation entirely
+        self.event_sink: EventSink = event_sink
+        self._emit_moves: bool = event_sink.level >= Verbosity.MOVES
+        self._emit_turns: bool = event_sink.level >= Verbosity.TURNS
+        self._emit_rounds: bool = event_sink.level >= Verbosity.ROUNDS
+
+    def snapshot(self) -> GameSnapshot:
+        # for lookahead and debugging: restore() rolls the table back to this point
+        return GameSnapshot(
+            state=self.state.snapshot(),
+            deck=self.deck.snapshot(),
+            players=tuple(player.snapshot() for player in self.players),
+            scores_per_player_per_turn=tuple(
+                tuple(self.scores_per_player_per_turn[player.player_id])
+                for player in self.players
+            ),
+            scores_per_player_per_round=tuple(
+                tuple(self.scores_per_player_per_round[player.player_id])
+                for player in self.players
+            ),
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        self.deck.restore(snapshot.deck)
+        self.state.restore(snapshot.state)
+        for player, player_snapshot, turn_scores, round_scores in zip(
+            self.players,
+            snapshot.players,
+            snapshot.scores_per_player_per_turn,
+            snapshot.scores_per_player_per_round,
+            strict=True,
+        ):
+            player.restore(player_snapshot)
+            # the score lists are shared with the state, so they are refilled in place
+            self.scores_per_player_per_turn[player.player_id][:] = turn_scores
+            self.scores_per_player_per_round[player.player_id][:] = round_scores
+
+    def set_recorder(self, recorder: Optional[GameRecorder]) -> None:
+        # records the deals and decisions of the next play_game, None stops recording
+        self.recorder = recorder
+
+    def enable_instrumentation(self, stats: Optional[GameStats] = None) -> GameStats:
+        # times the game phases and strategy decisions into `stats`; when it is off the
+        # game runs its plain methods, so there is no cost at all
+        self.stats = stats if stats is not None else GameStats()
+        instrument_game(self, self.stats)
+        return self.stats
+
+    def disable_instrumentation(self) -> Optional[GameStats]:
+        uninstrument_game(self)
+        stats, self.stats = self.stats, None
+        return stats
 
     def initialize_game(self) -> None:
         # give each player their cards
@@ -63,68 +170,51 @@ class Game:
         for i in range(self.amount_of_piles):
             card = self.deck.draw_card()
             self.piles[i].append(card)
+        self.state.start_round(self.deck)
+
+    @property
+    def round_number(self) -> int:
+        return self.state.round_number
+
+    @round_number.setter
+    def round_number(self, round_number: int) -> None:
+        self.state.round_number = round_number
+
+    @property
+    def turn_number(self) -> int:
+        return self.state.turn_number
+
+    @turn_number.setter
+    def turn_number(self, turn_number: int) -> None:
+        self.state.turn_number = turn_number
 
     def get_last_cards_per_pile(self) -> List[Card]:
-        last_cards = []
-        for pile in self.piles:
-            if pile:
-                last_cards.append(pile[-1])
-        return last_cards
+        return list(self.state.last_cards_per_pile)
 
     def get_played_cards(self) -> List[Card]:
-        played_cards = []
-        for pile in self.piles:
-            played_cards.extend(pile)
-        return played_cards
+        return list(self.state.played_cards)
 
     def get_current_turn_number(self) -> int:
-        return self.amount_of_rounds - sum(
-            1
-            for round_scores in self.scores_per_player_per_round[
-                list(self.scores_per_player_per_round.keys())[0]
-            ]
-            if round_scores == 0
-        )
+        return self.state.turn_number
 
     def get_current_round_number(self) -> int:
-        return self.amount_of_rounds - sum(
-            1
-            for round_scores in self.scores_per_player_per_round[
-                list(self.scores_per_player_per_round.keys())[0]
-            ]
-            if round_scores == 0
-        )
+        return self.state.round_number
 
     def provide_game_state_to_player(
         self, cards_played: Optional[List[Card]] = None
-    ) -> Dict[str, Any]:
-        game_state = {
-            "total_players": len(self.players),
-            "min_card": min(self.deck.cards.keys()) if self.deck.cards else None,
-            "max_card": max(self.deck.cards.keys()) if self.deck.cards else None,
-            "cards_per_player": self.amount_of_cards_per_player,
-            "total_piles": self.amount_of_piles,
-            "total_rounds": self.amount_of_rounds,
-            "played_cards": self.get_played_cards(),
-            "last_cards_per_pile": self.get_last_cards_per_pile(),
-            "piles": self.piles,
-            "points_per_pile": [
-                sum(card.card_points for card in pile) for pile in self.piles
-            ],
-            "points_per_player_per_turn": self.scores_per_player_per_turn,
-            "points_per_player_per_round": self.scores_per_player_per_round,
-            "current_turn_number": (self.amount_of_rounds - self.get_current_turn_number()),
-            "current_round_number": self.get_current_round_number(),
-            "cards_played": cards_played,
-        }
-        return game_state
+    ) -> GameStateView:
+        return GameStateView(self.state, cards_played=cards_played)
 
     def get_player_card_choice(self) -> Dict[int, Card]:
         player_moves = {}
         for player in self.players:
-            game_state = self.provide_game_state_to_player()
+            game_state = self.get_personalized_game_state_for_player(player)
             chosen_card = player.choose_card_to_play(game_state)
+            # the chosen card leaves the hand so it cannot be played twice
+            player.hand.pop(chosen_card.card_number)
             player_moves[player.player_id] = chosen_card
+        if self.recorder is not None:
+            self.recorder.record_cards(list(player_moves.values()))
         return player_moves
 
     def get_player_replaces_pile_choice(
@@ -132,98 +222,112 @@ class Game:
         player_id: int,
         cards_played: List[Card],
     ) -> int:
-        player = next(p for p in self.players if p.player_id == player_id)
-        game_state = self.provide_game_state_to_player(cards_played)
+        player = self.players_by_id[player_id]
+        game_state = self.get_personalized_game_state_for_player(player, cards_played)
         chosen_pile_index = player.choose_pile_to_replace(game_state)
         return chosen_pile_index
 
     def get_players_turn_score(self) -> None:
         for player in self.players:
             player_index = player.player_id
-            self.scores_per_player_per_turn[player_index][
-                self.get_current_turn_number() - 1
-            ] = player.turn_score
+            self.scores_per_player_per_turn[player_index][self.get_current_round_number()] = (
+                player.turn_score
+            )
 
     def check_if_card_playable(
         self,
         card_number: int,
     ) -> bool:
-        last_cards_per_pile = self.get_last_cards_per_pile()
-        for last_card in last_cards_per_pile:
-            if card_number > last_card.card_number:
-                return True
-        return False
+        return self.state.pile_for_card(card_number) is not None
 
     def handle_unplayable_card(
         self,
         player_id: int,
         card_number: Card,
         player_moves: Dict[int, Card],
+        chosen_pile_index: Optional[int] = None,
     ) -> int:
-        player = next(p for p in self.players if p.player_id == player_id)
-        # player must replace a pile
-        chosen_pile_index = self.get_player_replaces_pile_choice(
-            player_id, list(player_moves.values())
-        )
+        player = self.players_by_id[player_id]
+        # player must replace a pile, unless the caller already asked which one
+        if chosen_pile_index is None:
+            chosen_pile_index = self.get_player_replaces_pile_choice(
+                player_id, list(player_moves.values())
+            )
+        if self.recorder is not None:
+            self.recorder.record_pile_choice(chosen_pile_index)
         # player takes the pile
-        taken_pile = self.piles[chosen_pile_index]
-        sum_points = sum(card.card_points for card in taken_pile)
-        player.take_pile(taken_pile)
-        self.piles[chosen_pile_index] = [card_number]
+        taken_pile = self.state.restart_pile(chosen_pile_index, card_number)
+        sum_points = player.take_pile(taken_pile)
         return chosen_pile_index, sum_points
 
     def handle_playable_card(
         self,
         player_id: int,
         card: Card,
+        chosen_pile_index: Optional[int] = None,
     ) -> None:
-        valid_piles = [
-            (i, pile[-1])
-            for i, pile in enumerate(self.piles)
-            if pile and pile[-1].card_number < card.card_number
-        ]
-        chosen_pile_index = max(valid_piles, key=lambda x: x[-1].card_number)[0]
+        # the pile with the highest last card below the played card, unless the caller
+        # already looked it up
+        if chosen_pile_index is None:
+            chosen_pile_index = self.state.pile_for_card(card.card_number)
         # place the card on the chosen pile
-        self.piles[chosen_pile_index].append(card)
-        chosen_pile = chosen_pile_index + 1  # for user-friendly display
-        pile_points = sum(c.card_points for c in self.piles[chosen_pile_index])
-        print(
-            f"Player {player_id} successfully plays card {card.card_number}"
-            f", it is placed on pile {chosen_pile}: {len(self.piles[chosen_pile_index])} "
-            f"cards, {pile_points} points."
-        )
-        if len(self.piles[chosen_pile_index]) > 5:
-            # pile reached 6 cards, player takes the pile
-            print(
-                "As this pile reached 6 cards, the player takes the pile."
-                f"collecting {pile_points} points and placing {card.card_number} "
-                f"as new pile."
+        pile_length = self.state.place_card(chosen_pile_index, card)
+        if self._emit_moves:
+            self.event_sink.emit(
+                CardPlayed(
+                    player_id=player_id,
+                    card_number=card.card_number,
+                    pile_index=chosen_pile_index,
+                    pile_length=pile_length,
+                    pile_points=self.state.pile_points(chosen_pile_index),
+                )
             )
+        if pile_length > 5:
+            # pile reached 6 cards, player takes the pile and the played card starts
+            # a new one
+            player = self.players_by_id[player_id]
+            taken_pile = self.state.restart_pile(chosen_pile_index, card)[:-1]
+            points = player.take_pile(taken_pile)
+            if self._emit_moves:
+                self.event_sink.emit(
+                    PileTaken(
+                        player_id=player_id,
+                        card_number=card.card_number,
+                        pile_index=chosen_pile_index,
+                        points=points,
+                    )
+                )
 
-            player = next(p for p in self.players if p.player_id == player_id)
-            taken_pile = self.piles[chosen_pile_index][:-1]
-            player.take_pile(taken_pile)
-            # start a new pile with the played card
-            self.piles[chosen_pile_index] = [card]
+    def states_before_turn(self) -> Dict[int, Dict[str, Any]]:
+        for player in self.players:
+            self.turn_start_scores[player.player_id] = player.turn_score
+        return {
+            player.player_id: self.get_personalized_game_state_for_player(player).freeze()
+            for player in self.learning_players
+        }
+
+    def finish_turn(
+        self,
+        current_personalised_game_states: Dict[int, Dict[str, Any]],
+        player_moves: Dict[int, Card],
+    ) -> None:
+        # add code that reports what happened this turn
+        self.get_players_turn_score()
+        self.apply_updates_after_turn(
+            current_personalised_game_states,
+            player_moves,
+        )
+
+        if self._emit_turns:
+            self.event_sink.emit(TurnEnded(self.round_number, self.turn_number))
+        self.turn_number += 1
 
     def play_turn(self) -> None:
-        current_personalised_game_states = {
-            player.player_id: self.provide_game_state_to_player().update(
-                {
-                    "player_hand": tuple(
-                        sorted(
-                            (card.card_number, card.card_points)
-                            for card in player.hand.values()
-                        )
-                    )
-                }
-            )
-            for player in self.players
-        }
+        current_personalised_game_states = self.states_before_turn()
         player_moves = self.get_player_card_choice()
         # process player moves and update piles accordingly
-        print("\n--- player moves: ---")
-        # print(player_moves)
+        if self._emit_turns:
+            self.event_sink.emit(TurnStarted(self.round_number, self.turn_number))
         # sort cards on card number
         sorted_cards = sorted(
             player_moves.items(),
@@ -231,56 +335,53 @@ class Game:
         )
 
         for player_id, card in sorted_cards:
-            if not self.check_if_card_playable(
-                card.card_number,
-            ):
-                print(
-                    f"Player {player_id} cannot play card {card.card_number} "
-                    f"and must replace a pile"
-                )
+            # one lookup per card in the sorted pile tops decides playable and pile
+            pile_index = self.state.pile_for_card(card.card_number)
+            if pile_index is None:
+                if self._emit_moves:
+                    self.event_sink.emit(CardUnplayable(player_id, card.card_number))
                 chosen_pile, pile_points = self.handle_unplayable_card(
                     player_id,
                     card,
                     player_moves,
                 )
-                print(
-                    f"They chose pile {chosen_pile} with {pile_points} points, "
-                    f"replacing it with card"
-                    f" {card.card_number} of {card.card_points} points"
-                )
+                if self._emit_moves:
+                    self.event_sink.emit(
+                        PileReplaced(
+                            player_id=player_id,
+                            card_number=card.card_number,
+                            card_points=card.card_points,
+                            pile_index=chosen_pile,
+                            points=pile_points,
+                        )
+                    )
             else:
                 # find the pile with the highest last card that is
                 # still lower than the played card
                 self.handle_playable_card(
                     player_id,
                     card,
+                    pile_index,
                 )
 
-        # add code that reports what happened this turn
-        self.get_players_turn_score()
-        self.apply_updates_after_turn(
-            current_personalised_game_states,
-            player_moves,
-        )
-
-        print("---New turn ---\n")
+        self.finish_turn(current_personalised_game_states, player_moves)
 
     def compute_player_rewards(self) -> Dict[int, int]:
         rewards = {}
         for player in self.players:
-            # negative reward for points collected this turn
-            rewards[player.player_id] = -player.turn_score
+            # negative reward for points collected this turn; turn_score runs over
+            # the whole round
+            rewards[player.player_id] = -(
+                player.turn_score - self.turn_start_scores[player.player_id]
+            )
         return rewards
 
     def get_personalized_game_state_for_player(
         self,
         player: "Player",
-    ) -> Dict[str, Any]:
-        game_state = self.provide_game_state_to_player()
-        game_state["player_hand"] = tuple(
-            sorted((card.card_number, card.card_points) for card in player.hand.values())
-        )
-        return game_state
+        cards_played: Optional[List[Card]] = None,
+    ) -> GameStateView:
+        return GameStateView(self.state, player, cards_played)
 
     def apply_updates_after_turn(
         self,
@@ -288,12 +389,14 @@ class Game:
         _player_moves: Dict[int, Card],
     ) -> None:
         player_moves: Dict[int, Tuple[int, int]] = {
-            player_id: tuple(card.card_number, card.card_points)
+            player_id: (card.card_number, card.card_points)
             for player_id, card in _player_moves.items()
         }
         per_player_reward = self.compute_player_rewards()
-        for player in self.players:
-            next_personalised_game_state = self.get_personalized_game_state_for_player(player)
+        for player in self.learning_players:
+            next_personalised_game_state = self.get_personalized_game_state_for_player(
+                player
+            ).freeze()
             player.strategy.update(
                 state=current_personalised_game_states[player.player_id],
                 action=player_moves[player.player_id],
@@ -302,26 +405,50 @@ class Game:
                 possible_actions=list(player.hand.values()),
             )
 
-    def play_round(self) -> None:
-        for _ in range(self.amount_of_cards_per_player):
-            self.play_turn()
+    def start_round(self) -> None:
+        self.turn_number = 0
+        if self.recorder is not None:
+            self.recorder.record_deal(self)
+
+    def finish_round(self) -> None:
         # calculate scores for each player and store them in scores_per_player_per_round
-        for player_index, player in enumerate(self.players):
-            self.scores_per_player_per_round[player_index][self.amount_of_rounds - 1] = (
+        for player in self.players:
+            self.scores_per_player_per_round[player.player_id][self.round_number] = (
                 player.calculate_round_score()
             )
+        if self._emit_rounds:
+            self.event_sink.emit(
+                RoundEnded(
+                    round_number=self.round_number,
+                    scores={
+                        player_id: scores[self.round_number]
+                        for player_id, scores in self.scores_per_player_per_round.items()
+                    },
+                )
+            )
+        self.round_number += 1
+
+    def play_round(self) -> None:
+        self.start_round()
+        for _ in range(self.amount_of_cards_per_player):
+            self.play_turn()
+        self.finish_round()
 
     def reset_for_next_round(self) -> None:
         # shuffle deck
-        self.deck = Deck()
+        self.deck.reset()
         # reset piles and players for next round
-        self.piles = [[] for _ in range(self.amount_of_piles)]
+        self.state.clear_piles()
         for player in self.players:
             player.reset_for_next_round()
         self.initialize_game()
 
     def play_game(self) -> None:
+        if self.recorder is not None:
+            self.recorder.start_game(self)
         self.initialize_game()
         for _ in range(self.amount_of_rounds):
             self.play_round()
             self.reset_for_next_round()
+        if self.recorder is not None:
+            self.recorder.finish_game(self)
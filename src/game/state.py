@@ -0,0 +1,276 @@
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.game.cards import Card, Deck
+    from src.game.player import Player
+
+# marks a lazily computed field that has not been computed since the last change
+_UNSET: Any = object()
+
+
+class GameState:
+    """
+    The public table state, owned by Game and updated in place as cards are placed.
+
+    The piles and the per-pile points are maintained incrementally; tuples handed to
+    strategies and the fields derived from the deck are computed on first use and
+    cached until the piles or the deck change again.
+    """
+
+    __slots__ = (
+        "total_players",
+        "cards_per_player",
+        "total_piles",
+        "total_rounds",
+        "piles",
+        "points_per_player_per_turn",
+        "points_per_player_per_round",
+        "round_number",
+        "turn_number",
+        "deck",
+        "seen_mask",
+        "_last_cards",
+        "_sorted_tops",
+        "_pile_of_top",
+        "_points_per_pile",
+        "_pile_tuples",
+        "_piles_tuple",
+        "_last_cards_tuple",
+        "_points_tuple",
+        "_played_cards",
+        "_min_card",
+        "_max_card",
+    )
+
+    def __init__(
+        self,
+        total_players: int,
+        cards_per_player: int,
+        total_piles: int,
+        total_rounds: int,
+        points_per_player_per_turn: Dict[int, List[int]],
+        points_per_player_per_round: Dict[int, List[int]],
+    ):
+        self.total_players: int = total_players
+        self.cards_per_player: int = cards_per_player
+        self.total_piles: int = total_piles
+        self.total_rounds: int = total_rounds
+        self.piles: List[List[Card]] = [[] for _ in range(total_piles)]
+        self.points_per_player_per_turn: Dict[int, List[int]] = points_per_player_per_turn
+        self.points_per_player_per_round: Dict[int, List[int]] = points_per_player_per_round
+        self.round_number: int = 0
+        self.turn_number: int = 0
+        self.deck: Optional[Deck] = None
+        # bit n is set once card n has been revealed on a pile this round
+        self.seen_mask: int = 0
+        self._last_cards: List[Optional[Card]] = [None] * total_piles
+        # top card numbers in ascending order, and the pile each top card is on
+        self._sorted_tops: List[int] = []
+        self._pile_of_top: Dict[int, int] = {}
+        self._points_per_pile: List[int] = [0] * total_piles
+        self._pile_tuples: List[Optional[Tuple[Card, ...]]] = [None] * total_piles
+        self._invalidate()
+        self._min_card: Any = _UNSET
+        self._max_card: Any = _UNSET
+
+    def _invalidate(self) -> None:
+        self._piles_tuple: Any = _UNSET
+        self._last_cards_tuple: Any = _UNSET
+        self._points_tuple: Any = _UNSET
+        self._played_cards: Any = _UNSET
+
+    def start_round(self, deck: "Deck") -> None:
+        # piles were just dealt, so everything derived is rebuilt once
+        self.deck = deck
+        self._min_card = _UNSET
+        self._max_card = _UNSET
+        self.seen_mask = 0
+        self._sorted_tops.clear()
+        self._pile_of_top.clear()
+        for pile_index, pile in enumerate(self.piles):
+            self._last_cards[pile_index] = pile[-1] if pile else None
+            if pile:
+                insort(self._sorted_tops, pile[-1].card_number)
+                self._pile_of_top[pile[-1].card_number] = pile_index
+            self._points_per_pile[pile_index] = sum(card.card_points for card in pile)
+            self._pile_tuples[pile_index] = None
+            for card in pile:
+                self.seen_mask |= 1 << card.card_number
+        self._invalidate()
+
+    def snapshot(self) -> Tuple[Tuple[Tuple["Card", ...], ...], int, int, int]:
+        # piles_view is cached, so this is free when the piles did not change
+        return (self.piles_view, self.round_number, self.turn_number, self.seen_mask)
+
+    def restore(self, snapshot: Tuple[Tuple[Tuple["Card", ...], ...], int, int, int]) -> None:
+        # the deck must be restored first, the cached deck fields are rebuilt from it
+        piles, round_number, turn_number, seen_mask = snapshot
+        for pile_index, pile in enumerate(piles):
+            self.piles[pile_index] = list(pile)
+        self.start_round(self.deck)
+        self.round_number = round_number
+        self.turn_number = turn_number
+        self.seen_mask = seen_mask
+
+    def clear_piles(self) -> None:
+        for pile in self.piles:
+            pile.clear()
+        self.start_round(self.deck)
+
+    def pile_for_card(self, card_number: int) -> Optional[int]:
+        # the pile with the highest top below the card, None when the card is below all
+        position = bisect_left(self._sorted_tops, card_number)
+        if position == 0:
+            return None
+        return self._pile_of_top[self._sorted_tops[position - 1]]
+
+    def _replace_top(self, pile_index: int, card: "Card") -> None:
+        old_top = self._last_cards[pile_index]
+        if old_top is not None:
+            del self._pile_of_top[old_top.card_number]
+            self._sorted_tops.pop(bisect_left(self._sorted_tops, old_top.card_number))
+        insort(self._sorted_tops, card.card_number)
+        self._pile_of_top[card.card_number] = pile_index
+        self._last_cards[pile_index] = card
+
+    def place_card(self, pile_index: int, card: "Card") -> int:
+        pile = self.piles[pile_index]
+        pile.append(card)
+        self.seen_mask |= 1 << card.card_number
+        self._replace_top(pile_index, card)
+        self._points_per_pile[pile_index] += card.card_points
+        self._pile_tuples[pile_index] = None
+        self._invalidate()
+        return len(pile)
+
+    def restart_pile(self, pile_index: int, card: "Card") -> List["Card"]:
+        # the pile is replaced by a single card; the old cards are returned to be taken
+        taken = self.piles[pile_index]
+        self.piles[pile_index] = [card]
+        self.seen_mask |= 1 << card.card_number
+        self._replace_top(pile_index, card)
+        self._points_per_pile[pile_index] = card.card_points
+        self._pile_tuples[pile_index] = None
+        self._invalidate()
+        return taken
+
+    def pile_points(self, pile_index: int) -> int:
+        return self._points_per_pile[pile_index]
+
+    @property
+    def piles_view(self) -> Tuple[Tuple["Card", ...], ...]:
+        if self._piles_tuple is _UNSET:
+            pile_tuples = self._pile_tuples
+            for pile_index, pile in enumerate(self.piles):
+                if pile_tuples[pile_index] is None:
+                    pile_tuples[pile_index] = tuple(pile)
+            self._piles_tuple = tuple(pile_tuples)
+        return self._piles_tuple
+
+    @property
+    def last_cards_per_pile(self) -> Tuple["Card", ...]:
+        if self._last_cards_tuple is _UNSET:
+            self._last_cards_tuple = tuple(card for card in self._last_cards if card)
+        return self._last_cards_tuple
+
+    @property
+    def points_per_pile(self) -> Tuple[int, ...]:
+        if self._points_tuple is _UNSET:
+            self._points_tuple = tuple(self._points_per_pile)
+        return self._points_tuple
+
+    @property
+    def played_cards(self) -> Tuple["Card", ...]:
+        if self._played_cards is _UNSET:
+            self._played_cards = tuple(card for pile in self.piles_view for card in pile)
+        return self._played_cards
+
+    @property
+    def min_card(self) -> Optional[int]:
+        if self._min_card is _UNSET:
+            self._min_card = self.deck.min_card() if self.deck is not None else None
+        return self._min_card
+
+    @property
+    def max_card(self) -> Optional[int]:
+        if self._max_card is _UNSET:
+            self._max_card = self.deck.max_card() if self.deck is not None else None
+        return self._max_card
+
+
+# game state keys that read straight from a GameState attribute or property
+_STATE_ATTRIBUTES: Dict[str, str] = {
+    "total_players": "total_players",
+    "min_card": "min_card",
+    "max_card": "max_card",
+    "cards_per_player": "cards_per_player",
+    "total_piles": "total_piles",
+    "total_rounds": "total_rounds",
+    "played_cards": "played_cards",
+    "last_cards_per_pile": "last_cards_per_pile",
+    "piles": "piles_view",
+    "points_per_pile": "points_per_pile",
+    "points_per_player_per_turn": "points_per_player_per_turn",
+    "points_per_player_per_round": "points_per_player_per_round",
+    "current_turn_number": "turn_number",
+    "current_round_number": "round_number",
+    "seen_cards_mask": "seen_mask",
+}
+
+
+class GameStateView(Mapping):
+    """
+    Read-only, dict-like view of a GameState handed to strategies; it reads the live
+    state, so creating one per decision costs O(1). Use freeze() to keep a copy that
+    does not change as the game continues.
+    """
+
+    __slots__ = ("_state", "_player", "_cards_played", "_player_hand")
+
+    keys_in_order: Tuple[str, ...] = tuple(_STATE_ATTRIBUTES) + ("cards_played",)
+
+    def __init__(
+        self,
+        state: GameState,
+        player: Optional["Player"] = None,
+        cards_played: Optional[List["Card"]] = None,
+    ):
+        self._state: GameState = state
+        self._player: Optional[Player] = player
+        self._cards_played: Optional[List[Card]] = cards_played
+        self._player_hand: Optional[Tuple[Tuple[int, int], ...]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        attribute = _STATE_ATTRIBUTES.get(key)
+        if attribute is not None:
+            return getattr(self._state, attribute)
+        if key == "cards_played":
+            return self._cards_played
+        if key == "player_hand" and self._player is not None:
+            if self._player_hand is None:
+                # the hand dict is kept sorted by card number
+                self._player_hand = tuple(
+                    (card_number, card.card_points)
+                    for card_number, card in self._player.hand.items()
+                )
+            return self._player_hand
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.keys_in_order
+        if self._player is not None:
+            yield "player_hand"
+
+    def __len__(self) -> int:
+        return len(self.keys_in_order) + (self._player is not None)
+
+    def freeze(self) -> Dict[str, Any]:
+        # the cached tuples are immutable already, only the score lists need copying
+        frozen = dict(self)
+        for key in ("points_per_player_per_turn", "points_per_player_per_round"):
+            frozen[key] = {
+                player_id: tuple(scores) for player_id, scores in frozen[key].items()
+            }
+        return frozen
@@ -0,0 +1,25 @@
+import argparse
+from typing import List, Optional
+
+from src.results.store import ResultsStore, aggregate
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.results",
+        description="Per-strategy aggregates over a results store.",
+    )
+    parser.add_argument("path", type=str, help="results store directory")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.path)
+    print(f"{len(store)} games, {store.seats} seats, {store.rounds} rounds")
+    for name, total in aggregate(store).items():
+        print(
+            f"{name}: mean score {total.mean_score:.2f} (std {total.score_std:.2f}), "
+            f"win rate {total.win_rate:.3f}, piles taken {total.mean_pile_takes:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+MANIFEST_NAME = "manifest.json"
+STORE_VERSION = 1
+
+# column name -> dtype; shapes per row are () for seed, (seats,) for the per-seat
+# columns and (seats, rounds) for round_scores
+COLUMN_DTYPES: Dict[str, str] = {
+    "seed": "<u8",
+    "strategy": "u1",
+    "round_scores": "<i2",
+    "final_scores": "<i2",
+    "pile_takes": "<u2",
+}
+
+
+def _column_shape(name: str, seats: int, rounds: int) -> tuple:
+    if name == "seed":
+        return ()
+    if name == "round_scores":
+        return (seats, rounds)
+    return (seats,)
+
+
+class ResultsWriter:
+    """
+    Appends one row per game to a results directory. Rows are buffered in NumPy
+    arrays and written as one .npy file per column per chunk of chunk_rows games; the
+    manifest is rewritten after every chunk, so a reader only ever sees whole chunks.
+    Opening an existing directory appends new chunks to it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        seats: int,
+        rounds: int,
+        chunk_rows: int = 262_144,
+    ):
+        self.path: str = path
+        os.makedirs(path, exist_ok=True)
+        self.manifest: Dict = _read_manifest(path) or {
+            "version": STORE_VERSION,
+            "seats": seats,
+            "rounds": rounds,
+            "strategies": [],
+            "chunks": [],
+        }
+        if (self.manifest["seats"], self.manifest["rounds"]) != (seats, rounds):
+            raise ValueError(
+                f"{path} holds games with {self.manifest['seats']} seats and "
+                f"{self.manifest['rounds']} rounds, not {seats} and {rounds}."
+            )
+        self.seats: int = seats
+        self.rounds: int = rounds
+        self.chunk_rows: int = chunk_rows
+        self._codes: Dict[str, int] = {
+            name: code for code, name in enumerate(self.manifest["strategies"])
+        }
+        self._buffers: Dict[str, np.ndarray] = {
+            name: np.zeros((chunk_rows, *_column_shape(name, seats, rounds)), dtype=dtype)
+            for name, dtype in COLUMN_DTYPES.items()
+        }
+        self._rows: int = 0
+
+    def _strategy_code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self._codes)
+            if code > np.iinfo(np.uint8).max:
+                raise ValueError("A results store holds at most 256 strategy names.")
+            self._codes[name] = code
+            self.manifest["strategies"].append(name)
+        return code
+
+    def append(
+        self,
+        seed: int,
+        strategies: Sequence[str],
+        round_scores: Sequence[Sequence[int]],
+        final_scores: Sequence[int],
+        pile_takes: Sequence[int],
+    ) -> None:
+        row = self._rows
+        buffers = self._buffers
+        buffers["seed"][row] = seed
+        buffers["strategy"][row] = [self._strategy_code(name) for name in strategies]
+        buffers["round_scores"][row] = round_scores
+        buffers["final_scores"][row] = final_scores
+        buffers["pile_takes"][row] = pile_takes
+        self._rows += 1
+        if self._rows == self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        chunk_name = f"chunk-{len(self.manifest['chunks']):06d}"
+        chunk_path = os.path.join(self.path, chunk_name)
+        os.makedirs(chunk_path, exist_ok=True)
+        for name, buffer in self._buffers.items():
+            np.save(os.path.join(chunk_path, f"{name}.npy"), buffer[: self._rows])
+        self.manifest["chunks"].append({"name": chunk_name, "rows": self._rows})
+        _write_manifest(self.path, self.manifest)
+        self._rows = 0
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _read_manifest(path: str) -> Optional[Dict]:
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as file:
+        manifest = json.load(file)
+    if manifest.get("version") != STORE_VERSION:
+        raise ValueError(
+            f"{path} has store version {manifest.get('version')}, expected {STORE_VERSION}."
+        )
+    return manifest
+
+
+def _write_manifest(path: str, manifest: Dict) -> None:
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    temporary_path = f"{manifest_path}.tmp{os.getpid()}"
+    with open(temporary_path, "w") as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(temporary_path, manifest_path)
+
+
+class ResultsStore:
+    """
+    Read side of a results directory. chunks() yields the columns of one chunk at a
+    time as read-only memory maps, so aggregations stream over any number of games
+    in bounded memory.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        manifest = _read_manifest(path)
+        if manifest is None:
+            raise ValueError(f"{path} is not a results store.")
+        self.manifest: Dict = manifest
+        self.seats: int = manifest["seats"]
+        self.rounds: int = manifest["rounds"]
+        self.strategies: List[str] = manifest["strategies"]
+
+    def __len__(self) -> int:
+        return sum(chunk["rows"] for chunk in self.manifest["chunks"])
+
+    def chunks(
+        self, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        columns = list(columns or COLUMN_DTYPES)
+        for chunk in self.manifest["chunks"]:
+            chunk_path = os.path.join(self.path, chunk["name"])
+            yield {
+                name: np.load(os.path.join(chunk_path, f"{name}.npy"), mmap_mode="r")
+                for name in columns
+            }
+
+
+@dataclass
+class StrategyAggregate:
+    seats: int = 0
+    score_sum: float = 0.0
+    score_square_sum: float = 0.0
+    wins: float = 0.0
+    pile_takes: int = 0
+    # games per final score, index = score
+    score_histogram: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+
+    @property
+    def mean_score(self) -> float:
+        return self.score_sum / self.seats if self.seats else 0.0
+
+    @property
+    def score_std(self) -> float:
+        if not self.seats:
+            return 0.0
+        variance = self.score_square_sum / self.seats - self.mean_score**2
+        return float(np.sqrt(max(variance, 0.0)))
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.seats if self.seats else 0.0
+
+    @property
+    def mean_pile_takes(self) -> float:
+        return self.pile_takes / self.seats if self.seats else 0.0
+
+    def add_histogram(self, counts: np.ndarray) -> None:
+        if len(counts) > len(self.score_histogram):
+            counts, smaller = counts.astype(np.int64), self.score_histogram
+        else:
+            smaller, counts = counts, self.score_histogram
+        counts[: len(smaller)] += smaller
+        self.score_histogram = counts
+
+
+def aggregate(store: ResultsStore) -> Dict[str, StrategyAggregate]:
+    """
+    Mean score, win rate, pile takes and final score histogram per strategy, one
+    chunk in memory at a time. A shared lowest score is a shared win.
+    """
+    totals = {name: StrategyAggregate() for name in store.strategies}
+    for chunk in store.chunks(("strategy", "final_scores", "pile_takes")):
+        codes = np.asarray(chunk["strategy"])
+        scores = np.asarray(chunk["final_scores"], dtype=np.int64)
+        takes = np.asarray(chunk["pile_takes"], dtype=np.int64)
+        winners = scores == scores.min(axis=1, keepdims=True)
+        win_share = winners / winners.sum(axis=1, keepdims=True)
+        for code, name in enumerate(store.strategies):
+            seats = codes == code
+            if not seats.any():
+                continue
+            strategy_scores = scores[seats]
+            total = totals[name]
+            total.seats += int(seats.sum())
+            total.score_sum += float(strategy_scores.sum())
+            total.score_square_sum += float(np.square(strategy_scores).sum())
+            total.wins += float(win_share[seats].sum())
+            total.pile_takes += int(takes[seats].sum())
+            total.add_histogram(np.bincount(strategy_scores.clip(min=0)))
+    return {name: total for name, total in totals.items() if total.seats}
@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+from typing import List, Optional
+
+from src.server.client import BotClient
+from src.server.load import format_report, generate_load
+from src.server.server import GameServer, ServerConfig
+from src.tournament.runner import STRATEGY_REGISTRY
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server",
+        description="Host games for remote bots over TCP, or play against such a server.",
+    )
+    parser.add_argument("--host", type=str, default=ServerConfig.host)
+    parser.add_argument("--port", type=int, default=ServerConfig.port)
+    parser.add_argument(
+        "--remote-seats", type=int, default=ServerConfig.remote_seats, help="bots per table"
+    )
+    parser.add_argument(
+        "--local",
+        nargs="*",
+        default=list(ServerConfig.local_strategies),
+        choices=sorted(STRATEGY_REGISTRY),
+        help="strategies that fill the other seats of every table",
+    )
+    parser.add_argument("--rounds", type=int, default=ServerConfig.amount_of_rounds)
+    parser.add_argument(
+        "--move-timeout",
+        type=float,
+        default=ServerConfig.move_timeout,
+        help="seconds per decision before a fallback move is played",
+    )
+    parser.add_argument(
+        "--strategy",
+        default="RandomCardStrategy",
+        choices=sorted(STRATEGY_REGISTRY),
+        help="strategy of the bot clients",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("serve", help="run the server until interrupted")
+    bot = subparsers.add_parser("bot", help="play tables on a running server")
+    bot.add_argument("--tables", type=int, default=1)
+    load = subparsers.add_parser("load", help="load test an in-process server")
+    load.add_argument("--clients", type=int, default=64, help="concurrent bot connections")
+    load.add_argument("--tables", type=int, default=10, help="tables per client")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    config = ServerConfig(
+        host=args.host,
+        port=args.port,
+        remote_seats=args.remote_seats,
+        local_strategies=tuple(args.local),
+        amount_of_rounds=args.rounds,
+        move_timeout=args.move_timeout,
+    )
+    if args.command == "serve":
+        print(f"serving on {config.host}:{config.port}")
+        asyncio.run(GameServer(config).serve_forever())
+    elif args.command == "bot":
+        client = BotClient(STRATEGY_REGISTRY[args.strategy](), config.host, config.port)
+        for table, scores in enumerate(asyncio.run(client.play(args.tables)), start=1):
+            print(f"table {table}: final scores per player {scores}")
+    else:
+        report = asyncio.run(generate_load(config, args.clients, args.tables, args.strategy))
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from src.game.cards import get_card
+from src.game.player import Player
+from src.server.protocol import MAX_LINE_BYTES, decode_message, decode_state, encode_message
+from src.strategies.base_strategy import BaseStrategy
+
+
+class BotClient:
+    """
+    Stand-in for a bot written by another team: plays any BaseStrategy against a
+    GameServer over the line protocol, one seat per connection. The strategy sees the
+    game state rebuilt from the server's messages, not the server's objects.
+    """
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        host: str = "127.0.0.1",
+        port: int = 7555,
+        name: Optional[str] = None,
+    ):
+        self.strategy: BaseStrategy = strategy
+        self.host: str = host
+        self.port: int = port
+        self.name: str = name or type(strategy).__name__
+        self.player: Optional[Player] = None
+
+    async def play(self, tables: int = 1) -> List[Dict[int, int]]:
+        # final scores per player id, one dict per table played
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, limit=MAX_LINE_BYTES
+        )
+        results = []
+        try:
+            for _ in range(tables):
+                writer.write(encode_message({"t": "join", "name": self.name}))
+                await writer.drain()
+                results.append(await self._play_table(reader, writer))
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        return results
+
+    async def _play_table(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> Dict[int, int]:
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("The server closed the connection.")
+            message = decode_message(line)
+            kind = message["t"]
+            if kind == "start":
+                self.player = Player(player_id=message["player"], strategy=self.strategy)
+            elif kind in ("card", "pile"):
+                move = self.decide(kind, message["state"])
+                writer.write(encode_message({"t": "move", "id": message["id"], "move": move}))
+                await writer.drain()
+            elif kind == "end":
+                return {
+                    int(player_id): score for player_id, score in message["scores"].items()
+                }
+            elif kind == "error":
+                raise RuntimeError(f"Server error: {message['error']}")
+
+    def decide(self, kind: str, state: Dict[str, Any]) -> int:
+        game_state = decode_state(state)
+        self.player.hand.clear()
+        self.player.hand.update(
+            (card_number, get_card(card_number)) for card_number in state["hand"]
+        )
+        if kind == "card":
+            return self.strategy.choose_card_to_play(game_state).card_number
+        # some strategies return NumPy integers, which JSON cannot encode
+        return int(self.strategy.choose_pile_to_replace(game_state))
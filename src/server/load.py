@@ -0,0 +1,89 @@
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence
+
+from src.server.client import BotClient
+from src.server.server import GameServer, ServerConfig
+from src.tournament.runner import STRATEGY_REGISTRY
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    tables: int
+    seconds: float
+    moves: int
+    fallback_moves: int
+    # move latency in milliseconds, from the server sending a request to the move
+    # arriving, so it includes the bot's decision and both network hops
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+
+    @property
+    def tables_per_sec(self) -> float:
+        return self.tables / self.seconds if self.seconds else 0.0
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    # nearest rank
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def generate_load(
+    config: Optional[ServerConfig] = None,
+    clients: int = 64,
+    tables_per_client: int = 10,
+    strategy: str = "RandomCardStrategy",
+) -> LoadReport:
+    """
+    Starts a GameServer on a free local port and plays it with `clients` concurrent
+    BotClients over TCP, each playing tables_per_client tables.
+    """
+    if config is None:
+        config = ServerConfig()
+    if clients % config.remote_seats:
+        raise ValueError(
+            f"{clients} clients cannot fill tables of {config.remote_seats} remote seats."
+        )
+    server = GameServer(replace(config, port=0))
+    await server.start()
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                BotClient(
+                    STRATEGY_REGISTRY[strategy](), config.host, server.port, f"bot-{index}"
+                ).play(tables_per_client)
+                for index in range(clients)
+            )
+        )
+        seconds = time.perf_counter() - start
+    finally:
+        await server.close()
+    stats = server.stats
+    latencies: List[float] = sorted(latency * 1000 for latency in stats.move_latencies)
+    return LoadReport(
+        tables=stats.tables_finished,
+        seconds=seconds,
+        moves=stats.moves,
+        fallback_moves=stats.fallback_moves,
+        latency_p50=percentile(latencies, 0.5),
+        latency_p90=percentile(latencies, 0.9),
+        latency_p99=percentile(latencies, 0.99),
+        latency_max=latencies[-1] if latencies else 0.0,
+    )
+
+
+def format_report(report: LoadReport) -> str:
+    return (
+        f"{report.tables} tables in {report.seconds:.2f}s "
+        f"({report.tables_per_sec:.1f} tables/sec), {report.moves} moves, "
+        f"{report.fallback_moves} fallback moves\n"
+        f"move latency ms: p50 {report.latency_p50:.2f}, p90 {report.latency_p90:.2f}, "
+        f"p99 {report.latency_p99:.2f}, max {report.latency_max:.2f}"
+    )
@@ -0,0 +1,118 @@
+import json
+from typing import Any, Dict, Mapping, Type
+
+from src.game.cards import get_card
+
+# One JSON object per line, UTF-8, no spaces. Every message has a type "t".
+#
+#   client -> server
+#     {"t":"join","name":"..."}            queue for the next table, again after "end"
+#     {"t":"move","id":7,"move":42}        card number, or pile index, for request 7
+#   server -> client
+#     {"t":"start","table":3,"player":1,"players":5}
+#     {"t":"card","id":7,"ms":1000,"state":{...}}   choose a card, "ms" is the deadline
+#     {"t":"pile","id":8,"ms":1000,"state":{...}}   choose a pile index to replace
+#     {"t":"end","table":3,"scores":{"1":24,...}}
+#     {"t":"error","error":"..."}
+#
+# A move that arrives after its deadline is ignored; the server has already played a
+# fallback move for that seat. Cards are sent as card numbers, the state is the
+# seat's personalised game state (see encode_state).
+MAX_LINE_BYTES = 1 << 16
+
+# the fields each message type must have, and their JSON type
+MESSAGE_FIELDS: Dict[str, Dict[str, Type]] = {
+    "join": {},
+    "move": {"id": int},
+    "start": {"table": int, "player": int, "players": int},
+    "card": {"id": int, "state": dict},
+    "pile": {"id": int, "state": dict},
+    "end": {"table": int, "scores": dict},
+    "error": {"error": str},
+}
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+def decode_message(line: bytes) -> Dict[str, Any]:
+    message = json.loads(line)
+    if not isinstance(message, dict) or not isinstance(message.get("t"), str):
+        raise ValueError("A message must be a JSON object with a string type 't'.")
+    fields = MESSAGE_FIELDS.get(message["t"])
+    if fields is None:
+        raise ValueError(f"Unknown message type {message['t']!r}.")
+    for name, kind in fields.items():
+        value = message.get(name)
+        # JSON true and false decode to bool, which is an int to isinstance
+        if not isinstance(value, kind) or isinstance(value, bool):
+            raise ValueError(
+                f"A {message['t']!r} message needs {name!r} of type {kind.__name__}."
+            )
+    return message
+
+
+def encode_state(game_state: Mapping[str, Any]) -> Dict[str, Any]:
+    seen_mask = game_state["seen_cards_mask"]
+    return {
+        "round": game_state["current_round_number"],
+        "turn": game_state["current_turn_number"],
+        "rounds": game_state["total_rounds"],
+        "players": game_state["total_players"],
+        "cards_per_player": game_state["cards_per_player"],
+        "min_card": game_state["min_card"],
+        "max_card": game_state["max_card"],
+        "piles": [[card.card_number for card in pile] for pile in game_state["piles"]],
+        "hand": [card_number for card_number, _ in game_state["player_hand"]],
+        # every card revealed on a pile this round, also those already taken
+        "seen": [
+            card_number
+            for card_number in range(seen_mask.bit_length())
+            if seen_mask >> card_number & 1
+        ],
+        "cards_played": [card.card_number for card in game_state["cards_played"] or ()],
+        "turn_scores": {
+            str(player_id): list(scores)
+            for player_id, scores in game_state["points_per_player_per_turn"].items()
+        },
+        "round_scores": {
+            str(player_id): list(scores)
+            for player_id, scores in game_state["points_per_player_per_round"].items()
+        },
+    }
+
+
+def decode_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    # the game state dict a BaseStrategy expects, rebuilt from encode_state
+    piles = tuple(
+        tuple(get_card(card_number) for card_number in pile) for pile in state["piles"]
+    )
+    seen_mask = 0
+    for card_number in state["seen"]:
+        seen_mask |= 1 << card_number
+    return {
+        "total_players": state["players"],
+        "min_card": state["min_card"],
+        "max_card": state["max_card"],
+        "cards_per_player": state["cards_per_player"],
+        "total_piles": len(piles),
+        "total_rounds": state["rounds"],
+        "played_cards": tuple(card for pile in piles for card in pile),
+        "last_cards_per_pile": tuple(pile[-1] for pile in piles),
+        "piles": piles,
+        "points_per_pile": tuple(sum(card.card_points for card in pile) for pile in piles),
+        "points_per_player_per_turn": {
+            int(player_id): scores for player_id, scores in state["turn_scores"].items()
+        },
+        "points_per_player_per_round": {
+            int(player_id): scores for player_id, scores in state["round_scores"].items()
+        },
+        "current_turn_number": state["turn"],
+        "current_round_number": state["round"],
+        "seen_cards_mask": seen_mask,
+        "cards_played": [get_card(card_number) for card_number in state["cards_played"]],
+        "player_hand": tuple(
+            (card_number, get_card(card_number).card_points) for card_number in state["hand"]
+        ),
+    }
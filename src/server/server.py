@@ -0,0 +1,302 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+
+from src.game.async_rounds import AsyncGame
+from src.game.events import NullSink
+from src.game.player import Player
+from src.server.protocol import (
+    MAX_LINE_BYTES,
+    decode_message,
+    encode_message,
+    encode_state,
+)
+from src.strategies.async_strategy import AsyncBaseStrategy
+from src.tournament.runner import STRATEGY_REGISTRY
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    host: str = "127.0.0.1"
+    port: int = 7555
+    # connections seated per table; the other seats play local strategies
+    remote_seats: int = 1
+    local_strategies: Tuple[str, ...] = (
+        "DescendingOrderStrategy",
+        "RandomCardStrategy",
+        "QLearningStrategy",
+    )
+    amount_of_rounds: int = 5
+    amount_of_piles: int = 4
+    amount_of_cards_per_player: int = 10
+    # seconds a seat gets per decision before the server plays a fallback move
+    move_timeout: Optional[float] = 1.0
+
+    def __post_init__(self):
+        if self.remote_seats < 1:
+            raise ValueError("A table needs at least one remote seat.")
+        unknown = [name for name in self.local_strategies if name not in STRATEGY_REGISTRY]
+        if unknown:
+            raise ValueError(
+                f"Unknown strategies {unknown}, choose from {sorted(STRATEGY_REGISTRY)}"
+            )
+
+
+@dataclass
+class ServerStats:
+    tables_started: int = 0
+    tables_finished: int = 0
+    moves: int = 0
+    fallback_moves: int = 0
+    # seconds from sending a request to receiving its move, most recent moves only
+    move_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1_000_000))
+
+
+class RemoteSeat:
+    """
+    One client connection. Reads the client's lines for as long as it is connected,
+    and matches every move to the request it answers.
+    """
+
+    def __init__(
+        self,
+        server: "GameServer",
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        self.server: GameServer = server
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+        self.name: str = ""
+        self.connected: bool = True
+        self._next_request_id: int = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        if not self.connected:
+            return
+        try:
+            self.writer.write(encode_message(message))
+            await self.writer.drain()
+        except ConnectionError:
+            self._disconnect()
+
+    async def request(self, kind: str, game_state: Dict[str, Any]) -> object:
+        # the client's move as sent, unchecked, or None when it disconnected; the game
+        # enforces the deadline by cancelling this coroutine
+        if not self.connected:
+            return None
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        timeout = self.server.config.move_timeout
+        sent = time.perf_counter()
+        try:
+            await self.send(
+                {
+                    "t": kind,
+                    "id": request_id,
+                    "ms": None if timeout is None else round(timeout * 1000),
+                    "state": encode_state(game_state),
+                }
+            )
+            move = await future
+        finally:
+            self._pending.pop(request_id, None)
+        if move is not None:
+            self.server.stats.moves += 1
+            self.server.stats.move_latencies.append(time.perf_counter() - sent)
+        return move
+
+    def _disconnect(self) -> None:
+        self.connected = False
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result(None)
+
+    def _receive(self, message: Dict[str, Any]) -> None:
+        if message["t"] == "join":
+            self.name = str(message.get("name", ""))
+            self.server.waiting.put_nowait(self)
+        elif message["t"] == "move":
+            request_id = message.get("id")
+            if not isinstance(request_id, int) or isinstance(request_id, bool):
+                raise ValueError("A move needs an integer 'id'.")
+            future = self._pending.get(request_id)
+            # late and unknown moves are dropped
+            if future is not None and not future.done():
+                future.set_result(message.get("move"))
+        else:
+            raise ValueError(f"Unknown message type {message['t']!r}.")
+
+    async def serve(self) -> None:
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    self._receive(decode_message(line))
+                except ValueError as error:
+                    await self.send({"t": "error", "error": str(error)})
+        except ConnectionError:
+            pass
+        except ValueError:
+            # readline raises ValueError for a line over MAX_LINE_BYTES
+            await self.send({"t": "error", "error": "Line too long."})
+        finally:
+            self._disconnect()
+            self.writer.close()
+
+
+class RemoteStrategy(AsyncBaseStrategy):
+    """
+    Forwards decisions to a RemoteSeat. Anything that is not a card in hand or a pile
+    index comes back as None, and AsyncGame plays its fallback move instead.
+    """
+
+    def __init__(self, seat: RemoteSeat):
+        self.seat: RemoteSeat = seat
+
+    async def choose_card_to_play(self, game_state: Dict[str, Any]) -> Optional[Card]:
+        card_number = await self.seat.request("card", game_state)
+        if not isinstance(card_number, int):
+            return None
+        return self.player.hand.get(card_number)
+
+    async def choose_pile_to_replace(self, game_state: Dict[str, Any]) -> Optional[int]:
+        pile_index = await self.seat.request("pile", game_state)
+        return pile_index if isinstance(pile_index, int) else None
+
+
+class GameServer:
+    """
+    Hosts concurrent AsyncGame tables for clients speaking the protocol in
+    src.server.protocol. Every config.remote_seats joined connections are seated at a
+    new table, together with the configured local strategies; a client joins again
+    after "end" to play another table.
+    """
+
+    def __init__(self, config: Optional[ServerConfig] = None):
+        self.config: ServerConfig = config if config is not None else ServerConfig()
+        self.stats: ServerStats = ServerStats()
+        self.waiting: asyncio.Queue[RemoteSeat] = asyncio.Queue()
+        self._server: Optional[asyncio.Server] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._seats: Set[RemoteSeat] = set()
+
+    @property
+    def port(self) -> int:
+        # the bound port, useful when the config asked for port 0
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self.config.host,
+            self.config.port,
+            limit=MAX_LINE_BYTES,
+        )
+        self._spawn(self._seat_tables())
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        # wait_closed waits for open connections, so they are closed first
+        for seat in list(self._seats):
+            seat.writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def _spawn(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        seat = RemoteSeat(self, reader, writer)
+        self._seats.add(seat)
+        try:
+            await seat.serve()
+        finally:
+            self._seats.discard(seat)
+
+    async def _seat_tables(self) -> None:
+        seats: List[RemoteSeat] = []
+        while True:
+            seat = await self.waiting.get()
+            if seat.connected and seat not in seats:
+                seats.append(seat)
+            seats = [seat for seat in seats if seat.connected]
+            if len(seats) == self.config.remote_seats:
+                self._spawn(self._play_table(seats))
+                seats = []
+
+    def _build_game(self, seats: List[RemoteSeat]) -> AsyncGame:
+        config = self.config
+        players = [
+            Player(player_id=player_id, strategy=RemoteStrategy(seat))
+            for player_id, seat in enumerate(seats, start=1)
+        ]
+        players += [
+            Player(player_id=player_id, strategy=STRATEGY_REGISTRY[name]())
+            for player_id, name in enumerate(config.local_strategies, start=len(seats) + 1)
+        ]
+        return AsyncGame(
+            players=players,
+            amount_of_rounds=config.amount_of_rounds,
+            amount_of_piles=config.amount_of_piles,
+            amount_of_cards_per_player=config.amount_of_cards_per_player,
+            event_sink=NullSink(),
+            decision_timeout=config.move_timeout,
+        )
+
+    async def _play_table(self, seats: List[RemoteSeat]) -> None:
+        self.stats.tables_started += 1
+        table = self.stats.tables_started
+        game = self._build_game(seats)
+        for player in game.players[: len(seats)]:
+            await player.strategy.seat.send(
+                {
+                    "t": "start",
+                    "table": table,
+                    "player": player.player_id,
+                    "players": len(game.players),
+                }
+            )
+        await game.play_game()
+        self.stats.fallback_moves += sum(
+            game.fallback_decisions[player.player_id] for player in game.players[: len(seats)]
+        )
+        scores = {
+            str(player_id): round_scores[-1]
+            for player_id, round_scores in game.scores_per_player_per_round.items()
+        }
+        for seat in seats:
+            await seat.send({"t": "end", "table": table, "scores": scores})
+        self.stats.tables_finished += 1
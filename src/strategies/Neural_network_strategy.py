@@ -1,25 +1,39 @@
+import numpy as np
+
 from src.strategies.base_strategy import BaseStrategy
+from src.strategies.features import FeatureEncoder
 
 
 class NeuralNetworkStrategy(BaseStrategy):
-    def __init__(self, model):
+    """
+    Plays the highest scoring card in hand and replaces the highest scoring pile, as
+    scored by `model` (see MLPPolicy). Pass an InferenceBatcher as `batcher` to share
+    forward passes with the other tables running in parallel threads.
+    """
+
+    def __init__(self, model, encoder=None, batcher=None):
         self.model = model
+        self.encoder = encoder or FeatureEncoder(
+            max_card=model.max_card, amount_of_piles=model.amount_of_piles
+        )
+        self.batcher = batcher
 
     def choose_card_to_play(self, game_state):
-        # Use the neural network model to predict the best card to play
-        input_data = self._prepare_input(game_state)
-        predicted_card = self.model.predict(input_data)
-        return predicted_card
+        card_scores = self.model.card_scores(self._predict(game_state))
+        card_numbers = list(self.player.hand)
+        best = int(np.argmax(card_scores[[card_number - 1 for card_number in card_numbers]]))
+        return self.player.hand[card_numbers[best]]
 
     def choose_pile_to_replace(self, game_state):
-        # Use the neural network model to predict which pile to replace
-        input_data = self._prepare_input(game_state)
-        predicted_pile = self.model.predict(input_data)
-        return predicted_pile
+        pile_scores = self.model.pile_scores(self._predict(game_state))
+        return int(np.argmax(pile_scores[: len(game_state["piles"])]))
 
     def _prepare_input(self, game_state):
-        # Convert the game state into a format suitable for the neural network
-        # This is a placeholder implementation and should be customized
-        input_data = []
-        # Extract relevant features from game_state and append to input_data
-        return input_data
+        # written into the encoder's preallocated buffer, valid until the next call
+        return self.encoder.encode(game_state, self.player.hand)
+
+    def _predict(self, game_state):
+        input_data = self._prepare_input(game_state)
+        if self.batcher is not None:
+            return self.batcher.predict(input_data)
+        return self.model.predict(input_data[np.newaxis])[0]
@@ -3,6 +3,7 @@ from src.strategies.descending_order_strategy import DescendingOrderStrategy
 from src.strategies.random_strategies import FullRandomStrategy, RandomCardStrategy
 from src.strategies.human_input_strategy import HumanInputStrategy
 from src.strategies.Neural_network_strategy import NeuralNetworkStrategy
+from src.strategies.risk_aware_strategy import RiskAwareStrategy
 
 __all__ = [
     "DescendingOrderStrategy",
@@ -10,4 +11,5 @@ __all__ = [
     "RandomCardStrategy",
     "HumanInputStrategy",
     "NeuralNetworkStrategy",
+    "RiskAwareStrategy",
 ]
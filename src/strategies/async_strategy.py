@@ -0,0 +1,88 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from src.strategies.base_strategy import BaseStrategy
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+    from src.game.player import Player
+
+
+class AsyncBaseStrategy(ABC):
+    """
+    A strategy whose decisions are coroutines, for AsyncGame. Use it for decisions
+    that wait on something else (a remote client, a model server); the game gathers
+    the card choices of all players concurrently.
+    """
+
+    player: Optional[Player] = None
+
+    def _set_player(self, player: Player) -> None:
+        self.player = player
+
+    @abstractmethod
+    async def choose_card_to_play(self, game_state: Dict[str, Any]) -> Card:
+        pass
+
+    @abstractmethod
+    async def choose_pile_to_replace(self, game_state: Dict[str, Any]) -> int:
+        pass
+
+    def update(  # noqa: B027
+        self,
+        state: Dict[str, Any],
+        action: Tuple[int, int],
+        reward: float,
+        next_state: Dict[str, Any],
+        possible_actions: List[Card],
+    ) -> None:
+        pass
+
+    @property
+    def learns(self) -> bool:
+        # only strategies that override update need the state from before the turn
+        return type(self).update is not AsyncBaseStrategy.update
+
+
+class SyncStrategyAdapter(AsyncBaseStrategy):
+    """
+    Runs a BaseStrategy in AsyncGame. Decisions of a blocking strategy (console
+    input) run in a worker thread so the event loop keeps serving other tables;
+    everything else is called directly, a thread hop costs more than these decisions.
+
+    A decision that times out cannot be cancelled in its thread: a late console
+    answer is read and discarded.
+    """
+
+    def __init__(self, strategy: BaseStrategy, in_thread: Optional[bool] = None):
+        self.strategy: BaseStrategy = strategy
+        self.in_thread: bool = strategy.blocking if in_thread is None else in_thread
+
+    def _set_player(self, player: Player) -> None:
+        super()._set_player(player)
+        self.strategy._set_player(player)
+
+    async def choose_card_to_play(self, game_state: Dict[str, Any]) -> Card:
+        if self.in_thread:
+            return await asyncio.to_thread(self.strategy.choose_card_to_play, game_state)
+        return self.strategy.choose_card_to_play(game_state)
+
+    async def choose_pile_to_replace(self, game_state: Dict[str, Any]) -> int:
+        if self.in_thread:
+            return await asyncio.to_thread(self.strategy.choose_pile_to_replace, game_state)
+        return self.strategy.choose_pile_to_replace(game_state)
+
+    def update(
+        self,
+        state: Dict[str, Any],
+        action: Tuple[int, int],
+        reward: float,
+        next_state: Dict[str, Any],
+        possible_actions: List[Card],
+    ) -> None:
+        self.strategy.update(state, action, reward, next_state, possible_actions)
+
+    @property
+    def learns(self) -> bool:
+        return self.strategy.learns
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 class BaseStrategy(ABC):
     player: Optional[Player] = None
+    # strategies that wait on something outside the program (console input) set this,
+    # so the async game runs their decisions in a worker thread
+    blocking: bool = False
 
     def _set_player(self, player: Player) -> None:
         self.player = player
@@ -23,6 +26,11 @@ class BaseStrategy(ABC):
     def update(self, state, action, reward, next_state, possible_actions):  # noqa: B027
         pass
 
+    @property
+    def learns(self) -> bool:
+        # only strategies that override update need the state from before the turn
+        return type(self).update is not BaseStrategy.update
+
     def show_per_pile_cards(self, game_state: Dict[str, Any]) -> None:
         for i, pile in enumerate(game_state["piles"]):
             print(
@@ -0,0 +1,223 @@
+import copy
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.game.batch import BatchGame
+from src.game.cards import Card, get_card
+from src.game.player import Player
+from src.strategies.base_strategy import BaseStrategy
+
+# The batch protocol is optional: a strategy that also has
+#
+#   choose_cards_batch(batch, games, seats) -> card numbers
+#   choose_piles_batch(batch, games, seats, cards) -> pile indices
+#
+# decides for many games at once. `games` and `seats` are equally long index arrays
+# into the BatchGame arrays, one decision per pair; `cards` are the unplayable cards
+# that force the pile choices. Any other strategy gets a ScalarStrategyAdapter.
+
+
+class BatchStrategy(Protocol):
+    def choose_cards_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray
+    ) -> np.ndarray: ...
+
+    def choose_piles_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray: ...
+
+
+# what BatchSeats seats: a strategy with the batch protocol, or any BaseStrategy
+AnyStrategy = Union[BaseStrategy, BatchStrategy]
+
+
+def random_cards_in_hands(batch: BatchGame, hands: np.ndarray) -> np.ndarray:
+    # uniform choice among the cards still in each hand row
+    keys = np.where(hands > 0, batch.rng.random(hands.shape), -1.0)
+    return np.take_along_axis(hands, keys.argmax(axis=1)[:, None], axis=1)[:, 0]
+
+
+class ScalarStrategyAdapter:
+    """
+    Batch protocol for any BaseStrategy: builds the game state of every (game, seat)
+    from the BatchGame arrays and asks a strategy one decision at a time. Every game
+    row gets its own deep copy of the strategy, made on the first deal of the games,
+    so strategies that keep state between turns (RiskAwareStrategy's CardTracker,
+    ISMCTSStrategy's tree reuse) see one game each, like in Game. The strategy passed
+    in only serves as the template and is never played itself.
+    """
+
+    def __init__(self, strategy: BaseStrategy):
+        self.strategy: BaseStrategy = strategy
+        self.strategies: List[BaseStrategy] = []
+        self.players: List[Player] = []
+        # the games the copies belong to: the BatchGame and the deal they started at
+        self._games: Optional[Tuple[BatchGame, int]] = None
+
+    def _game_strategies(self, batch: BatchGame) -> None:
+        games = (batch, batch.deals - batch.round_number)
+        if self._games is not None and self._games[0] is batch and self._games[1] == games[1]:
+            return
+        self._games = games
+        self.strategies = [copy.deepcopy(self.strategy) for _ in range(batch.amount_of_games)]
+        self.players = [
+            Player(player_id=1, strategy=strategy) for strategy in self.strategies
+        ]
+
+    @staticmethod
+    def game_state(
+        batch: BatchGame,
+        game: int,
+        player: Player,
+        cards_played: Optional[List[Card]] = None,
+    ) -> Dict[str, Any]:
+        piles = tuple(
+            tuple(get_card(card_number) for card_number in cards[:length].tolist())
+            for cards, length in zip(
+                batch.pile_cards[game], batch.pile_lengths[game].tolist(), strict=True
+            )
+        )
+        seen_mask = 0
+        for card_number in np.flatnonzero(batch.seen_cards[game]).tolist():
+            seen_mask |= 1 << card_number
+        round_number = batch.round_number
+        round_scores = batch.round_scores[game]
+        # points per round, with the current round's points so far
+        turn_scores = np.diff(round_scores, axis=1, prepend=0)
+        turn_scores[:, round_number:] = 0
+        turn_scores[:, round_number] = batch.turn_scores[game]
+        player_ids = range(1, batch.amount_of_players + 1)
+        return {
+            "total_players": batch.amount_of_players,
+            "min_card": batch.start_card,
+            "max_card": batch.end_card,
+            "cards_per_player": batch.amount_of_cards_per_player,
+            "total_piles": batch.amount_of_piles,
+            "total_rounds": batch.amount_of_rounds,
+            "played_cards": tuple(card for pile in piles for card in pile),
+            "last_cards_per_pile": tuple(pile[-1] for pile in piles),
+            "piles": piles,
+            "points_per_pile": tuple(batch.pile_points[game].tolist()),
+            "points_per_player_per_turn": dict(
+                zip(player_ids, turn_scores.tolist(), strict=True)
+            ),
+            "points_per_player_per_round": dict(
+                zip(player_ids, round_scores.tolist(), strict=True)
+            ),
+            "current_turn_number": batch.turn_number,
+            "current_round_number": round_number,
+            "seen_cards_mask": seen_mask,
+            "cards_played": cards_played,
+            "player_hand": tuple(
+                (card_number, card.card_points) for card_number, card in player.hand.items()
+            ),
+        }
+
+    def _seat(self, batch: BatchGame, game: int, seat: int) -> Tuple[BaseStrategy, Player]:
+        # the game's player takes the seat, with that seat's hand; set again every
+        # time, the strategy may sit at several seats of the game
+        strategy, player = self.strategies[game], self.players[game]
+        strategy._set_player(player)
+        player.player_id = seat + 1
+        player.hand.clear()
+        for card_number in batch.hands[game, seat].tolist():
+            if card_number:
+                player.hand[card_number] = get_card(card_number)
+        return strategy, player
+
+    def choose_cards_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray
+    ) -> np.ndarray:
+        self._game_strategies(batch)
+        chosen = np.empty(len(games), dtype=np.int16)
+        for index, (game, seat) in enumerate(
+            zip(games.tolist(), seats.tolist(), strict=True)
+        ):
+            strategy, player = self._seat(batch, game, seat)
+            card = strategy.choose_card_to_play(self.game_state(batch, game, player))
+            chosen[index] = card.card_number
+        return chosen
+
+    def choose_piles_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray:
+        self._game_strategies(batch)
+        chosen = np.empty(len(games), dtype=np.intp)
+        for index, (game, seat) in enumerate(
+            zip(games.tolist(), seats.tolist(), strict=True)
+        ):
+            strategy, player = self._seat(batch, game, seat)
+            cards_played = [
+                get_card(card_number) for card_number in batch.turn_cards[game].tolist()
+            ]
+            chosen[index] = strategy.choose_pile_to_replace(
+                self.game_state(batch, game, player, cards_played)
+            )
+        return chosen
+
+
+def _defined_in(cls: type, name: str) -> Optional[type]:
+    return next((klass for klass in cls.__mro__ if name in vars(klass)), None)
+
+
+def has_batch_methods(strategy: AnyStrategy) -> bool:
+    # a subclass that overrides a scalar decision but inherits the batch one (like
+    # RiskAwareStrategy from DescendingOrderStrategy) would play its parent's rule
+    cls = type(strategy)
+    for scalar, batch in (
+        ("choose_card_to_play", "choose_cards_batch"),
+        ("choose_pile_to_replace", "choose_piles_batch"),
+    ):
+        batch_class = _defined_in(cls, batch)
+        # batch-only strategies (ScalarStrategyAdapter) have no scalar method at all
+        scalar_class = _defined_in(cls, scalar) or object
+        if batch_class is None or not issubclass(batch_class, scalar_class):
+            return False
+    return True
+
+
+def as_batch_strategy(strategy: AnyStrategy) -> BatchStrategy:
+    return strategy if has_batch_methods(strategy) else ScalarStrategyAdapter(strategy)
+
+
+class BatchSeats:
+    """
+    One strategy per seat of a BatchGame, as the card and pile choosers that
+    BatchGame.play_game takes. A strategy object sitting at several seats decides for
+    all of them in one call.
+    """
+
+    def __init__(self, strategies: Sequence[AnyStrategy]):
+        groups: Dict[int, Tuple[BatchStrategy, List[int]]] = {}
+        for seat, strategy in enumerate(strategies):
+            groups.setdefault(id(strategy), (as_batch_strategy(strategy), []))[1].append(seat)
+        self.groups: List[Tuple[BatchStrategy, np.ndarray]] = [
+            (strategy, np.array(seats, dtype=np.intp)) for strategy, seats in groups.values()
+        ]
+        self.amount_of_players: int = len(strategies)
+
+    def choose_cards(self, batch: BatchGame) -> np.ndarray:
+        if batch.amount_of_players != self.amount_of_players:
+            raise ValueError(
+                f"{self.amount_of_players} strategies for {batch.amount_of_players} seats."
+            )
+        chosen = np.zeros((batch.amount_of_games, batch.amount_of_players), dtype=np.int16)
+        all_games = np.arange(batch.amount_of_games)
+        for strategy, seats in self.groups:
+            games = np.repeat(all_games, len(seats))
+            seat_rows = np.tile(seats, batch.amount_of_games)
+            chosen[games, seat_rows] = strategy.choose_cards_batch(batch, games, seat_rows)
+        return chosen
+
+    def choose_piles(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray:
+        chosen = np.zeros(len(games), dtype=np.intp)
+        for strategy, strategy_seats in self.groups:
+            mine = np.isin(seats, strategy_seats)
+            if mine.any():
+                chosen[mine] = strategy.choose_piles_batch(
+                    batch, games[mine], seats[mine], cards[mine]
+                )
+        return chosen
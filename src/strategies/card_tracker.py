@@ -0,0 +1,133 @@
+import math
+from functools import lru_cache
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from src.game.cards import card_points_table
+
+MAX_PILE_LENGTH = 5
+
+
+@lru_cache(maxsize=1 << 16)
+def hypergeometric_pmf(population: int, successes: int, draws: int) -> Tuple[float, ...]:
+    # P(k of the draws are successes) for k = 0..min(successes, draws), drawing
+    # without replacement
+    total = math.comb(population, draws)
+    return tuple(
+        math.comb(successes, k) * math.comb(population - successes, draws - k) / total
+        for k in range(min(successes, draws) + 1)
+    )
+
+
+class PileRisk(NamedTuple):
+    # the pile the card lands on, None when the card is below every pile and must
+    # replace one
+    pile_index: Optional[int]
+    take_probability: float
+    expected_points: float
+
+
+class CardTracker:
+    """
+    The cards one player has not seen this round, as an int bitmask (bit n is card
+    n). The game state already keeps the cards revealed on the piles as a mask; the
+    tracker adds the player's own hand once per round, so observe() is a few bit
+    operations and counting the unseen cards in a range is one popcount.
+
+    pile_risk() models the opponents' cards this turn as a uniform sample from the
+    unseen cards; opponents' unplayable cards are ignored.
+    """
+
+    def __init__(self, max_card: int = 103):
+        self.max_card: int = max_card
+        self.all_cards: int = (1 << (max_card + 1)) - 2
+        points = card_points_table(max_card)
+        # one mask per point value, to sum the points of a set of cards by popcounts
+        self.point_masks: Tuple[Tuple[int, int], ...] = tuple(
+            (
+                value,
+                sum(
+                    1 << number
+                    for number in range(1, max_card + 1)
+                    if points[number] == value
+                ),
+            )
+            for value in sorted(set(points[1:]))
+        )
+        self.round_number: Optional[int] = None
+        # the cards dealt to us this round
+        self.known: int = 0
+        self.unseen: int = self.all_cards
+
+    def observe(self, game_state: Dict[str, Any], hand: Iterable[int]) -> int:
+        # hand is only read on the first turn of a round, when it is the whole deal
+        round_number = game_state["current_round_number"]
+        if round_number != self.round_number or game_state["current_turn_number"] == 0:
+            self.round_number = round_number
+            self.known = 0
+            for card_number in hand:
+                self.known |= 1 << card_number
+        unseen = self.all_cards & ~(game_state["seen_cards_mask"] | self.known)
+        # during a pile choice the cards of this turn are known too
+        for card in game_state.get("cards_played") or ():
+            unseen &= ~(1 << card.card_number)
+        self.unseen = unseen
+        return unseen
+
+    @property
+    def unseen_count(self) -> int:
+        return self.unseen.bit_count()
+
+    @staticmethod
+    def range_mask(low: int, high: int) -> int:
+        # the cards strictly between low and high
+        if high <= low + 1:
+            return 0
+        return ((1 << high) - 1) & ~((1 << (low + 1)) - 1)
+
+    def unseen_between(self, low: int, high: int) -> int:
+        return (self.unseen & self.range_mask(low, high)).bit_count()
+
+    def unseen_points_between(self, low: int, high: int) -> int:
+        cards = self.unseen & self.range_mask(low, high)
+        return sum(value * (cards & mask).bit_count() for value, mask in self.point_masks)
+
+    def pile_risk(
+        self, game_state: Dict[str, Any], card_number: int, opponents: Optional[int] = None
+    ) -> PileRisk:
+        """
+        The chance that playing card_number makes us take a pile this turn, and the
+        expected points taken. Every opponent card between the pile top and ours
+        lands on the same pile first; we take it when it then holds five cards.
+        """
+        points_per_pile = game_state["points_per_pile"]
+        pile_index, top = None, 0
+        for index, card in enumerate(game_state["last_cards_per_pile"]):
+            if top < card.card_number < card_number:
+                pile_index, top = index, card.card_number
+        if pile_index is None:
+            # we replace a pile, and choose the cheapest
+            return PileRisk(None, 1.0, float(min(points_per_pile)))
+
+        if opponents is None:
+            opponents = game_state["total_players"] - 1
+        length = len(game_state["piles"][pile_index])
+        pile_points = points_per_pile[pile_index]
+        unseen_count = self.unseen_count
+        between = self.unseen_between(top, card_number)
+        mean_points = (
+            self.unseen_points_between(top, card_number) / between if between else 0.0
+        )
+        take_probability = expected_points = 0.0
+        for landed, probability in enumerate(
+            hypergeometric_pmf(unseen_count, between, min(opponents, unseen_count))
+        ):
+            # the pile restarts at every 6th card, we take it if ours is a 6th
+            if (length + landed) % MAX_PILE_LENGTH:
+                continue
+            take_probability += probability
+            if length + landed == MAX_PILE_LENGTH:
+                taken = pile_points + landed * mean_points
+            else:
+                taken = MAX_PILE_LENGTH * mean_points
+            expected_points += probability * taken
+        return PileRisk(pile_index, take_probability, expected_points)
@@ -1,6 +1,7 @@
 import numpy as np
 from typing import TYPE_CHECKING, Dict, Any
 
+from src.game.batch import BatchGame, lowest_points_pile
 from src.strategies.base_strategy import BaseStrategy
 if TYPE_CHECKING:
     from src.game.cards import Card
@@ -27,6 +28,17 @@ class DescendingOrderStrategy(BaseStrategy):
             return candidate_pile_indices[0]
         last_cards_per_pile = game_state["last_cards_per_pile"]
         index_of_lowest_card_pile = np.argmin(
-            [last_cards_per_pile[i] for i in candidate_pile_indices]
+            [last_cards_per_pile[i].card_number for i in candidate_pile_indices]
         )
         return candidate_pile_indices[index_of_lowest_card_pile]
+
+    def choose_cards_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray
+    ) -> np.ndarray:
+        # the highest card left in each hand; played slots hold 0
+        return batch.hands[games, seats].max(axis=1)
+
+    def choose_piles_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray:
+        return lowest_points_pile(batch, games, seats, cards)
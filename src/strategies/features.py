@@ -0,0 +1,73 @@
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+
+class FeatureEncoder:
+    """
+    Writes a game state into a fixed-size float32 vector.
+
+    Layout, in order: hand bitmap (one slot per card number), pile tops, pile lengths
+    and pile points (one slot per pile), bitmap of the cards seen on the piles this
+    round, then the round and turn progress. Every value is scaled to roughly [0, 1].
+    """
+
+    def __init__(
+        self,
+        max_card: int = 103,
+        amount_of_piles: int = 4,
+        max_pile_points: float = 35.0,
+    ):
+        self.max_card: int = max_card
+        self.amount_of_piles: int = amount_of_piles
+        self.max_pile_points: float = max_pile_points
+
+        self.hand_offset: int = 0
+        self.tops_offset: int = self.hand_offset + max_card
+        self.lengths_offset: int = self.tops_offset + amount_of_piles
+        self.points_offset: int = self.lengths_offset + amount_of_piles
+        self.seen_offset: int = self.points_offset + amount_of_piles
+        self.progress_offset: int = self.seen_offset + max_card
+        self.size: int = self.progress_offset + 2
+        self._mask_bytes: int = (max_card + 8) // 8
+        self.buffer: np.ndarray = np.zeros(self.size, dtype=np.float32)
+
+    def encode(
+        self,
+        game_state: Dict[str, Any],
+        hand: Iterable[int],
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        # fills `out` (a row of a batch matrix) or the encoder's own reused buffer
+        out = self.buffer if out is None else out
+        out[:] = 0.0
+        max_card, piles = self.max_card, self.amount_of_piles
+
+        hand_indices = [card_number - 1 for card_number in hand]
+        out[hand_indices] = 1.0
+
+        tops = self.tops_offset
+        for pile_index, card in enumerate(game_state["last_cards_per_pile"][:piles]):
+            out[tops + pile_index] = card.card_number / max_card
+        lengths = self.lengths_offset
+        for pile_index, pile in enumerate(game_state["piles"][:piles]):
+            out[lengths + pile_index] = len(pile) / 5.0
+        points = self.points_offset
+        for pile_index, pile_points in enumerate(game_state["points_per_pile"][:piles]):
+            out[points + pile_index] = pile_points / self.max_pile_points
+
+        # bit n of the mask is card n, slot n - 1 of the bitmap
+        seen_mask = game_state["seen_cards_mask"] >> 1
+        seen_bits = np.unpackbits(
+            np.frombuffer(seen_mask.to_bytes(self._mask_bytes, "little"), dtype=np.uint8),
+            bitorder="little",
+        )
+        out[self.seen_offset : self.seen_offset + max_card] = seen_bits[:max_card]
+
+        out[self.progress_offset] = game_state["current_round_number"] / max(
+            1, game_state["total_rounds"]
+        )
+        out[self.progress_offset + 1] = game_state["current_turn_number"] / max(
+            1, game_state["cards_per_player"]
+        )
+        return out
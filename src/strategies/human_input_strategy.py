@@ -12,6 +12,8 @@ class HumanInputStrategy(BaseStrategy):
     with machine learning training.
     """
 
+    blocking = True
+
     def choose_card_to_play(self, game_state: Dict[str, Any]) -> Card:
         valid_input = False
         back_to_start = False
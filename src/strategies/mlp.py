@@ -0,0 +1,154 @@
+import threading
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+class MLPPolicy:
+    """
+    Small fully connected network in pure NumPy: ReLU hidden layers and one linear
+    output layer. The outputs are scores, one per card number followed by one per pile.
+    predict() always takes a batch of feature rows, so many decisions share one pass.
+    """
+
+    def __init__(
+        self,
+        input_size: int,
+        hidden_sizes: Sequence[int] = (128, 64),
+        max_card: int = 103,
+        amount_of_piles: int = 4,
+        seed: Optional[int] = None,
+    ):
+        self.max_card: int = max_card
+        self.amount_of_piles: int = amount_of_piles
+        rng = np.random.default_rng(seed)
+        sizes = [input_size, *hidden_sizes, max_card + amount_of_piles]
+        self.weights: List[np.ndarray] = []
+        self.biases: List[np.ndarray] = []
+        for fan_in, fan_out in zip(sizes[:-1], sizes[1:], strict=True):
+            # He initialisation suits the ReLU layers
+            scale = np.sqrt(2.0 / fan_in)
+            self.weights.append(
+                (rng.standard_normal((fan_in, fan_out)) * scale).astype(np.float32)
+            )
+            self.biases.append(np.zeros(fan_out, dtype=np.float32))
+
+    @property
+    def input_size(self) -> int:
+        return self.weights[0].shape[0]
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        activations = features
+        last_layer = len(self.weights) - 1
+        for layer, (weights, biases) in enumerate(
+            zip(self.weights, self.biases, strict=True)
+        ):
+            activations = activations @ weights
+            activations += biases
+            if layer < last_layer:
+                np.maximum(activations, 0.0, out=activations)
+        return activations
+
+    def card_scores(self, outputs: np.ndarray) -> np.ndarray:
+        # score of card n sits at index n - 1
+        return outputs[..., : self.max_card]
+
+    def pile_scores(self, outputs: np.ndarray) -> np.ndarray:
+        return outputs[..., self.max_card :]
+
+    def save(self, path: str) -> None:
+        arrays = {f"weights_{layer}": weights for layer, weights in enumerate(self.weights)}
+        arrays.update({f"biases_{layer}": biases for layer, biases in enumerate(self.biases)})
+        with open(path, "wb") as file:
+            np.savez(
+                file, max_card=self.max_card, amount_of_piles=self.amount_of_piles, **arrays
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "MLPPolicy":
+        with np.load(path) as data:
+            layers = sum(1 for name in data.files if name.startswith("weights_"))
+            weights = [data[f"weights_{layer}"] for layer in range(layers)]
+            biases = [data[f"biases_{layer}"] for layer in range(layers)]
+            policy = cls(
+                input_size=weights[0].shape[0],
+                hidden_sizes=[layer_weights.shape[1] for layer_weights in weights[:-1]],
+                max_card=int(data["max_card"]),
+                amount_of_piles=int(data["amount_of_piles"]),
+            )
+        policy.weights, policy.biases = weights, biases
+        return policy
+
+
+class _PendingBatch:
+    __slots__ = ("inputs", "count", "outputs", "error", "done")
+
+    def __init__(self, max_batch: int, input_size: int):
+        self.inputs: np.ndarray = np.empty((max_batch, input_size), dtype=np.float32)
+        self.count: int = 0
+        self.outputs: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+        self.done: threading.Event = threading.Event()
+
+
+class InferenceBatcher:
+    """
+    Collects predict() calls from many threads (one per table) into a single forward
+    pass. A batch runs as soon as it holds max_batch rows, or once the first caller
+    in it has waited max_wait seconds; whichever caller triggers it runs the model,
+    so no background thread is needed.
+    """
+
+    def __init__(self, model: MLPPolicy, max_batch: int = 64, max_wait: float = 0.002):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1.")
+        self.model: MLPPolicy = model
+        self.max_batch: int = max_batch
+        self.max_wait: float = max_wait
+        self.batches_run: int = 0
+        self.rows_run: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: _PendingBatch = _PendingBatch(max_batch, model.input_size)
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.rows_run / self.batches_run if self.batches_run else 0.0
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        with self._lock:
+            batch = self._pending
+            row = batch.count
+            batch.inputs[row] = features
+            batch.count += 1
+            full = batch.count == self.max_batch
+            if full:
+                self._detach()
+        if full:
+            self._run(batch)
+        elif not batch.done.wait(self.max_wait):
+            with self._lock:
+                # another caller may have filled and detached it in the meantime
+                claimed = self._pending is batch
+                if claimed:
+                    self._detach()
+            if claimed:
+                self._run(batch)
+        batch.done.wait()
+        if batch.error is not None:
+            raise RuntimeError("Batched forward pass failed.") from batch.error
+        return batch.outputs[row]
+
+    def _detach(self) -> None:
+        # called with the lock held: later callers start a fresh batch
+        self._pending = _PendingBatch(self.max_batch, self.model.input_size)
+
+    def _run(self, batch: _PendingBatch) -> None:
+        try:
+            batch.outputs = self.model.predict(batch.inputs[: batch.count])
+            self.batches_run += 1
+            self.rows_run += batch.count
+        except Exception as error:
+            batch.error = error
+            raise
+        finally:
+            batch.done.set()
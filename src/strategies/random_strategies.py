@@ -4,7 +4,9 @@ import numpy as np
 
 if TYPE_CHECKING:
     from src.game.cards import Card
+from src.game.batch import BatchGame
 from src.strategies.base_strategy import BaseStrategy
+from src.strategies.batch_protocol import random_cards_in_hands
 
 
 class FullRandomStrategy(BaseStrategy):
@@ -22,6 +24,16 @@ class FullRandomStrategy(BaseStrategy):
         pile_index_to_replace = random.randint(0, len(piles) - 1)
         return pile_index_to_replace
 
+    def choose_cards_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray
+    ) -> np.ndarray:
+        return random_cards_in_hands(batch, batch.hands[games, seats])
+
+    def choose_piles_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray:
+        return batch.rng.integers(0, batch.amount_of_piles, len(games))
+
 
 class RandomCardStrategy(BaseStrategy):
     """
@@ -48,3 +60,16 @@ class RandomCardStrategy(BaseStrategy):
             [last_cards_per_pile[i].card_points for i in candidate_pile_indices]
         )
         return candidate_pile_indices[index_of_lowest_card_pile]
+
+    def choose_cards_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray
+    ) -> np.ndarray:
+        return random_cards_in_hands(batch, batch.hands[games, seats])
+
+    def choose_piles_batch(
+        self, batch: BatchGame, games: np.ndarray, seats: np.ndarray, cards: np.ndarray
+    ) -> np.ndarray:
+        # fewest points first, then the fewest points on the top card (at most 7)
+        points = batch.pile_points[games].astype(np.int64)
+        top_points = batch.points_table[batch.pile_tops[games]]
+        return np.argmin(points * 8 + top_points, axis=1)
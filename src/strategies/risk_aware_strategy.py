@@ -0,0 +1,29 @@
+from typing import TYPE_CHECKING, Any, Dict
+
+from src.strategies.card_tracker import CardTracker
+from src.strategies.descending_order_strategy import DescendingOrderStrategy
+
+if TYPE_CHECKING:
+    from src.game.cards import Card
+
+
+class RiskAwareStrategy(DescendingOrderStrategy):
+    """
+    Plays the card with the lowest expected points taken this turn according to a
+    CardTracker, the highest card on ties. Replaces piles like DescendingOrderStrategy.
+    """
+
+    def __init__(self, max_card: int = 103):
+        self.tracker = CardTracker(max_card)
+
+    def choose_card_to_play(self, game_state: Dict[str, Any]) -> Card:
+        hand = self.player.hand
+        self.tracker.observe(game_state, hand)
+        card_number = min(
+            hand,
+            key=lambda number: (
+                self.tracker.pile_risk(game_state, number).expected_points,
+                -number,
+            ),
+        )
+        return hand[card_number]
@@ -0,0 +1,188 @@
+import argparse
+import csv
+import os
+from typing import List, Optional
+
+from src.game.instrumentation import GameStats
+from src.results.store import ResultsWriter
+from src.tournament.ladder import RatingLadder, format_leaderboard, play_ladder
+from src.tournament.runner import (
+    STRATEGY_REGISTRY,
+    GameSummary,
+    TournamentConfig,
+    summarise,
+    timed_tournament,
+)
+from src.tournament.sequential import SequentialConfig, SequentialTournament, format_result
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.tournament",
+        description="Play many headless games in parallel and report per-strategy scores.",
+    )
+    parser.add_argument("--games", type=int, default=1000, help="number of games")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: all cores)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="base seed for all games")
+    parser.add_argument("--out", type=str, default=None, help="CSV file for per-game scores")
+    parser.add_argument(
+        "--results",
+        type=str,
+        default=None,
+        help="results store directory the games are appended to",
+    )
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        default=list(TournamentConfig.strategies),
+        choices=sorted(STRATEGY_REGISTRY),
+        help="one strategy per seat",
+    )
+    parser.add_argument("--rounds", type=int, default=TournamentConfig.amount_of_rounds)
+    parser.add_argument(
+        "--q-checkpoint",
+        type=str,
+        default=None,
+        help="Q-table checkpoint that QLearningStrategy seats play from",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time game phases and strategy decisions and print where the time goes",
+    )
+    parser.add_argument(
+        "--profile-out", type=str, default=None, help="JSON file for the profile stats"
+    )
+    sequential = parser.add_argument_group(
+        "sequential mode",
+        "play batches until every strategy pair is settled; --games caps it",
+    )
+    sequential.add_argument("--sequential", action="store_true")
+    sequential.add_argument("--alpha", type=float, default=SequentialConfig.alpha)
+    sequential.add_argument(
+        "--precision",
+        type=float,
+        default=SequentialConfig.precision,
+        help="score difference below which two strategies count as equivalent",
+    )
+    sequential.add_argument("--batch", type=int, default=SequentialConfig.batch_size)
+    sequential.add_argument(
+        "--reallocate",
+        action="store_true",
+        help="play head-to-head tables for the pairs that are still unresolved",
+    )
+    ladder = parser.add_argument_group(
+        "ladder mode",
+        "rate strategies incrementally at the tables that tell the most; --games are added "
+        "to the ladder file, which is created or resumed",
+    )
+    ladder.add_argument("--ladder", type=str, default=None, help="ladder JSON file")
+    ladder.add_argument("--seats", type=int, default=len(TournamentConfig.strategies))
+    ladder.add_argument(
+        "--ladder-batch",
+        type=int,
+        default=8,
+        help="games per table before the matchmaker picks the next one",
+    )
+    return parser.parse_args(argv)
+
+
+def write_summaries(
+    path: str, config: TournamentConfig, summaries: List[GameSummary]
+) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["game_index", "seed"]
+            + [f"seat_{seat + 1}_{name}" for seat, name in enumerate(config.strategies)]
+        )
+        for summary in summaries:
+            writer.writerow([summary.game_index, summary.seed, *summary.final_scores])
+
+
+def append_results(path: str, config: TournamentConfig, summaries: List[GameSummary]) -> None:
+    with ResultsWriter(
+        path, seats=len(config.strategies), rounds=config.amount_of_rounds
+    ) as writer:
+        for summary in summaries:
+            writer.append(
+                summary.seed,
+                config.strategies,
+                [list(scores) for scores in summary.round_scores],
+                summary.final_scores,
+                summary.pile_takes,
+            )
+
+
+def run_ladder(args: argparse.Namespace, config: TournamentConfig) -> None:
+    ladder = RatingLadder.load(args.ladder) if os.path.exists(args.ladder) else RatingLadder()
+    for name in config.strategies:
+        ladder.add(name)
+    # strategies rated earlier but no longer registered keep their rating, unplayed
+    strategies = [name for name in ladder.ratings if name in STRATEGY_REGISTRY]
+    play_ladder(
+        ladder,
+        args.games,
+        seats=args.seats,
+        table=config,
+        strategies=strategies,
+        seed=args.seed,
+        batch_size=args.ladder_batch,
+        workers=args.workers,
+        path=args.ladder,
+    )
+    print(format_leaderboard(ladder))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    config = TournamentConfig(
+        strategies=tuple(args.strategies),
+        amount_of_rounds=args.rounds,
+        q_checkpoint=args.q_checkpoint,
+    )
+    if args.ladder:
+        run_ladder(args, config)
+        return
+    if args.sequential:
+        tournament = SequentialTournament(
+            config,
+            SequentialConfig(
+                alpha=args.alpha,
+                precision=args.precision,
+                batch_size=args.batch,
+                min_games=min(args.batch, args.games),
+                max_games=args.games,
+                reallocate=args.reallocate,
+            ),
+            workers=args.workers,
+            seed=args.seed,
+        )
+        print(format_result(tournament.run()))
+        return
+    game_stats = GameStats() if args.profile or args.profile_out else None
+    summaries, elapsed = timed_tournament(
+        config, args.games, workers=args.workers, seed=args.seed, stats=game_stats
+    )
+    if args.out:
+        write_summaries(args.out, config, summaries)
+    if args.results:
+        append_results(args.results, config, summaries)
+    print(
+        f"{len(summaries)} games in {elapsed:.2f}s ({len(summaries) / elapsed:.1f} games/sec)"
+    )
+    for name, stats in summarise(config, summaries).items():
+        print(
+            f"{name}: mean score {stats['mean_score']:.2f}, win rate {stats['win_rate']:.3f}"
+        )
+    if args.profile:
+        print(game_stats.report())
+    if args.profile_out:
+        with open(args.profile_out, "w") as file:
+            file.write(game_stats.to_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import json
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.tournament.runner import TournamentConfig, run_games, split_games
+
+LADDER_VERSION = 1
+
+
+class Rating(NamedTuple):
+    mu: float
+    sigma: float
+    games: int = 0
+
+    @property
+    def conservative(self) -> float:
+        # the skill the strategy has with high confidence, what the ladder is ordered on
+        return self.mu - 3 * self.sigma
+
+
+@dataclass(frozen=True)
+class LadderConfig:
+    # TrueSkill's defaults: a new strategy is 25 +- 25/3, beta is the skill gap that
+    # wins about 76% of the time
+    mu: float = 25.0
+    sigma: float = 25.0 / 3
+    beta: float = 25.0 / 6
+    # lower bound on the factor a variance shrinks by in one game
+    kappa: float = 1e-4
+
+
+class RatingLadder:
+    """
+    Ratings per strategy name, updated after every game with the Bradley-Terry
+    full-pair rule of Weng and Lin (2011): a table of n seats counts as all its n(n-1)/2
+    head-to-head results, lower final score wins, equal scores draw. Seats of the
+    same strategy are not compared with each other.
+    """
+
+    def __init__(
+        self, strategies: Iterable[str] = (), config: Optional[LadderConfig] = None
+    ) -> None:
+        self.config: LadderConfig = config if config is not None else LadderConfig()
+        self.ratings: Dict[str, Rating] = {}
+        # games recorded so far, also the index the next game is seeded from
+        self.games: int = 0
+        for name in strategies:
+            self.add(name)
+
+    def add(self, name: str) -> None:
+        # a new strategy starts uncertain, which makes the matchmaker seat it first
+        if name not in self.ratings:
+            self.ratings[name] = Rating(self.config.mu, self.config.sigma)
+
+    def _win_probability(self, first: Rating, second: Rating) -> Tuple[float, float]:
+        # P(first beats second) and the scale c it was computed at
+        c = math.sqrt(first.sigma**2 + second.sigma**2 + 2 * self.config.beta**2)
+        return 1 / (1 + math.exp((second.mu - first.mu) / c)), c
+
+    def record(self, lineup: Sequence[str], final_scores: Sequence[int]) -> None:
+        for name in lineup:
+            self.add(name)
+        before = [self.ratings[name] for name in lineup]
+        # per strategy: the mean shift and the fraction of variance removed
+        omega: Dict[str, float] = dict.fromkeys(lineup, 0.0)
+        delta: Dict[str, float] = dict.fromkeys(lineup, 0.0)
+        for seat, (name, rating, score) in enumerate(
+            zip(lineup, before, final_scores, strict=True)
+        ):
+            variance = rating.sigma**2
+            for other_seat, (other_name, other, other_score) in enumerate(
+                zip(lineup, before, final_scores, strict=True)
+            ):
+                if other_seat == seat or other_name == name:
+                    continue
+                probability, c = self._win_probability(rating, other)
+                outcome = 1.0 if score < other_score else 0.5 if score == other_score else 0.0
+                omega[name] += variance / c * (outcome - probability)
+                delta[name] += (
+                    rating.sigma / c * variance / c**2 * probability * (1 - probability)
+                )
+        for name in omega:
+            rating = self.ratings[name]
+            self.ratings[name] = Rating(
+                rating.mu + omega[name],
+                rating.sigma * math.sqrt(max(1 - delta[name], self.config.kappa)),
+                rating.games + 1,
+            )
+        self.games += 1
+
+    def pair_information(self, first: str, second: str) -> float:
+        # the variance one game between the two is expected to remove from both ratings
+        first_rating, second_rating = self.ratings[first], self.ratings[second]
+        probability, c = self._win_probability(first_rating, second_rating)
+        return (
+            (first_rating.sigma**5 + second_rating.sigma**5)
+            / c**3
+            * probability
+            * (1 - probability)
+        )
+
+    def next_lineup(
+        self, seats: int, strategies: Optional[Iterable[str]] = None
+    ) -> Tuple[str, ...]:
+        """
+        The table to play next: the most uncertain strategy, then greedily the one
+        whose games against those already seated remove the most variance, those
+        being close matches between uncertain ratings. With fewer strategies than
+        seats, the most uncertain fill the rest.
+        """
+        names = list(strategies) if strategies is not None else list(self.ratings)
+        if len(names) < 2:
+            raise ValueError("A ladder needs at least two strategies.")
+        by_uncertainty = sorted(names, key=lambda name: -self.ratings[name].sigma)
+        if len(names) <= seats:
+            return tuple(by_uncertainty[seat % len(names)] for seat in range(seats))
+        lineup = [by_uncertainty[0]]
+        candidates = by_uncertainty[1:]
+        while len(lineup) < seats:
+            best = max(
+                candidates,
+                key=lambda name: sum(
+                    self.pair_information(name, seated) for seated in lineup
+                ),
+            )
+            lineup.append(best)
+            candidates.remove(best)
+        return tuple(lineup)
+
+    def leaderboard(self) -> List[Tuple[str, Rating]]:
+        return sorted(self.ratings.items(), key=lambda item: -item[1].conservative)
+
+    def save(self, path: str) -> None:
+        # written to a temporary file first, so an interrupted save keeps the old ladder
+        data = {
+            "version": LADDER_VERSION,
+            "config": asdict(self.config),
+            "games": self.games,
+            "ratings": {name: rating._asdict() for name, rating in self.ratings.items()},
+        }
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(data, file, indent=1)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "RatingLadder":
+        with open(path) as file:
+            data = json.load(file)
+        if data.get("version") != LADDER_VERSION:
+            raise ValueError(f"{path} is not a version {LADDER_VERSION} ladder.")
+        ladder = cls(config=LadderConfig(**data["config"]))
+        ladder.games = data["games"]
+        ladder.ratings = {name: Rating(**rating) for name, rating in data["ratings"].items()}
+        return ladder
+
+
+def play_ladder(
+    ladder: RatingLadder,
+    games: int,
+    seats: int = 5,
+    table: Optional[TournamentConfig] = None,
+    strategies: Optional[Sequence[str]] = None,
+    seed: int = 0,
+    batch_size: int = 8,
+    workers: Optional[int] = None,
+    path: Optional[str] = None,
+) -> RatingLadder:
+    """
+    Play `games` more games, batch_size at a time at the table the matchmaker picks,
+    between `strategies` (default: every strategy on the ladder). The other table
+    settings come from `table`. With a path the ladder is saved after every batch,
+    and a loaded ladder continues the seed stream where it stopped.
+    """
+    if table is None:
+        table = TournamentConfig()
+    for name in strategies or ():
+        ladder.add(name)
+    workers = workers or os.cpu_count() or 1
+    pool: Optional[Executor] = (
+        ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    )
+    try:
+        played = 0
+        while played < games:
+            batch = min(batch_size, games - played)
+            lineup = ladder.next_lineup(seats, strategies)
+            lineup_config = replace(table, strategies=lineup)
+            start = ladder.games
+            if pool is None:
+                summaries = run_games(lineup_config, seed, start, start + batch)
+            else:
+                futures = [
+                    pool.submit(run_games, lineup_config, seed, start + low, start + high)
+                    for low, high in split_games(batch, workers)
+                ]
+                summaries = [summary for future in futures for summary in future.result()]
+            for summary in summaries:
+                ladder.record(lineup, summary.final_scores)
+            played += batch
+            if path is not None:
+                ladder.save(path)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return ladder
+
+
+def format_leaderboard(ladder: RatingLadder) -> str:
+    lines = [f"{ladder.games} games"]
+    for rank, (name, rating) in enumerate(ladder.leaderboard(), start=1):
+        lines.append(
+            f"{rank}. {name}: {rating.conservative:.2f} "
+            f"(mu {rating.mu:.2f}, sigma {rating.sigma:.2f}, {rating.games} games)"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,223 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type
+
+import numpy as np
+
+from src.agents.endgame import EndgameStrategy
+from src.agents.ismcts import ISMCTSStrategy
+from src.agents.linear_q import LinearQStrategy
+from src.agents.q_learning import QLearningStrategy
+from src.game.events import NullSink
+from src.game.instrumentation import GameStats
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import (
+    DescendingOrderStrategy,
+    FullRandomStrategy,
+    RandomCardStrategy,
+    RiskAwareStrategy,
+)
+from src.strategies.base_strategy import BaseStrategy
+
+# strategies that can run headless, addressed by class name in configs and on the CLI
+STRATEGY_REGISTRY: Dict[str, Type[BaseStrategy]] = {
+    strategy.__name__: strategy
+    for strategy in (
+        DescendingOrderStrategy,
+        FullRandomStrategy,
+        RandomCardStrategy,
+        QLearningStrategy,
+        RiskAwareStrategy,
+        LinearQStrategy,
+        ISMCTSStrategy,
+        EndgameStrategy,
+    )
+}
+
+
+@dataclass(frozen=True)
+class TournamentConfig:
+    """
+    Everything a worker needs to rebuild the table; kept small and picklable so only
+    the config crosses the process boundary, never Player or strategy objects.
+    """
+
+    strategies: Tuple[str, ...] = (
+        "DescendingOrderStrategy",
+        "FullRandomStrategy",
+        "RandomCardStrategy",
+        "QLearningStrategy",
+        "QLearningStrategy",
+    )
+    amount_of_rounds: int = 3
+    amount_of_piles: int = 4
+    amount_of_cards_per_player: int = 10
+    # QLearningStrategy seats play greedily from this checkpoint instead of learning
+    q_checkpoint: Optional[str] = None
+
+    def __post_init__(self):
+        unknown = [name for name in self.strategies if name not in STRATEGY_REGISTRY]
+        if unknown:
+            raise ValueError(
+                f"Unknown strategies {unknown}, choose from {sorted(STRATEGY_REGISTRY)}"
+            )
+
+
+class GameSummary(NamedTuple):
+    game_index: int
+    seed: int
+    # final score per seat, in the order of TournamentConfig.strategies
+    final_scores: Tuple[int, ...]
+    # cumulative score per seat after each round, and piles taken per seat
+    round_scores: Tuple[Tuple[int, ...], ...] = ()
+    pile_takes: Tuple[int, ...] = ()
+
+
+def game_seed(seed: int, game_index: int) -> int:
+    # independent of how games are split over workers, so runs are reproducible
+    sequence = np.random.SeedSequence(entropy=seed, spawn_key=(game_index,))
+    return int(sequence.generate_state(1)[0])
+
+
+def build_strategy(config: TournamentConfig, name: str) -> BaseStrategy:
+    if name == QLearningStrategy.__name__ and config.q_checkpoint:
+        return QLearningStrategy.from_checkpoint(config.q_checkpoint)
+    return STRATEGY_REGISTRY[name]()
+
+
+def build_players(config: TournamentConfig) -> List[Player]:
+    return [
+        Player(player_id=seat + 1, strategy=build_strategy(config, name))
+        for seat, name in enumerate(config.strategies)
+    ]
+
+
+def play_single_game(
+    config: TournamentConfig,
+    game_index: int,
+    seed: int,
+    stats: Optional[GameStats] = None,
+) -> GameSummary:
+    per_game_seed = game_seed(seed, game_index)
+    random.seed(per_game_seed)
+    np.random.seed(per_game_seed)
+    players = build_players(config)
+    game = Game(
+        players=players,
+        amount_of_rounds=config.amount_of_rounds,
+        amount_of_piles=config.amount_of_piles,
+        amount_of_cards_per_player=config.amount_of_cards_per_player,
+        event_sink=NullSink(),
+    )
+    if stats is not None:
+        game.enable_instrumentation(stats)
+    game.play_game()
+    final_scores = tuple(
+        game.scores_per_player_per_round[player.player_id][-1] for player in players
+    )
+    return GameSummary(
+        game_index,
+        per_game_seed,
+        final_scores,
+        round_scores=tuple(
+            tuple(game.scores_per_player_per_round[player.player_id]) for player in players
+        ),
+        pile_takes=tuple(player.piles_taken for player in players),
+    )
+
+
+def run_games(
+    config: TournamentConfig, seed: int, start: int, stop: int
+) -> List[GameSummary]:
+    return [play_single_game(config, index, seed) for index in range(start, stop)]
+
+
+def profile_games(
+    config: TournamentConfig, seed: int, start: int, stop: int
+) -> Tuple[List[GameSummary], Dict[str, Dict[str, Dict[str, float]]]]:
+    # like run_games, with the stats returned as a plain dict to cross the process pool
+    stats = GameStats()
+    summaries = [play_single_game(config, index, seed, stats) for index in range(start, stop)]
+    return summaries, stats.to_dict()
+
+
+def split_games(games: int, chunks: int) -> List[Tuple[int, int]]:
+    chunks = max(1, min(chunks, games))
+    bounds = np.linspace(0, games, chunks + 1).astype(int)
+    return [
+        (int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+    ]
+
+
+def run_tournament(
+    config: TournamentConfig,
+    games: int,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    chunks_per_worker: int = 4,
+    stats: Optional[GameStats] = None,
+) -> List[GameSummary]:
+    # with `stats` every game is instrumented and the timings of all workers are
+    # merged into it
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        if stats is not None:
+            return [play_single_game(config, index, seed, stats) for index in range(games)]
+        return run_games(config, seed, 0, games)
+    # a few chunks per worker keeps every core busy when chunks finish unevenly
+    chunks = split_games(games, workers * chunks_per_worker)
+    chunk_runner = run_games if stats is None else profile_games
+    summaries: List[GameSummary] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(chunk_runner, config, seed, start, stop) for start, stop in chunks
+        ]
+        for future in futures:
+            if stats is None:
+                summaries.extend(future.result())
+            else:
+                chunk_summaries, chunk_stats = future.result()
+                summaries.extend(chunk_summaries)
+                stats.merge(GameStats.from_dict(chunk_stats))
+    return summaries
+
+
+def summarise(
+    config: TournamentConfig, summaries: List[GameSummary]
+) -> Dict[str, Dict[str, float]]:
+    # mean final score and win rate per strategy; a shared lowest score is a shared win
+    totals: Dict[str, Dict[str, float]] = {
+        name: {"seats": 0, "score": 0.0, "wins": 0.0} for name in config.strategies
+    }
+    for summary in summaries:
+        best = min(summary.final_scores)
+        winners = summary.final_scores.count(best)
+        for name, score in zip(config.strategies, summary.final_scores, strict=True):
+            totals[name]["seats"] += 1
+            totals[name]["score"] += score
+            if score == best:
+                totals[name]["wins"] += 1 / winners
+    return {
+        name: {
+            "mean_score": values["score"] / values["seats"],
+            "win_rate": values["wins"] / values["seats"],
+        }
+        for name, values in totals.items()
+        if values["seats"]
+    }
+
+
+def timed_tournament(
+    config: TournamentConfig,
+    games: int,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    stats: Optional[GameStats] = None,
+) -> Tuple[List[GameSummary], float]:
+    start = time.perf_counter()
+    summaries = run_tournament(config, games, workers=workers, seed=seed, stats=stats)
+    return summaries, time.perf_counter() - start
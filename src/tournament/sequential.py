@@ -0,0 +1,267 @@
+import math
+import os
+import zlib
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+from src.tournament.runner import (
+    GameSummary,
+    TournamentConfig,
+    game_seed,
+    run_games,
+    split_games,
+)
+
+
+class RunningStats:
+    """
+    Welford's online mean and variance.
+    """
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self):
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def standard_error(self) -> float:
+        return math.sqrt(self.variance / self.count) if self.count else math.inf
+
+    def half_width(self, z: float) -> float:
+        return z * self.standard_error
+
+    def sequence_half_width(self, alpha: float, rho: float) -> float:
+        """
+        Half width of the asymptotic confidence sequence of Waudby-Smith et al. (2021),
+        a normal mixture boundary: with probability 1 - alpha it covers the mean after
+        every game at once, so it can be checked after each batch and stopped on.
+        """
+        if self.count < 2:
+            return math.inf
+        spread = self.count * rho**2 + 1
+        radius = math.sqrt(
+            2 * spread / (self.count * rho) ** 2 * math.log(math.sqrt(spread) / alpha)
+        )
+        return math.sqrt(self.variance) * radius
+
+
+def mixture_rho(alpha: float, games: int) -> float:
+    # the mixture width that makes the confidence sequence tightest after `games` games
+    log_alpha = -2 * math.log(alpha)
+    return math.sqrt((log_alpha + math.log(log_alpha + 1)) / games)
+
+
+@dataclass(frozen=True)
+class SequentialConfig:
+    # family-wise error over all pairs (Bonferroni); a pair is decided once the
+    # confidence sequence on its mean score difference excludes 0. It holds at every
+    # batch at once, so stopping early does not inflate the error
+    alpha: float = 0.05
+    # games after which the confidence sequence is tightest; it is somewhat wider
+    # than a fixed-sample interval there, and grows slowly wider relative to one
+    # before and after
+    tuned_games: int = 1000
+    # a pair is also settled once the interval is narrower than +-precision points,
+    # the strategies are then equivalent at that precision
+    precision: float = 0.5
+    batch_size: int = 200
+    min_games: int = 200
+    max_games: int = 100_000
+    # play head-to-head tables and give each batch only to the unresolved pairs,
+    # instead of seating every strategy at one table
+    reallocate: bool = False
+
+
+@dataclass
+class PairComparison:
+    first: str
+    second: str
+    # per game: mean score of the first strategy's seats minus the second's
+    difference: RunningStats = field(default_factory=RunningStats)
+    status: str = "unresolved"
+
+    def decide(self, alpha: float, rho: float, config: SequentialConfig) -> None:
+        stats = self.difference
+        if stats.count < max(2, config.min_games):
+            return
+        half_width = stats.sequence_half_width(alpha, rho)
+        if abs(stats.mean) > half_width:
+            # lower scores are better
+            self.status = "first better" if stats.mean < 0 else "second better"
+        elif half_width <= config.precision:
+            self.status = "equivalent"
+
+
+@dataclass
+class SequentialResult:
+    games: int
+    stop_reason: str
+    pairs: List[PairComparison]
+    mean_scores: Dict[str, RunningStats]
+    win_rates: Dict[str, RunningStats]
+    # the error level of every interval, and the mixture width of the sequences
+    alpha: float
+    rho: float
+
+
+def _game_observations(
+    strategies: Tuple[str, ...], summary: GameSummary
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    # mean score and win share per strategy at this table; a shared win is split
+    scores: Dict[str, List[int]] = {}
+    for name, score in zip(strategies, summary.final_scores, strict=True):
+        scores.setdefault(name, []).append(score)
+    best = min(summary.final_scores)
+    winners = summary.final_scores.count(best)
+    mean_scores = {name: sum(values) / len(values) for name, values in scores.items()}
+    win_shares = {
+        name: sum(1 / winners for value in values if value == best) / len(values)
+        for name, values in scores.items()
+    }
+    return mean_scores, win_shares
+
+
+def head_to_head_lineup(first: str, second: str, seats: int, swap: bool) -> Tuple[str, ...]:
+    # alternating seats; `swap` mirrors them so both strategies get every seat
+    names = (second, first) if swap else (first, second)
+    return tuple(names[seat % 2] for seat in range(seats))
+
+
+class SequentialTournament:
+    """
+    Plays games in batches and keeps online estimates per strategy pair, stopping as
+    soon as every pair is decided or settled, or max_games is reached.
+    """
+
+    def __init__(
+        self,
+        config: TournamentConfig,
+        sequential: Optional[SequentialConfig] = None,
+        workers: Optional[int] = None,
+        seed: int = 0,
+    ):
+        self.config: TournamentConfig = config
+        self.sequential: SequentialConfig = (
+            sequential if sequential is not None else SequentialConfig()
+        )
+        self.workers: int = workers or os.cpu_count() or 1
+        self.seed: int = seed
+        names = list(dict.fromkeys(config.strategies))
+        if len(names) < 2:
+            raise ValueError("A sequential tournament needs at least two strategies.")
+        self.pairs: List[PairComparison] = [
+            PairComparison(first, second) for first, second in combinations(names, 2)
+        ]
+        self.mean_scores: Dict[str, RunningStats] = {name: RunningStats() for name in names}
+        self.win_rates: Dict[str, RunningStats] = {name: RunningStats() for name in names}
+        self.alpha: float = self.sequential.alpha / len(self.pairs)
+        self.rho: float = mixture_rho(self.alpha, self.sequential.tuned_games)
+        self.games: int = 0
+        # games played per table, so every batch continues a table's seed stream
+        self._table_games: Dict[Tuple[str, ...], int] = {}
+
+    def _play(
+        self, pool: Optional[Executor], strategies: Tuple[str, ...], games: int
+    ) -> List[GameSummary]:
+        table_config = replace(self.config, strategies=strategies)
+        start = self._table_games.get(strategies, 0)
+        self._table_games[strategies] = start + games
+        # every table has its own seed stream, derived from the tournament seed
+        table_seed = game_seed(self.seed, zlib.crc32(",".join(strategies).encode()))
+        if pool is None:
+            return run_games(table_config, table_seed, start, start + games)
+        futures = [
+            pool.submit(run_games, table_config, table_seed, start + low, start + high)
+            for low, high in split_games(games, self.workers)
+        ]
+        return [summary for future in futures for summary in future.result()]
+
+    def _record(self, strategies: Tuple[str, ...], summaries: List[GameSummary]) -> None:
+        for summary in summaries:
+            mean_scores, win_shares = _game_observations(strategies, summary)
+            for name, score in mean_scores.items():
+                self.mean_scores[name].add(score)
+                self.win_rates[name].add(win_shares[name])
+            for pair in self.pairs:
+                if pair.first in mean_scores and pair.second in mean_scores:
+                    pair.difference.add(mean_scores[pair.first] - mean_scores[pair.second])
+        self.games += len(summaries)
+
+    def _play_batch(self, pool: Optional[Executor], games: int) -> None:
+        if not self.sequential.reallocate:
+            self._record(
+                self.config.strategies, self._play(pool, self.config.strategies, games)
+            )
+            return
+        seats = len(self.config.strategies)
+        lineups = [
+            head_to_head_lineup(pair.first, pair.second, seats, swap)
+            for pair in self.pairs
+            if pair.status == "unresolved"
+            for swap in (False, True)
+        ]
+        # exactly `games` games; with fewer games than lineups the first ones get one
+        for lineup, (low, high) in zip(
+            lineups, split_games(games, len(lineups)), strict=False
+        ):
+            self._record(lineup, self._play(pool, lineup, high - low))
+
+    def run(self) -> SequentialResult:
+        sequential = self.sequential
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        stop_reason = "max_games"
+        try:
+            while self.games < sequential.max_games:
+                batch = min(sequential.batch_size, sequential.max_games - self.games)
+                self._play_batch(pool, batch)
+                for pair in self.pairs:
+                    if pair.status == "unresolved":
+                        pair.decide(self.alpha, self.rho, sequential)
+                if all(pair.status != "unresolved" for pair in self.pairs):
+                    stop_reason = "all pairs resolved"
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return SequentialResult(
+            games=self.games,
+            stop_reason=stop_reason,
+            pairs=self.pairs,
+            mean_scores=self.mean_scores,
+            win_rates=self.win_rates,
+            alpha=self.alpha,
+            rho=self.rho,
+        )
+
+
+def format_result(result: SequentialResult) -> str:
+    lines = [f"{result.games} games, stopped: {result.stop_reason}"]
+    for name, stats in result.mean_scores.items():
+        win_rate = result.win_rates[name]
+        lines.append(
+            f"{name}: mean score {stats.mean:.2f} "
+            f"+- {stats.sequence_half_width(result.alpha, result.rho):.2f}, "
+            f"win rate {win_rate.mean:.3f} "
+            f"+- {win_rate.sequence_half_width(result.alpha, result.rho):.3f}"
+        )
+    for pair in result.pairs:
+        lines.append(
+            f"{pair.first} - {pair.second}: {pair.difference.mean:+.2f} "
+            f"+- {pair.difference.sequence_half_width(result.alpha, result.rho):.2f} over "
+            f"{pair.difference.count} games, {pair.status}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,404 @@
+import argparse
+import multiprocessing as mp
+import os
+import queue
+import random
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from multiprocessing.sharedctypes import Synchronized
+    from multiprocessing.synchronize import Event
+
+    from src.game.cards import Card
+
+from src.agents.q_learning import QLearningStrategy
+from src.agents.q_table import QTable, QTableStats, with_actions
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.tournament.runner import STRATEGY_REGISTRY, game_seed
+
+# one transition: packed state, card played, reward, packed next state and the policy
+# version the actor was playing with. The next state's legal actions are the cards
+# set in its hand bitmask, so they do not need to be stored.
+TRANSITION_DTYPE = np.dtype(
+    [
+        ("state", np.uint64, (3,)),
+        ("action", np.uint16),
+        ("reward", np.float32),
+        ("next_state", np.uint64, (3,)),
+        ("policy_version", np.uint32),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class SelfPlayConfig:
+    actors: int = 2
+    # learning seats per table, the remaining seats are filled with the opponents
+    learning_seats: int = 5
+    opponents: Tuple[str, ...] = ()
+    amount_of_rounds: int = 3
+    amount_of_piles: int = 4
+    amount_of_cards_per_player: int = 10
+    epsilon: float = 0.1
+    alpha: float = 0.1
+    gamma: float = 0.99
+    max_q_entries: int = 1_000_000
+    replay_capacity: int = 100_000
+    batch_size: int = 256
+    # learner updates between two policy snapshots sent to the actors
+    snapshot_interval: int = 20
+    # games an actor may have queued before it waits for the learner
+    queue_size: int = 64
+    seed: int = 0
+
+
+class ReplayBuffer:
+    """
+    Bounded ring buffer of transitions in one structured NumPy array; once full, the
+    oldest transitions are overwritten.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity: int = capacity
+        self.records: np.ndarray = np.zeros(capacity, dtype=TRANSITION_DTYPE)
+        self.size: int = 0
+        self._next: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def extend(self, records: np.ndarray) -> None:
+        records = records[-self.capacity :]
+        end = self._next + len(records)
+        if end <= self.capacity:
+            self.records[self._next : end] = records
+        else:
+            split = self.capacity - self._next
+            self.records[self._next :] = records[:split]
+            self.records[: end - self.capacity] = records[split:]
+        self._next = end % self.capacity
+        self.size = min(self.capacity, self.size + len(records))
+
+    def sample(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        return self.records[rng.integers(0, self.size, size=batch_size)]
+
+
+class ActorQLearningStrategy(QLearningStrategy):
+    """
+    Plays from a (read-only) snapshot of the learner's table and records transitions
+    instead of learning from them.
+    """
+
+    def __init__(self, q_table: QTable, epsilon: float, policy_version: int):
+        super().__init__(epsilon=epsilon)
+        self.q_table = q_table
+        self.policy_version: int = policy_version
+        self.transitions: List[Tuple[Any, ...]] = []
+
+    def update(
+        self,
+        state: Dict[str, Any],
+        action: Tuple[int, int],
+        reward: float,
+        next_state: Dict[str, Any],
+        possible_actions: List["Card"],
+    ) -> None:
+        card_number, _ = action
+        self.transitions.append(
+            (
+                self.encode_personalised_state(state),
+                card_number,
+                reward,
+                self.encode_personalised_state(next_state),
+                self.policy_version,
+            )
+        )
+
+
+def _opponent_players(config: SelfPlayConfig, first_id: int) -> List[Player]:
+    return [
+        Player(player_id=first_id + offset, strategy=STRATEGY_REGISTRY[name]())
+        for offset, name in enumerate(config.opponents)
+    ]
+
+
+def actor_loop(
+    actor_id: int,
+    config: SelfPlayConfig,
+    snapshot_path: str,
+    policy_version: "Synchronized[int]",
+    transitions: "Queue[np.ndarray]",
+    stop: "Event",
+) -> None:
+    version, q_table = -1, QTable(max_entries=1)
+    game_index = actor_id
+    while not stop.is_set():
+        if policy_version.value != version:
+            version = policy_version.value
+            q_table = QTable.load(snapshot_path, mmap=True)
+        per_game_seed = game_seed(config.seed, game_index)
+        random.seed(per_game_seed)
+        game_index += config.actors
+
+        actors = [
+            ActorQLearningStrategy(q_table, config.epsilon, version)
+            for _ in range(config.learning_seats)
+        ]
+        players = [
+            Player(player_id=seat + 1, strategy=strategy)
+            for seat, strategy in enumerate(actors)
+        ] + _opponent_players(config, len(actors) + 1)
+        Game(
+            players=players,
+            amount_of_rounds=config.amount_of_rounds,
+            amount_of_piles=config.amount_of_piles,
+            amount_of_cards_per_player=config.amount_of_cards_per_player,
+            event_sink=NullSink(),
+        ).play_game()
+
+        recorded = [transition for actor in actors for transition in actor.transitions]
+        records = np.zeros(len(recorded), dtype=TRANSITION_DTYPE)
+        for index, (state, action, reward, next_state, version_used) in enumerate(recorded):
+            records[index] = (state, action, reward, next_state, version_used)
+        while not stop.is_set():
+            try:
+                transitions.put(records, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+
+@dataclass
+class TrainingReport:
+    transitions: int = 0
+    updates: int = 0
+    elapsed: float = 0.0
+    policy_version: int = 0
+    mean_policy_lag: float = 0.0
+    max_policy_lag: int = 0
+    q_table: Optional[QTableStats] = None
+
+    @property
+    def transitions_per_sec(self) -> float:
+        return self.transitions / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def updates_per_sec(self) -> float:
+        return self.updates / self.elapsed if self.elapsed else 0.0
+
+
+class Learner:
+    """
+    Owns the writable Q-table and the replay buffer. Every batch_size transitions
+    received trigger one batched update from a replay sample, and every
+    snapshot_interval updates the table is written to the snapshot file the actors
+    read from.
+    """
+
+    def __init__(self, config: SelfPlayConfig, snapshot_path: str):
+        self.config: SelfPlayConfig = config
+        self.snapshot_path: str = snapshot_path
+        self.q_table: QTable = QTable(max_entries=config.max_q_entries, seed=config.seed)
+        self.buffer: ReplayBuffer = ReplayBuffer(config.replay_capacity)
+        self.rng: np.random.Generator = np.random.default_rng(config.seed)
+        self.report: TrainingReport = TrainingReport()
+        self.policy_version: int = 0
+        self._lag_total: int = 0
+        self._pending: int = 0
+        self.q_table.save(snapshot_path)
+
+    def _max_futures(self, next_states: np.ndarray) -> np.ndarray:
+        # the best value of every next state; its legal actions are the cards in its
+        # hand bitmask, unpacked into rows of card numbers (0 = no card)
+        bits = np.unpackbits(
+            next_states[:, :2].astype("<u8").view(np.uint8), axis=1, bitorder="little"
+        )
+        counts = bits.sum(axis=1, dtype=np.intp)
+        rows, cards = np.nonzero(bits)
+        starts = np.cumsum(counts) - counts
+        hands = np.zeros((len(next_states), max(1, int(counts.max(initial=0)))), np.int64)
+        hands[rows, np.arange(len(rows)) - starts[rows]] = cards
+        values = self.q_table.get_many(with_actions(next_states, hands))
+        values[hands == 0] = -np.inf
+        return np.where(counts > 0, values.max(axis=1), 0.0)
+
+    def apply_batch(self, batch: np.ndarray) -> None:
+        """
+        One Q-learning update per transition, with every target computed from the
+        table as it was before the batch. A (state, action) sampled more than once is
+        updated once per occurrence, in order.
+        """
+        alpha, gamma = self.config.alpha, self.config.gamma
+        keys = with_actions(batch["state"], batch["action"][:, None])[:, 0]
+        targets = batch["reward"] + gamma * self._max_futures(batch["next_state"])
+        # the occurrence number of every key among the equal keys of the batch
+        _, groups, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+        groups = groups.reshape(-1)
+        order = np.argsort(groups, kind="stable")
+        starts = np.cumsum(counts) - counts
+        occurrence = np.empty(len(keys), dtype=np.intp)
+        occurrence[order] = np.arange(len(keys)) - starts[groups[order]]
+        for repeat in range(int(occurrence.max(initial=-1)) + 1):
+            rows = occurrence == repeat
+            old = self.q_table.get_many(keys[rows])
+            self.q_table.set_many(keys[rows], old + alpha * (targets[rows] - old))
+
+    def receive(self, records: np.ndarray) -> bool:
+        # returns True when a new policy snapshot was written
+        lags = self.policy_version - records["policy_version"].astype(np.int64)
+        self._lag_total += int(lags.sum())
+        self.report.max_policy_lag = max(self.report.max_policy_lag, int(lags.max(initial=0)))
+        self.report.transitions += len(records)
+        self.buffer.extend(records)
+        self._pending += len(records)
+
+        published = False
+        while self._pending >= self.config.batch_size:
+            self.apply_batch(self.buffer.sample(self.config.batch_size, self.rng))
+            self._pending -= self.config.batch_size
+            self.report.updates += 1
+            if self.report.updates % self.config.snapshot_interval == 0:
+                self.q_table.save(self.snapshot_path)
+                self.policy_version += 1
+                published = True
+        return published
+
+    def current_report(self, elapsed: float) -> TrainingReport:
+        report = self.report
+        report.elapsed = elapsed
+        report.policy_version = self.policy_version
+        report.mean_policy_lag = (
+            self._lag_total / report.transitions if report.transitions else 0.0
+        )
+        report.q_table = self.q_table.stats()
+        return report
+
+
+def train(
+    config: SelfPlayConfig,
+    total_transitions: int = 100_000,
+    snapshot_path: Optional[str] = None,
+    max_seconds: Optional[float] = None,
+    on_progress: Optional[Callable[[TrainingReport], None]] = None,
+    progress_interval: float = 5.0,
+) -> Tuple[QTable, TrainingReport]:
+    """
+    Run self-play actors in worker processes and learn from their transitions here;
+    actors pick up the newest policy snapshot before each game. Stops after
+    total_transitions or max_seconds, whichever comes first.
+    """
+    # without a snapshot path the snapshots go to a temporary directory, removed again
+    temporary_directory = tempfile.mkdtemp() if snapshot_path is None else None
+    try:
+        return _train(
+            config,
+            total_transitions,
+            snapshot_path or os.path.join(temporary_directory, "policy.qtable"),
+            max_seconds,
+            on_progress,
+            progress_interval,
+        )
+    finally:
+        if temporary_directory is not None:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+
+def _train(
+    config: SelfPlayConfig,
+    total_transitions: int,
+    snapshot_path: str,
+    max_seconds: Optional[float],
+    on_progress: Optional[Callable[[TrainingReport], None]],
+    progress_interval: float,
+) -> Tuple[QTable, TrainingReport]:
+    learner = Learner(config, snapshot_path)
+
+    context = mp.get_context()
+    policy_version = context.Value("i", 0)
+    transitions = context.Queue(maxsize=config.queue_size)
+    stop = context.Event()
+    actors = [
+        context.Process(
+            target=actor_loop,
+            args=(actor_id, config, snapshot_path, policy_version, transitions, stop),
+            daemon=True,
+        )
+        for actor_id in range(config.actors)
+    ]
+    for actor in actors:
+        actor.start()
+
+    start = last_progress = time.perf_counter()
+    deadline = start + max_seconds if max_seconds is not None else float("inf")
+    try:
+        while (
+            learner.report.transitions < total_transitions and time.perf_counter() < deadline
+        ):
+            try:
+                records = transitions.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if learner.receive(records):
+                policy_version.value = learner.policy_version
+            now = time.perf_counter()
+            if on_progress is not None and now - last_progress >= progress_interval:
+                last_progress = now
+                on_progress(learner.current_report(now - start))
+    finally:
+        stop.set()
+        # keep draining so no actor stays blocked on a full queue while shutting down
+        while any(actor.is_alive() for actor in actors):
+            try:
+                transitions.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        for actor in actors:
+            actor.join()
+    return learner.q_table, learner.current_report(time.perf_counter() - start)
+
+
+def _print_report(report: TrainingReport) -> None:
+    print(
+        f"{report.transitions} transitions ({report.transitions_per_sec:.0f}/sec), "
+        f"{report.updates} updates, policy v{report.policy_version}, "
+        f"lag mean {report.mean_policy_lag:.2f} max {report.max_policy_lag}, "
+        f"table size {report.q_table.size}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.training.self_play",
+        description="Train QLearningStrategy from parallel self-play.",
+    )
+    parser.add_argument("--actors", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--transitions", type=int, default=100_000)
+    parser.add_argument("--seconds", type=float, default=None)
+    parser.add_argument("--batch-size", type=int, default=SelfPlayConfig.batch_size)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=str, required=True, help="final Q-table checkpoint")
+    args = parser.parse_args(argv)
+
+    config = SelfPlayConfig(actors=args.actors, batch_size=args.batch_size, seed=args.seed)
+    q_table, report = train(
+        config,
+        total_transitions=args.transitions,
+        snapshot_path=f"{args.out}.snapshot",
+        max_seconds=args.seconds,
+        on_progress=_print_report,
+    )
+    q_table.save(args.out)
+    _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
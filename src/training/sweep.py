@@ -0,0 +1,356 @@
+import argparse
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.tournament.runner import STRATEGY_REGISTRY, game_seed
+
+# evaluation games are seeded from this game index on, apart from the training games
+EVAL_GAME_OFFSET = 1 << 30
+
+
+class Uniform(NamedTuple):
+    low: float
+    high: float
+    # sample the exponent instead, for learning rates and the like
+    log: bool = False
+
+    def sample(self, rng: np.random.Generator) -> float:
+        if self.log:
+            return math.exp(rng.uniform(math.log(self.low), math.log(self.high)))
+        return float(rng.uniform(self.low, self.high))
+
+
+# every hyperparameter takes one of a list of values, or a value drawn from a Uniform
+SearchSpace = Dict[str, Union[Sequence[Any], Uniform]]
+Params = Dict[str, Any]
+
+
+def grid(space: SearchSpace) -> List[Params]:
+    ranges = [name for name, values in space.items() if isinstance(values, Uniform)]
+    if ranges:
+        raise ValueError(f"A grid needs a list of values per parameter, got ranges {ranges}.")
+    names = list(space)
+    return [
+        dict(zip(names, values, strict=True)) for values in itertools.product(*space.values())
+    ]
+
+
+def sample(space: SearchSpace, amount: int, seed: int = 0) -> List[Params]:
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            name: values.sample(rng)
+            if isinstance(values, Uniform)
+            else values[rng.integers(len(values))]
+            for name, values in space.items()
+        }
+        for _ in range(amount)
+    ]
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    agent: str = "QLearningStrategy"
+    # one seat each; the agent takes the first seat
+    opponents: Tuple[str, ...] = (
+        "DescendingOrderStrategy",
+        "RandomCardStrategy",
+        "FullRandomStrategy",
+        "RiskAwareStrategy",
+    )
+    amount_of_rounds: int = 3
+    amount_of_piles: int = 4
+    amount_of_cards_per_player: int = 10
+    # greedy games after training that a configuration is scored on
+    eval_games: int = 50
+    seed: int = 0
+
+    def __post_init__(self):
+        unknown = [
+            name for name in (self.agent, *self.opponents) if name not in STRATEGY_REGISTRY
+        ]
+        if unknown:
+            raise ValueError(
+                f"Unknown strategies {unknown}, choose from {sorted(STRATEGY_REGISTRY)}"
+            )
+
+
+class Trial(NamedTuple):
+    params: Params
+    # training games played before the evaluation
+    games: int
+    # mean final score over the evaluation games, lower is better
+    score: float
+
+
+def play_agent_game(config: SweepConfig, agent: Any, seed: int) -> int:
+    # the deck has its own generator: every configuration is dealt the same rounds,
+    # however much of the global random stream its agent uses
+    random.seed(seed)
+    np.random.seed(seed)
+    players = [Player(player_id=1, strategy=agent)] + [
+        Player(player_id=seat + 2, strategy=STRATEGY_REGISTRY[name]())
+        for seat, name in enumerate(config.opponents)
+    ]
+    game = Game(
+        players=players,
+        amount_of_rounds=config.amount_of_rounds,
+        amount_of_piles=config.amount_of_piles,
+        amount_of_cards_per_player=config.amount_of_cards_per_player,
+        event_sink=NullSink(),
+        deck_seed=seed,
+    )
+    game.play_game()
+    return game.scores_per_player_per_round[1][-1]
+
+
+def evaluate(config: SweepConfig, params: Params, games: int) -> Trial:
+    """
+    Train a fresh agent built with params for `games` games, then score it on
+    eval_games games without exploration (it keeps learning from them). Every
+    configuration is dealt the same training and evaluation games.
+    """
+    agent = STRATEGY_REGISTRY[config.agent](**params)
+    for game_index in range(games):
+        play_agent_game(config, agent, game_seed(config.seed, game_index))
+    if hasattr(agent, "epsilon"):
+        agent.epsilon = 0.0
+    total = sum(
+        play_agent_game(config, agent, game_seed(config.seed, EVAL_GAME_OFFSET + game_index))
+        for game_index in range(config.eval_games)
+    )
+    return Trial(params, games, total / max(1, config.eval_games))
+
+
+def evaluate_all(
+    config: SweepConfig, candidates: List[Params], games: int, pool: Optional[Executor]
+) -> List[Trial]:
+    if pool is None:
+        return [evaluate(config, params, games) for params in candidates]
+    return list(
+        pool.map(evaluate, itertools.repeat(config), candidates, itertools.repeat(games))
+    )
+
+
+def successive_halving(
+    config: SweepConfig,
+    candidates: List[Params],
+    min_games: int,
+    max_games: int,
+    eta: int = 3,
+    pool: Optional[Executor] = None,
+) -> List[List[Trial]]:
+    """
+    Train every candidate for min_games games and keep the best 1/eta; the survivors
+    get eta times the games, until one is left or they have had max_games. A cut
+    through equal scores keeps all of them, which of those is better is not known. A
+    rung retrains from scratch, so a trial only depends on its params and games.
+    Returns the trials of every rung, best first.
+    """
+    if min_games < 1 or max_games < min_games or eta < 2:
+        raise ValueError("Need 1 <= min_games <= max_games and eta >= 2.")
+    rungs: List[List[Trial]] = []
+    games = min_games
+    while True:
+        trials = sorted(
+            evaluate_all(config, candidates, games, pool), key=lambda trial: trial.score
+        )
+        rungs.append(trials)
+        if len(trials) <= 1 or games >= max_games:
+            return rungs
+        cutoff = trials[max(1, len(trials) // eta) - 1].score
+        candidates = [trial.params for trial in trials if trial.score <= cutoff]
+        games = min(max_games, games * eta)
+
+
+def hyperband(
+    config: SweepConfig,
+    space: SearchSpace,
+    min_games: int,
+    max_games: int,
+    eta: int = 3,
+    pool: Optional[Executor] = None,
+) -> List[List[Trial]]:
+    """
+    Successive halving brackets from many configurations on min_games games down to
+    a few on max_games games each, every bracket with its own random sample.
+    """
+    brackets = int(math.log(max_games / min_games, eta) + 1e-9)
+    rungs: List[List[Trial]] = []
+    for bracket in range(brackets, -1, -1):
+        amount = math.ceil((brackets + 1) / (bracket + 1) * eta**bracket)
+        candidates = sample(space, amount, seed=config.seed + bracket)
+        rungs.extend(
+            successive_halving(
+                config, candidates, max_games // eta**bracket, max_games, eta, pool
+            )
+        )
+    return rungs
+
+
+@dataclass
+class SweepResult:
+    rungs: List[List[Trial]]
+    elapsed: float
+
+    @property
+    def best(self) -> List[Trial]:
+        """
+        The trials with the lowest score among those trained for the most games, the
+        only ones whose scores are comparable. More than one is a tie: the sweep
+        cannot tell those configurations apart.
+        """
+        most_games = max(trial.games for rung in self.rungs for trial in rung)
+        final = [trial for rung in self.rungs for trial in rung if trial.games == most_games]
+        best_score = min(trial.score for trial in final)
+        return [trial for trial in final if trial.score == best_score]
+
+    @property
+    def games_played(self) -> int:
+        return sum(trial.games for rung in self.rungs for trial in rung)
+
+
+def run_sweep(
+    config: SweepConfig,
+    space: SearchSpace,
+    samples: Optional[int] = None,
+    min_games: int = 10,
+    max_games: int = 270,
+    eta: int = 3,
+    workers: Optional[int] = None,
+    use_hyperband: bool = False,
+) -> SweepResult:
+    # the full grid, or `samples` random configurations, through successive halving
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if use_hyperband:
+            rungs = hyperband(config, space, min_games, max_games, eta, pool)
+        else:
+            candidates = (
+                grid(space) if samples is None else sample(space, samples, config.seed)
+            )
+            rungs = successive_halving(config, candidates, min_games, max_games, eta, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return SweepResult(rungs, time.perf_counter() - start)
+
+
+def format_params(params: Params) -> str:
+    return ", ".join(
+        f"{name}={value:.4g}" if isinstance(value, float) else f"{name}={value}"
+        for name, value in params.items()
+    )
+
+
+def format_result(result: SweepResult, top: int = 3) -> str:
+    lines = []
+    for index, trials in enumerate(result.rungs):
+        lines.append(f"rung {index}: {len(trials)} configurations x {trials[0].games} games")
+        for trial in trials[:top]:
+            lines.append(f"  {trial.score:6.2f}  {format_params(trial.params)}")
+    best = result.best
+    if len(best) == 1:
+        lines.append(
+            f"best after {best[0].games} games: {best[0].score:.2f} "
+            f"with {format_params(best[0].params)}"
+        )
+    else:
+        lines.append(
+            f"tie after {best[0].games} games: {len(best)} configurations "
+            f"score {best[0].score:.2f}, no best"
+        )
+        lines.extend(f"  {format_params(trial.params)}" for trial in best)
+    lines.append(f"{result.games_played} training games in {result.elapsed:.1f}s")
+    return "\n".join(lines)
+
+
+def _parse_value(text: str) -> Any:
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_param(text: str) -> Tuple[str, Union[List[Any], Uniform]]:
+    # name=a,b,c for a list of values, name=low:high or name=low:high:log for a range
+    name, separator, values = text.partition("=")
+    if not separator or not values:
+        raise argparse.ArgumentTypeError(f"Expected name=values, got {text!r}.")
+    if ":" in values:
+        low, high, *scale = values.split(":")
+        return name, Uniform(float(low), float(high), log=scale == ["log"])
+    return name, [_parse_value(value) for value in values.split(",")]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.training.sweep",
+        description="Search a learning agent's hyperparameters with successive halving.",
+    )
+    parser.add_argument(
+        "--agent", default=SweepConfig.agent, choices=sorted(STRATEGY_REGISTRY)
+    )
+    parser.add_argument(
+        "--param",
+        type=parse_param,
+        action="append",
+        required=True,
+        help="name=a,b,c or name=low:high[:log], once per hyperparameter",
+    )
+    parser.add_argument(
+        "--opponents",
+        nargs="+",
+        default=list(SweepConfig.opponents),
+        choices=sorted(STRATEGY_REGISTRY),
+    )
+    parser.add_argument(
+        "--samples", type=int, default=None, help="random configurations instead of a grid"
+    )
+    parser.add_argument("--hyperband", action="store_true")
+    parser.add_argument("--min-games", type=int, default=10)
+    parser.add_argument("--max-games", type=int, default=270)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--eval-games", type=int, default=SweepConfig.eval_games)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: all cores)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = SweepConfig(
+        agent=args.agent,
+        opponents=tuple(args.opponents),
+        eval_games=args.eval_games,
+        seed=args.seed,
+    )
+    result = run_sweep(
+        config,
+        dict(args.param),
+        samples=args.samples,
+        min_games=args.min_games,
+        max_games=args.max_games,
+        eta=args.eta,
+        workers=args.workers,
+        use_hyperband=args.hyperband,
+    )
+    print(format_result(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import asyncio
+import random
+from typing import List
+
+from src.agents.q_learning import QLearningStrategy
+from src.game.async_rounds import AsyncGame
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy, RandomCardStrategy
+
+
+def make_players() -> List[Player]:
+    return [
+        Player(player_id=1, strategy=DescendingOrderStrategy()),
+        Player(player_id=2, strategy=RandomCardStrategy()),
+        Player(player_id=3, strategy=QLearningStrategy()),
+    ]
+
+
+def test_async_game_leaves_player_strategies_alone() -> None:
+    players = make_players()
+    strategies = [player.strategy for player in players]
+    random.seed(5)
+    game = AsyncGame(players, amount_of_rounds=2, event_sink=NullSink())
+    asyncio.run(game.play_game())
+    assert [player.strategy for player in players] == strategies
+
+    # the same players sit at a synchronous game afterwards
+    random.seed(5)
+    Game(players, amount_of_rounds=2, event_sink=NullSink()).play_game()
+
+
+def test_async_game_scores_match_game() -> None:
+    for seed in range(3):
+        random.seed(seed)
+        game = Game(make_players(), amount_of_rounds=2, event_sink=NullSink())
+        game.play_game()
+        random.seed(seed)
+        async_game = AsyncGame(make_players(), amount_of_rounds=2, event_sink=NullSink())
+        asyncio.run(async_game.play_game())
+        assert async_game.scores_per_player_per_round == game.scores_per_player_per_round
+        assert not any(async_game.fallback_decisions.values())
@@ -0,0 +1,43 @@
+import random
+from typing import List
+
+import numpy as np
+
+from src.game.batch import BatchGame, highest_cards
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy
+
+ROUNDS = 3
+PLAYERS = 5
+
+
+class RecordingGame(Game):
+    # keeps every round's deck order, to deal the same cards to a BatchGame
+    deck_orders: List[List[int]]
+
+    def initialize_game(self) -> None:
+        self.deck_orders.append(list(self.deck.cards))
+        super().initialize_game()
+
+
+def test_batch_game_scores_match_game_on_the_same_deal() -> None:
+    for seed in range(20):
+        random.seed(seed)
+        players = [
+            Player(player_id=seat, strategy=DescendingOrderStrategy())
+            for seat in range(1, PLAYERS + 1)
+        ]
+        game = RecordingGame(players=players, amount_of_rounds=ROUNDS, event_sink=NullSink())
+        game.deck_orders = []
+        game.play_game()
+
+        batch = BatchGame(1, PLAYERS, amount_of_rounds=ROUNDS)
+        # the game also deals the round after its last one, which is never played
+        for deck_order in game.deck_orders[:ROUNDS]:
+            batch.deal(np.array([deck_order]))
+            batch.play_round(highest_cards)
+        assert batch.round_scores[0].tolist() == [
+            game.scores_per_player_per_round[seat] for seat in range(1, PLAYERS + 1)
+        ]
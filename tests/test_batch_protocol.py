@@ -0,0 +1,77 @@
+import random
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.game.batch import BatchGame
+from src.game.cards import Card
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy, RiskAwareStrategy
+from src.strategies.batch_protocol import BatchSeats, ScalarStrategyAdapter
+
+ROUNDS = 2
+PLAYERS = 4
+
+
+class TrackedRiskAwareStrategy(RiskAwareStrategy):
+    # logs the tracker after every card choice
+    def __init__(self, max_card: int = 103):
+        super().__init__(max_card)
+        self.log: List[Tuple[int, int, int, int]] = []
+
+    def choose_card_to_play(self, game_state: Dict[str, Any]) -> Card:
+        card = super().choose_card_to_play(game_state)
+        self.log.append(
+            (
+                game_state["current_round_number"],
+                game_state["current_turn_number"],
+                self.tracker.known,
+                self.tracker.unseen,
+            )
+        )
+        return card
+
+
+class RecordingGame(Game):
+    # keeps every round's deck order, to deal the same cards to a BatchGame
+    deck_orders: List[List[int]]
+
+    def initialize_game(self) -> None:
+        self.deck_orders.append(list(self.deck.cards))
+        super().initialize_game()
+
+
+def play_one_at_a_time(seed: int) -> Tuple[RecordingGame, TrackedRiskAwareStrategy]:
+    random.seed(seed)
+    strategy = TrackedRiskAwareStrategy()
+    players = [Player(player_id=1, strategy=strategy)] + [
+        Player(player_id=seat, strategy=DescendingOrderStrategy())
+        for seat in range(2, PLAYERS + 1)
+    ]
+    game = RecordingGame(players=players, amount_of_rounds=ROUNDS, event_sink=NullSink())
+    game.deck_orders = []
+    game.play_game()
+    return game, strategy
+
+
+def test_adapter_keeps_strategy_state_per_game() -> None:
+    singles = [play_one_at_a_time(seed) for seed in range(4)]
+    batch = BatchGame(len(singles), PLAYERS, amount_of_rounds=ROUNDS)
+    seats = BatchSeats(
+        [TrackedRiskAwareStrategy()] + [DescendingOrderStrategy() for _ in range(PLAYERS - 1)]
+    )
+    for round_number in range(ROUNDS):
+        batch.deal(np.array([game.deck_orders[round_number] for game, _ in singles]))
+        batch.play_round(seats.choose_cards, seats.choose_piles)
+
+    adapter = seats.groups[0][0]
+    assert isinstance(adapter, ScalarStrategyAdapter)
+    for game_index, (game, strategy) in enumerate(singles):
+        assert adapter.strategies[game_index].log == strategy.log
+        assert batch.round_scores[game_index].tolist() == [
+            game.scores_per_player_per_round[player_id] for player_id in range(1, PLAYERS + 1)
+        ]
+    # the template is only copied, never played
+    assert seats.groups[0][0].strategy.log == []
@@ -0,0 +1,84 @@
+import itertools
+import math
+from typing import Any, Dict, List, Sequence
+
+from src.game.cards import card_points_table, get_card
+from src.game.player import Player
+from src.strategies import RiskAwareStrategy
+from src.strategies.card_tracker import CardTracker, hypergeometric_pmf
+
+HAND = [12, 41, 57, 90]
+
+
+def table_state(piles: Sequence[Sequence[int]], total_players: int = 4) -> Dict[str, Any]:
+    points = card_points_table()
+    seen_mask = 0
+    for card_number in itertools.chain(*piles):
+        seen_mask |= 1 << card_number
+    return {
+        "piles": tuple(tuple(get_card(number) for number in pile) for pile in piles),
+        "last_cards_per_pile": tuple(get_card(pile[-1]) for pile in piles),
+        "points_per_pile": tuple(sum(points[number] for number in pile) for pile in piles),
+        "seen_cards_mask": seen_mask,
+        "total_players": total_players,
+        "current_round_number": 0,
+        "current_turn_number": 0,
+    }
+
+
+# pile tops 10, 40, 60 and 80; the pile topped by 40 is full
+PILES: List[List[int]] = [[10], [3, 20, 25, 33, 40], [60], [70, 80]]
+
+
+def test_unseen_counts_match_brute_force() -> None:
+    state = table_state(PILES)
+    tracker = CardTracker()
+    tracker.observe(state, HAND)
+    seen = set(itertools.chain(*PILES, HAND))
+    unseen = [number for number in range(1, 104) if number not in seen]
+    assert tracker.unseen_count == len(unseen)
+    points = card_points_table()
+    for low, high in [(0, 104), (10, 12), (40, 57), (1, 3), (80, 103), (55, 55)]:
+        between = [number for number in unseen if low < number < high]
+        assert tracker.unseen_between(low, high) == len(between)
+        assert tracker.unseen_points_between(low, high) == sum(points[n] for n in between)
+
+
+def test_hypergeometric_pmf_matches_counting() -> None:
+    population, successes, draws = 9, 4, 3
+    draws_with = [
+        sum(number < successes for number in sample)
+        for sample in itertools.combinations(range(population), draws)
+    ]
+    total = math.comb(population, draws)
+    expected = [draws_with.count(k) / total for k in range(min(successes, draws) + 1)]
+    assert hypergeometric_pmf(population, successes, draws) == tuple(expected)
+
+
+def test_full_pile_with_no_card_between_is_taken() -> None:
+    state = table_state(PILES)
+    tracker = CardTracker()
+    tracker.observe(state, HAND)
+    risk = tracker.pile_risk(state, 41)
+    assert risk.pile_index == 1
+    assert risk.take_probability == 1.0
+    assert risk.expected_points == state["points_per_pile"][1]
+
+
+def test_unplayable_card_replaces_the_cheapest_pile() -> None:
+    piles = [[30], [3, 20, 25, 33, 40], [60], [70, 80]]
+    state = table_state(piles)
+    tracker = CardTracker()
+    tracker.observe(state, HAND)
+    risk = tracker.pile_risk(state, 12)
+    assert risk.pile_index is None
+    assert risk.take_probability == 1.0
+    assert risk.expected_points == min(state["points_per_pile"])
+
+
+def test_risk_aware_strategy_avoids_the_sixth_card() -> None:
+    strategy = RiskAwareStrategy()
+    player = Player(player_id=1, strategy=strategy)
+    player.receive_cards([get_card(41), get_card(90)])
+    # 41 certainly takes the full pile, 90 only if three opponents land below it
+    assert strategy.choose_card_to_play(table_state(PILES)).card_number == 90
@@ -0,0 +1,62 @@
+import pytest
+
+from src.game.cards import Card, Deck, card_points_table, get_card
+
+
+def test_cards_are_interned() -> None:
+    assert get_card(55) is get_card(55)
+    assert get_card(55) == Card(55)
+    assert [get_card(number).card_points for number in (1, 15, 22, 55)] == [1, 2, 5, 7]
+    assert card_points_table()[1:] == tuple(
+        Card(number).card_points for number in range(1, 104)
+    )
+
+
+def test_deck_draws_every_card_once() -> None:
+    deck = Deck(seed=1)
+    drawn = [deck.draw_card() for _ in range(103)]
+    assert sorted(card.card_number for card in drawn) == list(range(1, 104))
+    assert all(card is get_card(card.card_number) for card in drawn)
+    assert len(deck) == 0 and deck.min_card() is None
+    with pytest.raises(ValueError):
+        deck.draw_card()
+
+
+def test_cards_drawn_by_number_stay_out_of_the_deck() -> None:
+    deck = Deck(start_card=1, end_card=10, seed=2)
+    assert deck.draw_card(7) is get_card(7)
+    with pytest.raises(ValueError):
+        deck.draw_card(7)
+    with pytest.raises(ValueError):
+        deck.draw_card(11)
+    deck.shuffle()
+    assert len(deck) == 9
+    assert 7 not in deck.cards
+    assert sorted(deck.draw_card().card_number for _ in range(9)) == [*range(1, 7), 8, 9, 10]
+
+
+def test_seeded_decks_deal_the_same_rounds() -> None:
+    first, second = Deck(seed=3), Deck(seed=3)
+    for _ in range(3):
+        assert list(first.cards) == list(second.cards)
+        assert sorted(first.cards) == list(range(1, 104))
+        first.reset()
+        second.reset()
+
+
+def test_snapshot_and_restore() -> None:
+    deck = Deck(seed=4)
+    deck.draw_card(50)
+    for _ in range(5):
+        deck.draw_card()
+    snapshot = deck.snapshot()
+    cards = list(deck.cards)
+    rest = [deck.draw_card() for _ in range(20)]
+    deck.restore(snapshot)
+    assert list(deck.cards) == cards
+    assert [deck.draw_card() for _ in range(20)] == rest
+
+
+def test_an_empty_range_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        Deck(start_card=10, end_card=9)
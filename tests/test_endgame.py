@@ -0,0 +1,53 @@
+import random
+from itertools import combinations
+
+from src.agents.endgame import EndgameSolver, EndgameStrategy, resolve_turn
+from src.agents.q_learning import QLearningStrategy
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy
+
+
+def test_last_card_value_is_exact() -> None:
+    solver = EndgameSolver()
+    table = ((12, 5, 9), (40, 2, 3), (71, 4, 6), (90, 1, 1))
+    unseen = 0
+    for card_number in (3, 14, 20, 41, 45, 60, 66, 72, 95, 101):
+        unseen |= 1 << card_number
+    cards = [card_number for card_number in range(104) if unseen >> card_number & 1]
+    for my_card in (13, 44, 68, 100):
+        for opponents in (1, 2, 3):
+            outcomes = list(combinations(cards, opponents))
+            expected = sum(
+                resolve_turn(table, outcome + (my_card,), my_card, solver.points)[1]
+                for outcome in outcomes
+            ) / len(outcomes)
+            value = solver.last_card_value(table, my_card, unseen, opponents)
+            assert abs(value - expected) < 1e-9
+
+
+def test_memo_tells_opponent_counts_apart() -> None:
+    solver = EndgameSolver()
+    # 44 is the sixth card on 40 when an opponent plays 41 first
+    table = ((12, 5, 9), (40, 4, 6), (71, 4, 6), (90, 1, 1))
+    unseen = sum(1 << card_number for card_number in (3, 14, 41, 72, 95))
+    one = solver.value(table, (44,), unseen, 1)
+    three = solver.value(table, (44,), unseen, 3)
+    assert one == solver.last_card_value(table, 44, unseen, 1)
+    assert three == solver.last_card_value(table, 44, unseen, 3)
+    assert one != three
+
+
+def test_learning_fallback_keeps_learning() -> None:
+    assert not EndgameStrategy().learns
+    fallback = QLearningStrategy()
+    strategy = EndgameStrategy(fallback=fallback)
+    assert strategy.learns
+    random.seed(4)
+    players = [
+        Player(player_id=1, strategy=strategy),
+        Player(player_id=2, strategy=DescendingOrderStrategy()),
+    ]
+    Game(players, amount_of_rounds=1, event_sink=NullSink()).play_game()
+    assert len(fallback.q_table) > 0
@@ -0,0 +1,97 @@
+import random
+from collections import Counter
+from typing import List
+
+import pytest
+
+from src.game.events import (
+    CardPlayed,
+    CardUnplayable,
+    ConsoleSink,
+    EventSink,
+    GameEvent,
+    NullSink,
+    PileReplaced,
+    PileTaken,
+    RingBufferSink,
+    RoundEnded,
+    TurnEnded,
+    TurnStarted,
+    Verbosity,
+)
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy, RandomCardStrategy
+
+ROUNDS = 2
+CARDS = 10
+
+
+def play(sink: EventSink, seed: int = 3) -> Game:
+    random.seed(seed)
+    players = [
+        Player(player_id=seat, strategy=strategy())
+        for seat, strategy in enumerate(
+            (DescendingOrderStrategy, RandomCardStrategy, RandomCardStrategy), start=1
+        )
+    ]
+    game = Game(players, amount_of_rounds=ROUNDS, event_sink=sink)
+    game.play_game()
+    return game
+
+
+def test_move_events_account_for_every_card_and_point() -> None:
+    sink = RingBufferSink(capacity=10_000)
+    game = play(sink)
+    events = sink.snapshot()
+    kinds = Counter(type(event) for event in events)
+    assert kinds[TurnStarted] == kinds[TurnEnded] == ROUNDS * CARDS
+    assert kinds[RoundEnded] == ROUNDS
+    # every card is either played on a pile or replaces one
+    assert kinds[CardPlayed] + kinds[PileReplaced] == ROUNDS * CARDS * 3
+    assert kinds[CardUnplayable] == kinds[PileReplaced]
+
+    points: Counter[int] = Counter()
+    for event in events:
+        if isinstance(event, (PileTaken, PileReplaced)):
+            points[event.player_id] += event.points
+    final = [event for event in events if isinstance(event, RoundEnded)][-1]
+    assert final.scores == {
+        player_id: scores[-1]
+        for player_id, scores in game.scores_per_player_per_round.items()
+    }
+    assert dict(points) == {
+        player_id: score for player_id, score in final.scores.items() if score
+    }
+
+
+def test_sinks_only_get_events_up_to_their_level() -> None:
+    rounds = RingBufferSink(level=Verbosity.ROUNDS)
+    play(rounds)
+    assert [type(event) for event in rounds.events] == [RoundEnded] * ROUNDS
+    turns = RingBufferSink(capacity=10_000, level=Verbosity.TURNS)
+    play(turns)
+    assert {type(event) for event in turns.events} == {TurnStarted, TurnEnded, RoundEnded}
+
+
+def test_the_sink_does_not_change_the_game() -> None:
+    silent = play(NullSink(), seed=8)
+    recorded = play(RingBufferSink(), seed=8)
+    assert silent.scores_per_player_per_round == recorded.scores_per_player_per_round
+
+
+def test_ring_buffer_keeps_the_latest_events() -> None:
+    sink = RingBufferSink(capacity=5)
+    play(sink)
+    events: List[GameEvent] = sink.snapshot()
+    assert len(events) == 5
+    assert isinstance(events[-1], RoundEnded)
+    sink.clear()
+    assert sink.snapshot() == []
+
+
+def test_console_sink_prints_moves(capsys: pytest.CaptureFixture[str]) -> None:
+    ConsoleSink().emit(CardPlayed(2, 17, 0, 3, 4))
+    assert capsys.readouterr().out == (
+        "Player 2 successfully plays card 17, it is placed on pile 1: 3 cards, 4 points.\n"
+    )
@@ -0,0 +1,24 @@
+import random
+
+from src.game.events import NullSink
+from src.game.instrumentation import GAME_PHASES
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy, RandomCardStrategy
+
+
+def test_every_game_phase_is_timed() -> None:
+    random.seed(2)
+    players = [
+        Player(player_id=1, strategy=DescendingOrderStrategy()),
+        Player(player_id=2, strategy=RandomCardStrategy()),
+        Player(player_id=3, strategy=RandomCardStrategy()),
+    ]
+    game = Game(players, amount_of_rounds=2, event_sink=NullSink())
+    stats = game.enable_instrumentation()
+    game.play_game()
+    untimed = [name for name in GAME_PHASES if not stats.phase(f"Game.{name}").calls]
+    assert untimed == []
+    # one view per card choice, and one per pile choice
+    views = stats.phase("Game.get_personalized_game_state_for_player").calls
+    assert views == 2 * 10 * 3 + stats.phase("Game.get_player_replaces_pile_choice").calls
@@ -0,0 +1,89 @@
+import random
+from typing import Any, Dict, List, Tuple
+
+from src.agents.ismcts import ISMCTSStrategy
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy
+
+
+class CheckedISMCTSStrategy(ISMCTSStrategy):
+    # keeps every pile choice with the number of piles it chose from
+    def __init__(self, iterations: int, seed: int) -> None:
+        super().__init__(iterations=iterations, seed=seed)
+        self.pile_choices: List[Tuple[int, int]] = []
+
+    def choose_pile_to_replace(self, game_state: Dict[str, Any]) -> int:
+        pile_index = super().choose_pile_to_replace(game_state)
+        self.pile_choices.append((pile_index, len(game_state["piles"])))
+        return pile_index
+
+
+def started_game(strategy: ISMCTSStrategy, seed: int) -> Game:
+    random.seed(seed)
+    players = [Player(player_id=1, strategy=strategy)] + [
+        Player(player_id=seat, strategy=DescendingOrderStrategy()) for seat in range(2, 5)
+    ]
+    game = Game(players, amount_of_rounds=2, event_sink=NullSink())
+    game.initialize_game()
+    game.start_round()
+    return game
+
+
+def choose_card(game: Game) -> None:
+    player = game.players[0]
+    player.choose_card_to_play(game.get_personalized_game_state_for_player(player))
+
+
+def test_iteration_budget() -> None:
+    strategy = ISMCTSStrategy(iterations=50, seed=0)
+    choose_card(started_game(strategy, seed=1))
+    assert strategy.last_rollouts == strategy.total_rollouts == 50
+
+
+def test_time_budget_stops_the_search() -> None:
+    strategy = ISMCTSStrategy(iterations=10**9, time_limit=0.02, seed=0)
+    choose_card(started_game(strategy, seed=1))
+    assert 0 < strategy.last_rollouts < 10**9
+    assert 0.02 <= strategy.last_search_seconds < 1.0
+
+
+def test_rollouts_per_sec() -> None:
+    strategy = ISMCTSStrategy(iterations=40, seed=0)
+    assert strategy.rollouts_per_sec == 0.0
+    game = started_game(strategy, seed=1)
+    choose_card(game)
+    choose_card(game)
+    assert strategy.total_rollouts == 80
+    assert strategy.rollouts_per_sec == 80 / strategy.total_search_seconds
+
+
+def test_tree_is_reused_on_the_next_turn_only() -> None:
+    strategy = ISMCTSStrategy(iterations=200, seed=0)
+    game = started_game(strategy, seed=1)
+    player = game.players[0]
+    game.play_turn()
+    kept = strategy._root
+    assert kept is not None and kept.visits > 0
+    next_turn = game.get_personalized_game_state_for_player(player)
+    assert strategy._root_for(next_turn) is kept
+
+    # a turn later, or with reuse off, the search starts from a fresh root
+    game.play_turn()
+    skipped = dict(game.get_personalized_game_state_for_player(player).freeze())
+    skipped["current_turn_number"] += 1
+    assert strategy._root_for(skipped).visits == 0
+    strategy.reuse_tree = False
+    assert strategy._root_for(game.get_personalized_game_state_for_player(player)).visits == 0
+
+
+def test_pile_choices_are_valid_indices() -> None:
+    strategy = CheckedISMCTSStrategy(iterations=20, seed=0)
+    random.seed(2)
+    players = [Player(player_id=1, strategy=strategy)] + [
+        Player(player_id=seat, strategy=DescendingOrderStrategy()) for seat in range(2, 5)
+    ]
+    Game(players, amount_of_rounds=2, event_sink=NullSink()).play_game()
+    assert strategy.pile_choices
+    assert all(0 <= pile_index < piles for pile_index, piles in strategy.pile_choices)
@@ -0,0 +1,61 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from src.tournament.ladder import Rating, RatingLadder, play_ladder
+from src.tournament.runner import TournamentConfig
+
+
+def test_two_player_update_by_hand() -> None:
+    ladder = RatingLadder(["first", "second"])
+    ladder.record(["first", "second"], [10, 20])
+    # equal ratings: c^2 = 2 sigma^2 + 2 beta^2 = 6250/36, P(win) = 1/2, so the mean
+    # moves by sigma^2 / c / 2 = 25 / (3 sqrt(10)) and the variance shrinks by
+    # (sigma / c) (sigma^2 / c^2) / 4 = 0.2 / sqrt(10)
+    shift = 25 / (3 * math.sqrt(10))
+    sigma = 25 / 3 * math.sqrt(1 - 0.2 / math.sqrt(10))
+    assert ladder.ratings["first"] == pytest.approx(Rating(25 + shift, sigma, 1))
+    assert ladder.ratings["second"] == pytest.approx(Rating(25 - shift, sigma, 1))
+    assert ladder.games == 1
+    assert [name for name, _ in ladder.leaderboard()] == ["first", "second"]
+
+
+def test_draws_keep_the_means_and_same_strategy_seats_are_not_compared() -> None:
+    ladder = RatingLadder(["first", "second"])
+    ladder.record(["first", "second"], [15, 15])
+    assert ladder.ratings["first"].mu == ladder.ratings["second"].mu == 25.0
+    assert ladder.ratings["first"].sigma < 25 / 3
+
+    ladder = RatingLadder(["first", "second"])
+    ladder.record(["first", "first", "second"], [1, 30, 30])
+    # the two seats of first count against second only: one win and one draw
+    assert ladder.ratings["first"].mu > 25.0 > ladder.ratings["second"].mu
+    assert ladder.ratings["first"].games == 1
+
+
+def test_matchmaking_seats_the_most_uncertain_first() -> None:
+    ladder = RatingLadder(["known", "new", "other", "third"])
+    ladder.ratings["known"] = Rating(30.0, 1.0, 100)
+    lineup = ladder.next_lineup(3)
+    assert len(set(lineup)) == 3
+    assert "known" not in lineup
+    # fewer strategies than seats: the most uncertain fill the rest
+    assert sorted(ladder.next_lineup(5, ["known", "new"])) == sorted(
+        ["new", "known", "new", "known", "new"]
+    )
+    with pytest.raises(ValueError):
+        ladder.next_lineup(3, ["known"])
+
+
+def test_play_ladder_saves_and_resumes(tmp_path: Path) -> None:
+    path = str(tmp_path / "ladder.json")
+    table = TournamentConfig(amount_of_rounds=1)
+    strategies = ["DescendingOrderStrategy", "FullRandomStrategy", "RandomCardStrategy"]
+    ladder = play_ladder(
+        RatingLadder(), 6, seats=3, table=table, strategies=strategies, workers=1, path=path
+    )
+    loaded = RatingLadder.load(path)
+    assert loaded.games == ladder.games == 6
+    assert loaded.ratings == ladder.ratings
+    assert loaded.config == ladder.config
@@ -0,0 +1,38 @@
+import random
+
+from src.agents.linear_q import LinearQStrategy
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy
+
+
+def play(strategy: LinearQStrategy, cards_per_player: int, seed: int) -> None:
+    random.seed(seed)
+    players = [
+        Player(player_id=1, strategy=strategy),
+        Player(player_id=2, strategy=DescendingOrderStrategy()),
+        Player(player_id=3, strategy=DescendingOrderStrategy()),
+    ]
+    Game(
+        players,
+        amount_of_rounds=2,
+        amount_of_cards_per_player=cards_per_player,
+        event_sink=NullSink(),
+    ).play_game()
+
+
+def test_learns_from_hands_of_any_size() -> None:
+    strategy = LinearQStrategy(batch_size=8)
+    play(strategy, cards_per_player=14, seed=1)
+    assert strategy.updates > 0
+
+
+def test_pending_transitions_are_learned_at_the_end_of_a_game() -> None:
+    # a buffer larger than the game's transitions would otherwise never fill
+    strategy = LinearQStrategy(batch_size=1_000)
+    weights = strategy.weights.copy()
+    play(strategy, cards_per_player=10, seed=2)
+    assert strategy.updates == 1
+    assert strategy._pending == 0
+    assert (strategy.weights != weights).any()
@@ -0,0 +1,87 @@
+import random
+import threading
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.game.cards import Card, get_card
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy
+from src.strategies.features import FeatureEncoder
+from src.strategies.mlp import InferenceBatcher, MLPPolicy
+from src.strategies.Neural_network_strategy import NeuralNetworkStrategy
+
+
+class CheckedNeuralNetworkStrategy(NeuralNetworkStrategy):
+    # counts the choices that are not a card in hand or a pile on the table
+    invalid: int = 0
+
+    def choose_card_to_play(self, game_state: Dict[str, Any]) -> Card:
+        card = super().choose_card_to_play(game_state)
+        self.invalid += card.card_number not in self.player.hand
+        return card
+
+    def choose_pile_to_replace(self, game_state: Dict[str, Any]) -> int:
+        pile_index = super().choose_pile_to_replace(game_state)
+        self.invalid += not 0 <= pile_index < len(game_state["piles"])
+        return pile_index
+
+
+def test_encoder_layout() -> None:
+    encoder = FeatureEncoder(max_card=10, amount_of_piles=2, max_pile_points=10.0)
+    piles = ((get_card(1), get_card(4)), (get_card(7),))
+    game_state = {
+        "last_cards_per_pile": (get_card(4), get_card(7)),
+        "piles": piles,
+        "points_per_pile": (2, 1),
+        "seen_cards_mask": (1 << 1) | (1 << 4) | (1 << 7),
+        "current_round_number": 1,
+        "total_rounds": 4,
+        "current_turn_number": 3,
+        "cards_per_player": 6,
+    }
+    features = encoder.encode(game_state, [2, 10])
+    assert features.shape == (encoder.size,) == (10 + 3 * 2 + 10 + 2,)
+    assert features.dtype == np.float32
+    expected = np.zeros(encoder.size, dtype=np.float32)
+    expected[[1, 9]] = 1.0
+    expected[encoder.tops_offset : encoder.tops_offset + 2] = [0.4, 0.7]
+    expected[encoder.lengths_offset : encoder.lengths_offset + 2] = [0.4, 0.2]
+    expected[encoder.points_offset : encoder.points_offset + 2] = [0.2, 0.1]
+    expected[encoder.seen_offset + np.array([0, 3, 6])] = 1.0
+    expected[encoder.progress_offset :] = [0.25, 0.5]
+    np.testing.assert_allclose(features, expected)
+
+
+def test_policy_only_picks_cards_in_hand() -> None:
+    model = MLPPolicy(FeatureEncoder().size, hidden_sizes=(16,), seed=0)
+    strategies = [CheckedNeuralNetworkStrategy(model) for _ in range(2)]
+    random.seed(2)
+    players = [
+        Player(player_id=seat + 1, strategy=strategy)
+        for seat, strategy in enumerate(strategies)
+    ] + [Player(player_id=3, strategy=DescendingOrderStrategy())]
+    Game(players, amount_of_rounds=3, event_sink=NullSink()).play_game()
+    assert sum(strategy.invalid for strategy in strategies) == 0
+
+
+def test_batched_predictions_from_threads_match_predict() -> None:
+    model = MLPPolicy(12, hidden_sizes=(8,), max_card=5, amount_of_piles=2, seed=1)
+    batcher = InferenceBatcher(model, max_batch=4, max_wait=0.05)
+    inputs = np.random.default_rng(2).random((10, 12), dtype=np.float32)
+    outputs: List[np.ndarray] = [np.empty(0)] * len(inputs)
+    start = threading.Barrier(len(inputs))
+
+    def predict(row: int) -> None:
+        start.wait()
+        outputs[row] = batcher.predict(inputs[row])
+
+    threads = [threading.Thread(target=predict, args=(row,)) for row in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    np.testing.assert_allclose(np.array(outputs), model.predict(inputs), rtol=1e-6)
+    assert batcher.rows_run == len(inputs)
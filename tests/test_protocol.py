@@ -0,0 +1,25 @@
+import pytest
+
+from src.server.protocol import decode_message, encode_message
+
+
+def test_decode_message_round_trips() -> None:
+    message = {"t": "move", "id": 7, "move": 42}
+    assert decode_message(encode_message(message)) == message
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        b"[1, 2]",
+        b'{"t": "bogus"}',
+        b'{"t": "move", "move": 42}',
+        b'{"t": "move", "id": [7], "move": 42}',
+        b'{"t": "move", "id": true, "move": 42}',
+        b'{"t": "card", "id": 7, "state": []}',
+        b"not json",
+    ],
+)
+def test_decode_message_rejects_malformed_messages(line: bytes) -> None:
+    with pytest.raises(ValueError):
+        decode_message(line)
@@ -0,0 +1,53 @@
+import random
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.agents.q_table import PackedState, QTable, pack_state, pack_states, with_actions
+
+
+def fill(table: QTable, amount: int, seed: int) -> Dict[Tuple[PackedState, int], float]:
+    rng = random.Random(seed)
+    written = {}
+    for index in range(amount):
+        state = pack_state(rng.sample(range(1, 104), 4), rng.sample(range(1, 104), 10))
+        action = rng.randrange(1, 104)
+        table.set(state, action, float(index))
+        written[state, action] = float(index)
+    return written
+
+
+def test_resizes_and_evictions_keep_every_surviving_entry() -> None:
+    table = QTable(max_entries=3_000, initial_capacity=16, seed=0)
+    written = fill(table, 10_000, seed=1)
+    assert table.evictions > 0
+    surviving = [(key, value) for key, value in written.items() if key in table]
+    assert len(surviving) == len(table)
+    assert all(table.get(*key) == np.float32(value) for key, value in surviving)
+
+
+def test_get_many_agrees_with_get() -> None:
+    table = QTable(max_entries=3_000, initial_capacity=16, seed=0)
+    written = fill(table, 2_000, seed=2)
+    rng = np.random.default_rng(3)
+    # every written key, and as many random ones that are almost all missing
+    states = np.array([state for state, _ in written], dtype=np.uint64)
+    actions = np.array([[action] for _, action in written])
+    random_states = pack_states(
+        rng.integers(1, 104, (len(written), 4)), rng.integers(0, 104, (len(written), 10))
+    )
+    random_actions = rng.integers(1, 104, (len(written), 1))
+    keys = np.concatenate(
+        [with_actions(states, actions), with_actions(random_states, random_actions)]
+    )
+    values = table.get_many(keys, default=-1.0)
+    assert values.shape == (2 * len(written), 1)
+    expected = [
+        table.get(tuple(int(word) for word in state), int(action[0]), default=-1.0)
+        for state, action in zip(
+            np.concatenate([states, random_states]),
+            np.concatenate([actions, random_actions]),
+            strict=True,
+        )
+    ]
+    assert values[:, 0].tolist() == expected
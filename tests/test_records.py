@@ -0,0 +1,58 @@
+import os
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+from src.agents.q_learning import QLearningStrategy
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.records import GameRecorder, GameRecordReader, GameRecordWriter
+from src.game.replay import Replay
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy, FullRandomStrategy, RandomCardStrategy
+
+
+def record_games(path: str, games: int) -> List[Tuple[int, ...]]:
+    # the final score of every seat per game
+    final_scores = []
+    with GameRecordWriter(path) as writer:
+        for seed in range(games):
+            random.seed(seed)
+            players = [
+                Player(player_id=seat + 1, strategy=strategy)
+                for seat, strategy in enumerate(
+                    (
+                        FullRandomStrategy(),
+                        DescendingOrderStrategy(),
+                        RandomCardStrategy(),
+                        QLearningStrategy(),
+                    )
+                )
+            ]
+            game = Game(
+                players,
+                amount_of_rounds=3,
+                event_sink=NullSink(),
+                recorder=GameRecorder(writer),
+            )
+            game.play_game()
+            final_scores.append(
+                tuple(
+                    game.scores_per_player_per_round[player.player_id][-1]
+                    for player in players
+                )
+            )
+    return final_scores
+
+
+def test_replays_reproduce_recorded_games(tmp_path: Path) -> None:
+    path = str(tmp_path / "games.bin")
+    final_scores = record_games(path, 30)
+    with GameRecordReader(path) as reader:
+        assert len(reader) == len(final_scores)
+        assert [Replay(record).final_scores() for record in reader] == final_scores
+
+    # without its index the reader rebuilds it from the records
+    os.remove(f"{path}.idx")
+    with GameRecordReader(path) as reader:
+        assert Replay(reader[17]).final_scores() == final_scores[17]
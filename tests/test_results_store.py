@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.results.store import ResultsStore, ResultsWriter, aggregate
+
+STRATEGIES = ("DescendingOrderStrategy", "RandomCardStrategy", "RiskAwareStrategy")
+
+
+def append_games(writer: ResultsWriter, first_seed: int, games: int) -> None:
+    # seat s of game g scores g + s per round; seed 2 is a three-way tie
+    for seed in range(first_seed, first_seed + games):
+        round_scores = [[seed + seat, seed + seat] for seat in range(3)]
+        final_scores = [2 * (seed + seat) for seat in range(3)]
+        if seed == 2:
+            final_scores = [4, 4, 4]
+        writer.append(seed, STRATEGIES, round_scores, final_scores, [seed, 0, 1])
+
+
+def test_round_trip_across_chunks_and_reopens(tmp_path: Path) -> None:
+    path = str(tmp_path / "results")
+    with ResultsWriter(path, seats=3, rounds=2, chunk_rows=4) as writer:
+        append_games(writer, 0, 6)
+    # the second writer appends to the same directory
+    with ResultsWriter(path, seats=3, rounds=2, chunk_rows=4) as writer:
+        append_games(writer, 6, 3)
+
+    store = ResultsStore(path)
+    assert len(store) == 9
+    assert [chunk["rows"] for chunk in store.manifest["chunks"]] == [4, 2, 3]
+    assert store.strategies == list(STRATEGIES)
+    chunks = list(store.chunks())
+    seeds = np.concatenate([chunk["seed"] for chunk in chunks])
+    assert seeds.tolist() == list(range(9))
+    round_scores = np.concatenate([chunk["round_scores"] for chunk in chunks])
+    assert round_scores.shape == (9, 3, 2)
+    assert round_scores[7].tolist() == [[7, 7], [8, 8], [9, 9]]
+    pile_takes = np.concatenate([chunk["pile_takes"] for chunk in chunks])
+    assert pile_takes[:, 0].tolist() == list(range(9))
+
+
+def test_reopening_with_other_seats_or_rounds_fails(tmp_path: Path) -> None:
+    path = str(tmp_path / "results")
+    with ResultsWriter(path, seats=3, rounds=2) as writer:
+        append_games(writer, 0, 1)
+    with pytest.raises(ValueError):
+        ResultsWriter(path, seats=4, rounds=2)
+    with pytest.raises(ValueError):
+        ResultsWriter(path, seats=3, rounds=5)
+
+
+def test_aggregate_splits_tied_wins(tmp_path: Path) -> None:
+    path = str(tmp_path / "results")
+    with ResultsWriter(path, seats=3, rounds=2, chunk_rows=2) as writer:
+        append_games(writer, 0, 4)
+    totals = aggregate(ResultsStore(path))
+    # seat 0 has the lowest score in games 0, 1 and 3 and a third of the tie in game 2
+    assert totals["DescendingOrderStrategy"].wins == pytest.approx(3 + 1 / 3)
+    assert totals["RandomCardStrategy"].wins == pytest.approx(1 / 3)
+    assert totals["RiskAwareStrategy"].wins == pytest.approx(1 / 3)
+    assert sum(total.wins for total in totals.values()) == pytest.approx(4)
+    descending = totals["DescendingOrderStrategy"]
+    assert descending.seats == 4
+    assert descending.mean_score == (0 + 2 + 4 + 6) / 4
+    assert descending.score_histogram[[0, 2, 4, 6]].tolist() == [1, 1, 1, 1]
+    assert descending.pile_takes == 0 + 1 + 2 + 3
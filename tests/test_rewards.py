@@ -0,0 +1,41 @@
+import random
+from typing import Any, Dict, List, Tuple
+
+from src.game.cards import Card
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import DescendingOrderStrategy
+
+
+class RewardLog(DescendingOrderStrategy):
+    # keeps the reward of every turn, the points taken in it and the round's points
+    # before it
+    def __init__(self) -> None:
+        self.log: List[Tuple[float, int, int]] = []
+
+    def update(
+        self,
+        state: Dict[str, Any],
+        action: Tuple[int, int],
+        reward: float,
+        next_state: Dict[str, Any],
+        possible_actions: List[Card],
+    ) -> None:
+        round_number = state["current_round_number"]
+        scores = state["points_per_player_per_turn"][self.player.player_id]
+        next_scores = next_state["points_per_player_per_turn"][self.player.player_id]
+        before = scores[round_number]
+        self.log.append((reward, next_scores[round_number] - before, before))
+
+
+def test_reward_is_minus_the_points_taken_in_the_turn() -> None:
+    strategy = RewardLog()
+    random.seed(4)
+    players = [Player(player_id=1, strategy=strategy)] + [
+        Player(player_id=seat, strategy=DescendingOrderStrategy()) for seat in range(2, 6)
+    ]
+    Game(players, amount_of_rounds=3, event_sink=NullSink()).play_game()
+    assert all(reward == -taken for reward, taken, _ in strategy.log)
+    # a turn without a pile taken gives 0, also after points earlier in the round
+    assert any(taken == 0 and before > 0 for _, taken, before in strategy.log)
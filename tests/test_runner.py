@@ -0,0 +1,35 @@
+import pytest
+
+from src.tournament.runner import TournamentConfig, run_tournament, split_games, summarise
+
+CONFIG = TournamentConfig(
+    strategies=(
+        "DescendingOrderStrategy",
+        "FullRandomStrategy",
+        "RandomCardStrategy",
+        "QLearningStrategy",
+    ),
+    amount_of_rounds=2,
+)
+
+
+def test_results_do_not_depend_on_the_workers() -> None:
+    single = run_tournament(CONFIG, 24, workers=1, seed=5)
+    parallel = run_tournament(CONFIG, 24, workers=3, seed=5, chunks_per_worker=2)
+    assert parallel == single
+    assert [summary.game_index for summary in single] == list(range(24))
+    assert summarise(CONFIG, parallel) == summarise(CONFIG, single)
+
+
+def test_split_games_covers_every_game_once() -> None:
+    chunks = split_games(10, 4)
+    assert chunks[0][0] == 0 and chunks[-1][1] == 10
+    assert all(
+        stop == start for (_, stop), (start, _) in zip(chunks[:-1], chunks[1:], strict=True)
+    )
+    assert split_games(2, 8) == [(0, 1), (1, 2)]
+
+
+def test_unknown_strategies_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        TournamentConfig(strategies=("DescendingOrderStrategy", "NoSuchStrategy"))
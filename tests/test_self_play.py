@@ -0,0 +1,48 @@
+import os
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.agents.q_table import pack_state
+from src.training import self_play
+from src.training.self_play import TRANSITION_DTYPE, Learner, SelfPlayConfig, train
+
+
+def test_apply_batch_matches_one_update_per_transition(tmp_path: Path) -> None:
+    rng = random.Random(3)
+    states = [
+        (rng.sample(range(1, 104), 4), rng.sample(range(1, 104), rng.randrange(1, 11)))
+        for _ in range(40)
+    ]
+    # terminal next states, so no target depends on an update in the same batch
+    transitions = [
+        (pack_state(tops, hand), hand[0], -float(rng.randrange(8)), pack_state(tops, []))
+        for tops, hand in states
+    ]
+    learner = Learner(SelfPlayConfig(), str(tmp_path / "policy.qtable"))
+    expected = {}
+    for _ in range(3):
+        # with repeats, which are applied one after the other
+        sample = [rng.choice(transitions) for _ in range(64)]
+        batch = np.zeros(len(sample), dtype=TRANSITION_DTYPE)
+        for row, (state, action, reward, next_state) in enumerate(sample):
+            batch[row] = (state, action, reward, next_state, 0)
+            old = expected.get((state, action), 0.0)
+            expected[state, action] = np.float32(old + 0.1 * (reward - old))
+        learner.apply_batch(batch)
+    for (state, action), value in expected.items():
+        assert learner.q_table.get(state, action) == pytest.approx(value, abs=1e-6)
+
+
+def test_train_removes_its_temporary_snapshots(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    directory = tmp_path / "snapshots"
+    directory.mkdir()
+    monkeypatch.setattr(self_play.tempfile, "mkdtemp", lambda: str(directory))
+    config = SelfPlayConfig(actors=1, amount_of_rounds=1, batch_size=32)
+    _, report = train(config, total_transitions=100)
+    assert report.transitions >= 100
+    assert not os.path.exists(directory)
@@ -0,0 +1,55 @@
+import numpy as np
+
+from src.tournament.runner import TournamentConfig
+from src.tournament.sequential import (
+    RunningStats,
+    SequentialConfig,
+    SequentialTournament,
+    mixture_rho,
+)
+
+
+def test_confidence_sequence_survives_optional_stopping() -> None:
+    # no difference at all: a pair checked after every batch is declared different
+    # in at most about alpha of the runs
+    rng = np.random.default_rng(0)
+    alpha, batches, batch_size = 0.05, 20, 100
+    rho = mixture_rho(alpha, 500)
+    crossed = 0
+    for _ in range(300):
+        stats = RunningStats()
+        for value in rng.normal(0.0, 3.0, batches * batch_size):
+            stats.add(value)
+            if stats.count % batch_size == 0 and abs(stats.mean) > stats.sequence_half_width(
+                alpha, rho
+            ):
+                crossed += 1
+                break
+    assert crossed / 300 <= alpha
+
+
+def test_reallocated_batches_stay_within_max_games() -> None:
+    config = TournamentConfig(
+        strategies=(
+            "DescendingOrderStrategy",
+            "FullRandomStrategy",
+            "RandomCardStrategy",
+            "RiskAwareStrategy",
+        ),
+        amount_of_rounds=1,
+    )
+    sequential = SequentialConfig(
+        precision=0.0, batch_size=10, min_games=1_000, max_games=25, reallocate=True
+    )
+    result = SequentialTournament(config, sequential, workers=1).run()
+    assert result.games == 25
+    assert result.stop_reason == "max_games"
+
+
+def test_default_sequential_config() -> None:
+    config = TournamentConfig(
+        strategies=("DescendingOrderStrategy", "FullRandomStrategy"), amount_of_rounds=1
+    )
+    tournament = SequentialTournament(config, workers=1)
+    assert tournament.sequential == SequentialConfig()
+    assert tournament.alpha == SequentialConfig().alpha
@@ -0,0 +1,40 @@
+import random
+from typing import List
+
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.strategies import FullRandomStrategy
+
+
+def play_turns(game: Game, turns: int) -> List[int]:
+    for _ in range(turns):
+        game.play_turn()
+    return [player.turn_score for player in game.players]
+
+
+def test_restore_rolls_the_game_back_to_the_snapshot() -> None:
+    random.seed(3)
+    players = [Player(player_id=seat, strategy=FullRandomStrategy()) for seat in range(1, 6)]
+    game = Game(players, amount_of_rounds=3, event_sink=NullSink())
+    game.initialize_game()
+    game.start_round()
+    play_turns(game, 4)
+    snapshot = game.snapshot()
+    random_state = random.getstate()
+
+    # play on into the next round, then roll back
+    play_turns(game, 6)
+    game.finish_round()
+    game.reset_for_next_round()
+    game.start_round()
+    play_turns(game, 1)
+    game.restore(snapshot)
+    assert game.snapshot() == snapshot
+
+    # the same random draws from the restored game play the same turns
+    random.setstate(random_state)
+    first = play_turns(game, 6), game.snapshot()
+    game.restore(snapshot)
+    random.setstate(random_state)
+    assert (play_turns(game, 6), game.snapshot()) == first
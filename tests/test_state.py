@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.game.state import GameStateView
+from src.strategies import FullRandomStrategy
+
+
+def new_game(seed: int) -> Game:
+    random.seed(seed)
+    players = [Player(player_id=seat, strategy=FullRandomStrategy()) for seat in range(1, 5)]
+    return Game(players, amount_of_rounds=2, event_sink=NullSink())
+
+
+def check_view(game: Game, view: GameStateView) -> None:
+    piles = tuple(tuple(pile) for pile in game.piles)
+    assert view["piles"] == piles
+    assert view["last_cards_per_pile"] == tuple(pile[-1] for pile in piles)
+    assert view["points_per_pile"] == tuple(
+        sum(card.card_points for card in pile) for pile in piles
+    )
+    assert view["played_cards"] == tuple(card for pile in piles for card in pile)
+    # the cards revealed this round: those on the piles and those taken from them
+    seen = [card for pile in piles for card in pile]
+    seen += [card for player in game.players for card in player.taken_cards]
+    assert view["seen_cards_mask"] == sum(1 << card.card_number for card in seen)
+    assert view["current_turn_number"] == game.turn_number
+    assert view["current_round_number"] == game.round_number
+    assert view["points_per_player_per_turn"] == game.scores_per_player_per_turn
+
+
+def test_views_follow_the_game_after_every_turn() -> None:
+    game = new_game(seed=6)
+    player = game.players[0]
+    view = game.get_personalized_game_state_for_player(player)
+    game.initialize_game()
+    for _ in range(game.amount_of_rounds):
+        game.start_round()
+        for _ in range(game.amount_of_cards_per_player):
+            piles = tuple(tuple(pile) for pile in game.piles)
+            before = game.get_personalized_game_state_for_player(player).freeze()
+            game.play_turn()
+            # one view stays live for the whole game, a frozen copy does not move
+            check_view(game, view)
+            assert before["piles"] == piles
+            assert before["current_turn_number"] == game.turn_number - 1
+            # the hand is read once per view, which is made per decision
+            hand = game.get_personalized_game_state_for_player(player)["player_hand"]
+            assert hand == tuple(
+                (number, card.card_points) for number, card in sorted(player.hand.items())
+            )
+        game.finish_round()
+        game.reset_for_next_round()
+
+
+def test_views_are_read_only() -> None:
+    game = new_game(seed=7)
+    game.initialize_game()
+    game.start_round()
+    game.play_turn()
+    view = game.get_personalized_game_state_for_player(game.players[0])
+    with pytest.raises(TypeError):
+        view["piles"] = ()  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        view["piles"][0].append(view["piles"][0][0])
+    with pytest.raises(KeyError):
+        view["no_such_key"]
+    frozen = view.freeze()
+    frozen_scores = frozen["points_per_player_per_turn"]
+    game.play_turn()
+    assert frozen["current_turn_number"] == 1
+    assert frozen["points_per_player_per_turn"] is frozen_scores
+    assert all(isinstance(scores, tuple) for scores in frozen_scores.values())
@@ -0,0 +1,26 @@
+import random
+
+from src.game.cards import Deck
+from src.training.sweep import SweepConfig, run_sweep
+
+
+def test_seeded_deck_ignores_the_global_random_stream() -> None:
+    first, second = Deck(seed=11), Deck(seed=11)
+    for _ in range(3):
+        first.reset()
+        random.random()
+        second.reset()
+        assert list(first.cards) == list(second.cards)
+
+
+def test_sweep_reports_a_tie_instead_of_a_best() -> None:
+    # a table this size never fills either Q-table, the configurations play alike
+    config = SweepConfig(
+        opponents=("RandomCardStrategy", "DescendingOrderStrategy"),
+        amount_of_rounds=1,
+        eval_games=3,
+    )
+    space = {"max_q_entries": [50_000, 100_000]}
+    result = run_sweep(config, space, min_games=1, max_games=3, workers=1)
+    assert len(result.best) == 2
+    assert len({trial.score for trial in result.best}) == 1
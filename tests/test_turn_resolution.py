@@ -0,0 +1,69 @@
+import random
+from typing import Dict, List, Optional
+
+from src.game.events import NullSink
+from src.game.player import Player
+from src.game.rounds import Game
+from src.game.state import GameState
+from src.strategies import DescendingOrderStrategy, FullRandomStrategy, RandomCardStrategy
+
+
+def linear_pile_for_card(state: GameState, card_number: int) -> Optional[int]:
+    # the scan the game did before the sorted pile tops: the highest top below the card
+    valid_piles = [
+        (pile[-1].card_number, pile_index)
+        for pile_index, pile in enumerate(state.piles)
+        if pile and pile[-1].card_number < card_number
+    ]
+    return max(valid_piles)[1] if valid_piles else None
+
+
+class LinearScanState(GameState):
+    __slots__ = ()
+
+    def pile_for_card(self, card_number: int) -> Optional[int]:
+        return linear_pile_for_card(self, card_number)
+
+
+class LinearScanGame(Game):
+    def __init__(self, players: List[Player]) -> None:
+        super().__init__(players, amount_of_rounds=3, event_sink=NullSink())
+        self.state.__class__ = LinearScanState
+
+
+def make_players() -> List[Player]:
+    return [
+        Player(player_id=1, strategy=DescendingOrderStrategy()),
+        Player(player_id=2, strategy=RandomCardStrategy()),
+        Player(player_id=3, strategy=FullRandomStrategy()),
+        Player(player_id=4, strategy=FullRandomStrategy()),
+    ]
+
+
+def test_bisect_lookup_matches_a_linear_scan_every_turn() -> None:
+    random.seed(11)
+    game = Game(make_players(), amount_of_rounds=2, event_sink=NullSink())
+    game.initialize_game()
+    for _ in range(game.amount_of_rounds):
+        game.start_round()
+        for _ in range(game.amount_of_cards_per_player):
+            game.play_turn()
+            for card_number in range(1, 104):
+                expected = linear_pile_for_card(game.state, card_number)
+                assert game.state.pile_for_card(card_number) == expected
+        game.finish_round()
+        game.reset_for_next_round()
+
+
+def test_scores_match_the_linear_scan() -> None:
+    for seed in range(10):
+        scores: List[Dict[int, List[int]]] = []
+        for game_class in (Game, LinearScanGame):
+            random.seed(seed)
+            if game_class is Game:
+                game = Game(make_players(), amount_of_rounds=3, event_sink=NullSink())
+            else:
+                game = LinearScanGame(make_players())
+            game.play_game()
+            scores.append(game.scores_per_player_per_round)
+        assert scores[0] == scores[1]